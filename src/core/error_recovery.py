@@ -239,6 +239,11 @@ class NetworkRecoveryHandler:
         self.backoff_factor = backoff_factor
         self.initial_delay = initial_delay
         self.max_delay = max_delay
+        
+        # 再試行回数ごとの遅延を事前計算（0〜max_retries回目）
+        self._delays = tuple(
+            self._compute_retry_delay(i) for i in range(max_retries + 1)
+        )
     
     def handle_network_error(self, error: Exception, retry_count: int) -> bool:
         """ネットワークエラーを処理
@@ -269,6 +274,12 @@ class NetworkRecoveryHandler:
         Returns:
             遅延時間（秒）
         """
+        if 0 <= retry_count < len(self._delays):
+            return self._delays[retry_count]
+        return self._compute_retry_delay(retry_count)
+    
+    def _compute_retry_delay(self, retry_count: int) -> float:
+        """再試行遅延を計算（最大遅延で頭打ち）"""
         delay = self.initial_delay * (self.backoff_factor ** retry_count)
         return min(delay, self.max_delay)
 
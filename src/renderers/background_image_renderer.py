@@ -8,14 +8,24 @@ wallpapers/ディレクトリから画像を選択し、fit/scaleモードで102
 
 import os
 import time
+import heapq
 import logging
-from pathlib import Path
+import threading
+import concurrent.futures
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 
 import pygame
 
 from ..assets.asset_manager import AssetManager
 
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    HAS_INOTIFY = True
+except ImportError:
+    HAS_INOTIFY = False
+
 
 class SettingKeys:
     """YAML設定キーの定数"""
@@ -37,6 +47,7 @@ class DefaultSettings:
     SUPPORTED_FORMATS = ['jpg', 'jpeg', 'png', 'bmp', 'gif']
     SCREEN_WIDTH = 1024
     SCREEN_HEIGHT = 600
+    SCALED_CACHE_SIZE = 4  # スケール済みサーフェスの保持数（画面サイズ1枚で約2.4MB）
 
 
 class ValidationRanges:
@@ -48,6 +59,35 @@ class ValidationRanges:
     VALID_SCALE_MODES = ['fit', 'scale']
 
 
+# ディレクトリ未スキャンを表す更新時刻（存在しないディレクトリのNoneと区別する）
+_NOT_SCANNED = -1
+
+
+@lru_cache(maxsize=32)
+def _fit_layout(original_size: Tuple[int, int], target_size: Tuple[int, int]) -> Tuple[int, int, int, int]:
+    """
+    fitモードの配置を計算（元サイズ・ターゲットサイズごとにメモ化）
+    
+    Returns:
+        (x, y, 幅, 高さ)
+    """
+    orig_w, orig_h = original_size
+    target_w, target_h = target_size
+    
+    # アスペクト比計算
+    aspect_ratio = orig_w / orig_h
+    target_aspect = target_w / target_h
+    
+    if aspect_ratio > target_aspect:
+        # 横長: 幅に合わせる
+        scaled_h = int(target_w / aspect_ratio)
+        return (0, (target_h - scaled_h) // 2, target_w, scaled_h)
+    
+    # 縦長: 高さに合わせる
+    scaled_w = int(target_h * aspect_ratio)
+    return ((target_w - scaled_w) // 2, 0, scaled_w, target_h)
+
+
 class BackgroundImageRenderer:
     """背景画像レンダラークラス"""
     
@@ -73,6 +113,28 @@ class BackgroundImageRenderer:
         self.cached_surface = None
         self.last_scan_time = 0
         self.available_images = []
+        # 前回スキャン時のディレクトリ更新時刻（変化がなければ再スキャンを省略）
+        self._scanned_directory_mtime = _NOT_SCANNED
+        # (パス, 更新時刻, 画面サイズ, モード) -> スケール済みサーフェス（LRU）
+        self._scaled_cache: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        # 画像選択時に読み込み確認したサーフェス（直後の読み込みで再デコードしない）
+        self._probed_image: Optional[Tuple[str, pygame.Surface]] = None
+        # 読み込みに失敗した画像のパス -> 失敗時の更新時刻（置き換えられるまで再デコードしない）
+        self._bad_paths: Dict[str, int] = {}
+        # 直近スキャンのパス -> DirEntry（同じスキャン中の更新時刻確認でstat結果を共有する）
+        self._scanned_entries: Dict[str, os.DirEntry] = {}
+        
+        # 非同期スキャン・読み込み用（描画ループをディスクI/Oとデコードで止めない）
+        self._load_future: Optional[concurrent.futures.Future] = None
+        # 初回投入時に作成（cleanup()後の再利用時も作り直す）
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        
+        # ディレクトリ変更監視（inotify利用時はポーリングの代わりに変更通知で再スキャン）
+        self._inotify = None
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watching = False
+        self._directory_dirty = True
+        self._start_directory_watch()
         
         # 初期化完了
         self.logger.info("BackgroundImageRenderer initialized")
@@ -100,6 +162,8 @@ class BackgroundImageRenderer:
         self.supported_formats = background_config.get(
             'supported_formats', DefaultSettings.SUPPORTED_FORMATS
         )
+        # ファイルごとの判定で正規化し直さないよう、'.jpg'形式の小文字拡張子集合にしておく
+        self._supported_extensions = frozenset('.' + fmt.lower() for fmt in self.supported_formats)
         
         # 画面サイズ
         self.screen_width = self._validate_screen_size(
@@ -108,6 +172,7 @@ class BackgroundImageRenderer:
         self.screen_height = self._validate_screen_size(
             ui_config.get('screen_height', DefaultSettings.SCREEN_HEIGHT)
         )
+        self._screen_size = (self.screen_width, self.screen_height)
         
         self.logger.debug(f"Settings loaded - Dir: {self.wallpaper_directory}, "
                          f"Mode: {self.scale_mode}, Interval: {self.rescan_interval}")
@@ -168,21 +233,33 @@ class BackgroundImageRenderer:
         Returns:
             対応形式の画像ファイルパスリスト（アルファベット順）
         """
+        image_files = self._list_image_files()
+        image_files.sort()
+        return image_files
+    
+    def _list_image_files(self) -> List[str]:
+        """
+        壁紙ディレクトリをスキャンして対応形式の画像ファイルを取得（順序は不定）
+        
+        Returns:
+            対応形式の画像ファイルパスリスト
+        """
         if not os.path.exists(self.wallpaper_directory):
             self.logger.warning(f"Wallpaper directory not found: {self.wallpaper_directory}")
             return []
         
         try:
-            image_files = []
-            
-            for file in os.listdir(self.wallpaper_directory):
-                if self._is_supported_format(file):
-                    full_path = os.path.join(self.wallpaper_directory, file)
-                    if os.path.isfile(full_path):
-                        image_files.append(full_path)
-            
-            # アルファベット順でソート
-            image_files.sort()
+            # scandirのエントリは種別情報を持つため、ファイル判定で追加のstatを発行しない
+            # （形式判定は_is_supported_formatと同じ処理をループ内に展開）
+            extensions = self._supported_extensions
+            splitext = os.path.splitext
+            with os.scandir(self.wallpaper_directory) as entries:
+                scanned_entries = {
+                    entry.path: entry for entry in entries
+                    if splitext(entry.name)[1].lower() in extensions and entry.is_file()
+                }
+            self._scanned_entries = scanned_entries
+            image_files = list(scanned_entries)
             
             # スキャン時刻更新
             self.last_scan_time = time.time()
@@ -204,8 +281,7 @@ class BackgroundImageRenderer:
         Returns:
             対応形式の場合True
         """
-        file_ext = Path(filename).suffix.lower().lstrip('.')
-        return file_ext in [fmt.lower() for fmt in self.supported_formats]
+        return os.path.splitext(filename)[1].lower() in self._supported_extensions
     
     def _select_best_image(self) -> Optional[str]:
         """
@@ -214,22 +290,77 @@ class BackgroundImageRenderer:
         Returns:
             選択された画像ファイルパス（なしの場合None）
         """
-        available_images = self._scan_wallpaper_directory()
-        
-        for image_path in available_images:
+        # 通常は先頭の画像が読み込めるため全件ソートはせず、
+        # ヒープからアルファベット順に必要な分だけ取り出す
+        candidates = self._list_image_files()
+        heapq.heapify(candidates)
+        
+        while candidates:
+            image_path = heapq.heappop(candidates)
+            if self._is_known_bad(image_path):
+                continue
             try:
                 # 実際に画像として読み込み可能かテスト
                 test_surface = pygame.image.load(image_path)
                 if test_surface:
                     self.logger.info(f"Selected image: {os.path.basename(image_path)}")
+                    self._probed_image = (image_path, test_surface)
                     return image_path
             except Exception as e:
                 self.logger.warning(f"Failed to load image {image_path}: {e}")
+                self._mark_bad(image_path)
                 continue
         
         self.logger.warning("No valid images found")
         return None
     
+    def _image_mtime_ns(self, image_path: str) -> int:
+        """
+        画像ファイルの更新時刻を取得
+        
+        直近スキャンで見つかったファイルはDirEntryのstat結果を使い、
+        同じスキャン中に同じファイルを何度もstatしない。
+        
+        Args:
+            image_path: 画像ファイルパス
+            
+        Returns:
+            更新時刻（ナノ秒）
+        """
+        entry = self._scanned_entries.get(image_path)
+        if entry is not None:
+            return entry.stat().st_mtime_ns
+        return os.stat(image_path).st_mtime_ns
+    
+    def _is_known_bad(self, image_path: str) -> bool:
+        """
+        以前読み込みに失敗し、その後更新されていない画像か判定
+        
+        Args:
+            image_path: 画像ファイルパス
+            
+        Returns:
+            読み込みを省略すべき場合True
+        """
+        bad_mtime = self._bad_paths.get(image_path)
+        if bad_mtime is None:
+            return False
+        try:
+            if self._image_mtime_ns(image_path) == bad_mtime:
+                return True
+        except OSError:
+            return True
+        # ファイルが置き換えられたので再度読み込みを試す
+        del self._bad_paths[image_path]
+        return False
+    
+    def _mark_bad(self, image_path: str) -> None:
+        """読み込みに失敗した画像を記録"""
+        try:
+            self._bad_paths[image_path] = self._image_mtime_ns(image_path)
+        except OSError:
+            pass
+    
     def _load_and_scale_image(self, image_path: str) -> Optional[pygame.Surface]:
         """
         画像を読み込んでスケーリング
@@ -243,13 +374,26 @@ class BackgroundImageRenderer:
         try:
             self.logger.debug(f"Loading image: {os.path.basename(image_path)}")
             
-            # 画像読み込み前検証
-            if not os.path.exists(image_path):
+            # 画像読み込み前検証（更新時刻はキャッシュキーにも使う）
+            try:
+                image_mtime = self._image_mtime_ns(image_path)
+            except FileNotFoundError:
                 self.logger.error(f"Image file not found: {image_path}")
                 return None
             
-            # 画像読み込み
-            original_surface = pygame.image.load(image_path)
+            # 同じ画像・画面サイズ・モードのスケール済みサーフェスがあれば再利用
+            cache_key = (image_path, image_mtime, self._screen_size, self.scale_mode)
+            cached_surface = self._scaled_cache.get(cache_key)
+            if cached_surface is not None:
+                self._scaled_cache.move_to_end(cache_key)
+                return cached_surface
+            
+            # 画像読み込み（選択時に読み込み確認済みならそのサーフェスを使う）
+            probed, self._probed_image = self._probed_image, None
+            if probed is not None and probed[0] == image_path:
+                original_surface = probed[1]
+            else:
+                original_surface = pygame.image.load(image_path)
             original_size = original_surface.get_size()
             
             if original_size[0] <= 0 or original_size[1] <= 0:
@@ -257,10 +401,17 @@ class BackgroundImageRenderer:
                 return None
             
             # スケーリング処理
-            return self._prepare_scaled_surface(original_surface, original_size)
+            final_surface = self._prepare_scaled_surface(original_surface, original_size)
+            
+            self._scaled_cache[cache_key] = final_surface
+            if len(self._scaled_cache) > DefaultSettings.SCALED_CACHE_SIZE:
+                self._scaled_cache.popitem(last=False)
+            
+            return final_surface
             
         except pygame.error as e:
             self.logger.error(f"Pygame error loading image {image_path}: {e}")
+            self._mark_bad(image_path)
             return None
         except Exception as e:
             self.logger.error(f"Unexpected error loading image {image_path}: {e}")
@@ -278,7 +429,7 @@ class BackgroundImageRenderer:
         Returns:
             スケール済み最終サーフェス
         """
-        target_size = (self.screen_width, self.screen_height)
+        target_size = self._screen_size
         
         # スケールモードに応じて座標・サイズ計算
         if self.scale_mode == 'fit':
@@ -287,12 +438,26 @@ class BackgroundImageRenderer:
             dimensions = self._calculate_scale_dimensions(original_size, target_size)
         
         # スケーリング実行
+        # 結果はキャッシュされ読み込み時にしか走らないが、Raspberry Piでの再読み込み遅延を抑えるため
+        # fit/scaleとも補間なしのtransform.scaleを使う（smoothscaleより速く、壁紙の見た目では差が小さい）
         scaled_surface = pygame.transform.scale(original_surface, 
                                                (dimensions['width'], dimensions['height']))
         
-        # 最終描画用サーフェス作成（フォールバック色で塗りつぶし）
+        # 最終描画用サーフェス作成
+        # 毎フレームのblitが変換なしで済むよう表示サーフェスのピクセル形式に揃える
         final_surface = pygame.Surface(target_size)
-        final_surface.fill(self.fallback_color)
+        if pygame.display.get_surface() is not None:
+            final_surface = final_surface.convert()
+        
+        # 透過部分がある画像は全面をフォールバック色で塗りつぶし、
+        # 不透明な画像は画像で覆われない黒帯部分だけを塗る
+        is_opaque = (not original_surface.get_flags() & pygame.SRCALPHA
+                     and original_surface.get_colorkey() is None)
+        if is_opaque:
+            for bar_rect in self._letterbox_rects(dimensions, target_size):
+                final_surface.fill(self.fallback_color, bar_rect)
+        else:
+            final_surface.fill(self.fallback_color)
         
         # 中央配置で合成
         final_surface.blit(scaled_surface, (dimensions['x'], dimensions['y']))
@@ -302,6 +467,31 @@ class BackgroundImageRenderer:
         
         return final_surface
     
+    def _letterbox_rects(self, dimensions: Dict[str, int],
+                         target_size: Tuple[int, int]) -> List[pygame.Rect]:
+        """
+        画像で覆われない領域（黒帯）の矩形を取得
+        
+        Args:
+            dimensions: 画像の表示座標とサイズ
+            target_size: ターゲットサイズ (width, height)
+            
+        Returns:
+            黒帯の矩形リスト（画面全体を覆う場合は空）
+        """
+        target_w, target_h = target_size
+        x, y = dimensions['x'], dimensions['y']
+        right = x + dimensions['width']
+        bottom = y + dimensions['height']
+        
+        bars = [
+            pygame.Rect(0, 0, target_w, y),                      # 上
+            pygame.Rect(0, bottom, target_w, target_h - bottom),  # 下
+            pygame.Rect(0, y, x, bottom - y),                     # 左
+            pygame.Rect(right, y, target_w - right, bottom - y),  # 右
+        ]
+        return [bar for bar in bars if bar.width > 0 and bar.height > 0]
+    
     def _calculate_fit_dimensions(self, original_size: Tuple[int, int], 
                                  target_size: Tuple[int, int]) -> Dict[str, int]:
         """
@@ -314,25 +504,7 @@ class BackgroundImageRenderer:
         Returns:
             表示座標とサイズの辞書
         """
-        orig_w, orig_h = original_size
-        target_w, target_h = target_size
-        
-        # アスペクト比計算
-        aspect_ratio = orig_w / orig_h
-        target_aspect = target_w / target_h
-        
-        if aspect_ratio > target_aspect:
-            # 横長: 幅に合わせる
-            scaled_w = target_w
-            scaled_h = int(target_w / aspect_ratio)
-            x = 0
-            y = (target_h - scaled_h) // 2
-        else:
-            # 縦長: 高さに合わせる
-            scaled_h = target_h
-            scaled_w = int(target_h * aspect_ratio)
-            x = (target_w - scaled_w) // 2
-            y = 0
+        x, y, scaled_w, scaled_h = _fit_layout(tuple(original_size), tuple(target_size))
         
         return {
             'x': x,
@@ -374,26 +546,171 @@ class BackgroundImageRenderer:
         current_time = time.time()
         return (current_time - self.last_scan_time) >= self.rescan_interval
     
+    def _get_directory_mtime(self) -> Optional[int]:
+        """
+        壁紙ディレクトリの更新時刻を取得
+        
+        Returns:
+            更新時刻（ナノ秒、ディレクトリが存在しない場合None）
+        """
+        # 改名で入れ替えられたディレクトリにも追従するため、毎回パスからstatする
+        try:
+            return os.stat(self.wallpaper_directory).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _start_directory_watch(self) -> None:
+        """inotifyで壁紙ディレクトリの変更監視を開始（利用できない場合はポーリングのまま）"""
+        if not HAS_INOTIFY or not os.path.isdir(self.wallpaper_directory):
+            return
+        
+        try:
+            inotify = INotify()
+            inotify.add_watch(self.wallpaper_directory,
+                              inotify_flags.CREATE | inotify_flags.DELETE | inotify_flags.CLOSE_WRITE
+                              | inotify_flags.MOVED_TO | inotify_flags.MOVED_FROM
+                              | inotify_flags.DELETE_SELF | inotify_flags.MOVE_SELF)
+        except OSError as e:
+            self.logger.warning(f"Directory watch unavailable, falling back to polling: {e}")
+            return
+        
+        self._inotify = inotify
+        self._directory_dirty = True
+        self._watching = True
+        self._watch_thread = threading.Thread(target=self._watch_loop, args=(inotify,), daemon=True)
+        self._watch_thread.start()
+        self.logger.debug(f"Watching wallpaper directory: {self.wallpaper_directory}")
+    
+    def _watch_loop(self, inotify) -> None:
+        """変更通知を受け取り再スキャン要求を立てる（監視スレッドで実行）"""
+        while self._watching:
+            try:
+                events = inotify.read(timeout=1000)
+            except OSError:
+                break
+            if not events:
+                continue
+            
+            self._directory_dirty = True
+            
+            # ディレクトリ自体が削除・移動された場合は監視をやめてポーリングに戻す
+            self_gone = inotify_flags.DELETE_SELF | inotify_flags.MOVE_SELF | inotify_flags.IGNORED
+            if any(event.mask & self_gone for event in events):
+                break
+        self._watching = False
+    
+    def _stop_directory_watch(self) -> None:
+        """ディレクトリ変更監視を停止"""
+        self._watching = False
+        if self._watch_thread:
+            self._watch_thread.join(timeout=2)
+            self._watch_thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+    
     def update(self):
         """定期更新処理"""
+        # バックグラウンドのスキャン・読み込み中は結果が出るまで待たずに戻る
+        if not self._finish_pending_load(wait=False):
+            return
+        
+        # 変更監視中は通知があった時だけ再スキャン（定期的なstat・スキャンは行わない）
+        if self._watching:
+            if self._directory_dirty:
+                self._directory_dirty = False
+                self.logger.debug("Executing rescan on directory change")
+                self._submit_scan_and_load()
+            return
+        
         if self._should_rescan() or self.current_image_path is None:
-            self.logger.debug("Executing periodic rescan")
+            # ファイルの追加・削除・改名がなければディレクトリの更新時刻は変わらないため、
+            # 前回スキャン結果をそのまま使い続ける
+            directory_mtime = self._get_directory_mtime()
+            if directory_mtime == self._scanned_directory_mtime:
+                self.last_scan_time = time.time()
+                return
             
-            # 再スキャン実行
-            new_image_path = self._select_best_image()
+            self.logger.debug("Executing periodic rescan")
             
-            # 画像が変更された場合のみ再読み込み
-            if new_image_path != self.current_image_path:
-                self.current_image_path = new_image_path
-                self.cached_surface = None  # キャッシュクリア
-                
-                if self.current_image_path:
-                    self.cached_surface = self._load_and_scale_image(self.current_image_path)
+            # 再スキャン実行（結果は次回以降のupdate()で反映）
+            self._scanned_directory_mtime = directory_mtime
+            self._submit_scan_and_load()
             
             # updateでの明示的な時刻更新（_select_best_image内でも更新される）
             if self.last_scan_time == 0:
                 self.last_scan_time = time.time()
     
+    def _submit_scan_and_load(self) -> None:
+        """画像の選択・読み込みをワーカースレッドに投入"""
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._load_future = self._executor.submit(self._scan_and_load, self.current_image_path)
+    
+    def _scan_and_load(self, current_image_path: Optional[str]) -> Tuple[Optional[str], Optional[pygame.Surface], bool]:
+        """
+        画像を選択し、変更があれば読み込む（ワーカースレッドで実行）
+        
+        Args:
+            current_image_path: 現在表示中の画像パス
+            
+        Returns:
+            (選択された画像パス, スケール済みSurface, 画像変更有無)
+        """
+        new_image_path = self._select_best_image()
+        
+        # 画像が変更された場合のみ再読み込み
+        if new_image_path == current_image_path:
+            self._probed_image = None
+            return (new_image_path, None, False)
+        
+        new_surface = self._load_and_scale_image(new_image_path) if new_image_path else None
+        return (new_image_path, new_surface, True)
+    
+    def _finish_pending_load(self, wait: bool) -> bool:
+        """
+        バックグラウンドのスキャン・読み込み結果を反映
+        
+        Args:
+            wait: 完了まで待つ場合True
+            
+        Returns:
+            実行中の処理がなくなった場合True
+        """
+        future = self._load_future
+        if future is None:
+            return True
+        if not wait and not future.done():
+            return False
+        
+        self._load_future = None
+        try:
+            new_image_path, new_surface, changed = future.result()
+        except Exception as e:
+            self.logger.error(f"Background image update failed: {e}")
+            return True
+        
+        if changed:
+            self.current_image_path = new_image_path
+            self._set_cached_surface(new_surface)
+        return True
+    
+    def _set_cached_surface(self, surface: Optional[pygame.Surface]) -> None:
+        """
+        描画用サーフェスを設定し、render()を状態に合わせて差し替える
+        
+        画像がある間は毎フレーム同じblitになるため、分岐なしで転送するだけの関数を
+        インスタンスのrenderとして束縛する。画像がなければクラスのrender()に戻す。
+        
+        Args:
+            surface: スケール済み最終サーフェス（なしの場合None）
+        """
+        self.cached_surface = surface
+        if surface is None:
+            self.__dict__.pop('render', None)
+        else:
+            self.render = lambda target, _source=surface: target.blit(_source, (0, 0))
+    
     def render(self, surface: pygame.Surface):
         """
         背景描画
@@ -435,22 +752,48 @@ class BackgroundImageRenderer:
             mode: 'fit' または 'scale'
         """
         if mode in ['fit', 'scale']:
+            # 読み込み中の画像を反映してから（ワーカーと並行してキャッシュを触らない）
+            self._finish_pending_load(wait=True)
+            
             old_mode = self.scale_mode
             self.scale_mode = mode
             
             if old_mode != mode and self.current_image_path:
                 # モード変更時は再描画が必要
-                self.cached_surface = self._load_and_scale_image(self.current_image_path)
+                self._set_cached_surface(self._load_and_scale_image(self.current_image_path))
                 self.logger.info(f"Scale mode changed: {old_mode} -> {mode}")
     
     def force_rescan(self):
         """強制再スキャン実行"""
+        self._finish_pending_load(wait=True)
         self.last_scan_time = 0  # 強制的に期限切れにする
+        self._scanned_directory_mtime = _NOT_SCANNED
+        self._bad_paths.clear()  # 破損画像を置き換えた場合も読み込み直す
+        self._stop_directory_watch()
+        self._start_directory_watch()
         self.update()
     
     def cleanup(self):
         """リソースクリーンアップ"""
-        self.cached_surface = None
+        # 未開始の非同期タスクはキャンセルし、実行中のものは完了を待つ
+        # （実行中のスキャンがクリア後の状態へ結果を書き戻さないようにする）
+        future = self._load_future
+        self._load_future = None
+        if future is not None and not future.cancel():
+            concurrent.futures.wait([future])
+        
+        # エグゼキューターをシャットダウン（再度update()された場合は作り直す）
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._stop_directory_watch()
+        
+        self._set_cached_surface(None)
         self.current_image_path = None
         self.available_images = []
+        self._scanned_directory_mtime = _NOT_SCANNED
+        self._scaled_cache.clear()
+        self._probed_image = None
+        self._bad_paths.clear()
+        self._scanned_entries = {}
         self.logger.info("BackgroundImageRenderer cleanup completed")
\ No newline at end of file
@@ -9,8 +9,8 @@ TASK-203: 今月カレンダー表示
 """
 
 import logging
-import calendar
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple, Optional
 import pygame
 from ..assets.asset_manager import AssetManager
@@ -77,6 +77,102 @@ WEEKDAY_HEADERS = {
     'MONDAY': ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
 }
 
+# 週開始曜日 -> _first_weekday_of_monthと同じ曜日番号（0=月曜, 6=日曜）
+FIRST_WEEKDAY_INDEX = {
+    'SUNDAY': 6,
+    'MONDAY': 0
+}
+
+# 月ごとの日数（平年）と、Sakamotoの曜日計算で使う月オフセット
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_MONTH_WEEKDAY_OFFSETS = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """月の日数を取得（うるう年の2月は29日）"""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+def _first_weekday_of_month(year: int, month: int) -> int:
+    """月初日の曜日をSakamotoの方法で算出（0=月曜, 6=日曜）"""
+    if month < 3:
+        year -= 1
+    # Sakamotoの方法は0=日曜を返すため月曜基準にずらす
+    sunday_based = (year + year // 4 - year // 100 + year // 400
+                    + _MONTH_WEEKDAY_OFFSETS[month - 1] + 1) % 7
+    return (sunday_based + 6) % 7
+
+
+@lru_cache(maxsize=64)
+def _month_calendar(year: int, month: int, first_weekday: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    月のカレンダー構造を生成（年・月・週開始曜日ごとにメモ化）
+    
+    月初の曜日と週開始曜日の差から先頭の空セル数を求め、日数と合わせて
+    7日ずつの週に区切る
+    
+    Returns:
+        週ごとの日付タプル（空セルは0）
+    """
+    leading = (_first_weekday_of_month(year, month) - first_weekday) % 7
+    days = _days_in_month(year, month)
+    week_count = (leading + days + 6) // 7
+    return tuple(
+        tuple(
+            day if 1 <= day <= days else 0
+            for day in range(week * 7 - leading + 1, week * 7 - leading + 8)
+        )
+        for week in range(week_count)
+    )
+
+
+def _nonzero_cells(calendar_data) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    日付のあるセルだけを(行, 列, 日)で列挙（行はヘッダを含むグリッド上の行番号）
+    
+    空セル(0)とグリッドに収まらない行・列は含めない
+    """
+    return tuple(
+        (week_idx + 1, day_idx, day)
+        for week_idx, week in enumerate(calendar_data[:6])
+        for day_idx, day in enumerate(week[:7])
+        if day
+    )
+
+
+@lru_cache(maxsize=64)
+def _month_cells(year: int, month: int, first_weekday: int) -> Tuple[Tuple[int, int, int], ...]:
+    """月の日付セル一覧を生成（年・月・週開始曜日ごとにメモ化）"""
+    return _nonzero_cells(_month_calendar(year, month, first_weekday))
+
+
+def _convert_for_display(surface: pygame.Surface) -> pygame.Surface:
+    """
+    表示サーフェスのピクセルフォーマットへ変換（アルファは保持）
+    
+    ディスプレイ未初期化時は変換できないためそのまま返す
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+
+def _blit_batch(surface: pygame.Surface, blit_sequence: List[Tuple[pygame.Surface, Any]]) -> None:
+    """
+    複数のblitを1回の呼び出しにまとめて実行
+    
+    pygame-ceのfblitsがあればそれを、なければSurface.blitsを戻り値なしで使う
+    """
+    if not blit_sequence:
+        return
+    fblits = getattr(surface, 'fblits', None)
+    if fblits is not None:
+        fblits(blit_sequence)
+    else:
+        surface.blits(blit_sequence, doreturn=0)
+
 
 class CalendarRenderer:
     """カレンダーレンダラークラス"""
@@ -120,6 +216,15 @@ class CalendarRenderer:
         self.color_today_text = self._get_setting(SettingKeys.COLOR_TODAY_TEXT, ColorPalette.TODAY_TEXT)
         self.color_header = self._get_setting(SettingKeys.COLOR_HEADER, ColorPalette.HEADER)
         
+        # 描画時に毎回変換しないよう、pygameへ渡す色はタプルで保持
+        self._header_rgb = tuple(self.color_header)
+        self._today_bg_rgb = tuple(self.color_today_bg)
+        # 文字色は論理色ごとに1つのタプルを共有し、グリフキャッシュのキーにそのまま使う
+        self._today_text_rgb = tuple(self.color_today_text)
+        self._sunday_rgb = tuple(self.color_sunday)
+        self._saturday_rgb = tuple(self.color_saturday)
+        self._weekday_rgb = tuple(self.color_weekday)
+        
         # フォント設定
         self.font_path = self._get_setting(SettingKeys.FONT_MAIN, None)
         
@@ -127,6 +232,8 @@ class CalendarRenderer:
         self.current_year = datetime.now().year
         self.current_month = datetime.now().month
         self.calendar_data = []
+        self._date_cells: Tuple[Tuple[int, int, int], ...] = ()  # 列挙元データの日付セル(行, 列, 日)
+        self._date_cells_source: Optional[List[List[int]]] = None  # _date_cellsの列挙元データ
         
         # フォントを読み込み
         self.font = None
@@ -134,8 +241,19 @@ class CalendarRenderer:
         self._load_fonts()
         
         # キャッシュ用変数
-        self.cell_positions = []
+        # セル位置は描画領域（位置・サイズ・マージン）にのみ依存するため一度だけ計算
+        self._update_cell_positions()
         self.cached_month = None
+        self._header_cache: Dict[str, pygame.Surface] = {}  # 曜日名 -> 描画済みサーフェス
+        # (日, 文字色) -> 描画済みサーフェス（最大31日×色数なので上限管理は不要）
+        # 初期化時には事前生成せず、描画時に表示中の日付だけを必要に応じて追加する
+        self._day_surface_cache: Dict[Tuple[int, Tuple[int, ...]], pygame.Surface] = {}
+        
+        # 描画済みパネル（月・今日・週開始曜日が変わった時のみ再描画）
+        self._panel: Optional[pygame.Surface] = None
+        self._dirty = True
+        self._highlighted_day = 0  # パネルに描画済みの「今日」の日番号
+        self._today_key: Optional[Tuple[int, int, int]] = None  # update()ごとに1回だけ取得する今日の(年, 月, 日)
         
         # 初期化完了処理
         self._finalize_initialization()
@@ -145,6 +263,12 @@ class CalendarRenderer:
         # 週開始曜日を設定
         self._set_calendar_first_weekday()
         
+        # 列ごとの文字色を週開始曜日に合わせて並べておく
+        self._build_weekday_colors()
+        
+        # 曜日ヘッダは固定の7文字列なので事前にレンダリングしておく
+        self._build_header_cache()
+        
         # 初期状態のログ出力
         logger.info(f"CalendarRenderer initialized: {self.width}x{self.height} at ({self.position_x}, {self.position_y})")
         logger.debug(f"Settings: weekday={self.first_weekday}, highlight={self.today_highlight}")
@@ -224,15 +348,13 @@ class CalendarRenderer:
             raise RuntimeError("Cannot initialize calendar fonts")
     
     def _set_calendar_first_weekday(self) -> None:
-        """calendar モジュールの週開始曜日を設定"""
-        if self.first_weekday == 'SUNDAY':
-            calendar.setfirstweekday(6)  # 日曜日 = 6
-        elif self.first_weekday == 'MONDAY':
-            calendar.setfirstweekday(0)  # 月曜日 = 0
-        else:
+        """週開始曜日を検証（カレンダー生成は_month_calendarで週開始曜日を引数に行う）"""
+        if self.first_weekday not in FIRST_WEEKDAY_INDEX:
             # デフォルトは日曜始まり
-            calendar.setfirstweekday(6)
             self.first_weekday = 'SUNDAY'
+        
+        # 曜日ヘッダは週開始曜日ごとの定数をそのまま参照する
+        self._weekday_headers = WEEKDAY_HEADERS[self.first_weekday]
     
     def get_current_month(self) -> Tuple[int, int]:
         """
@@ -255,7 +377,16 @@ class CalendarRenderer:
         Returns:
             週ごとの日付配列
         """
-        return calendar.monthcalendar(year, month)
+        first_weekday = FIRST_WEEKDAY_INDEX.get(self.first_weekday, FIRST_WEEKDAY_INDEX['SUNDAY'])
+        # キャッシュ本体を書き換えられないよう呼び出し側にはリストで渡す
+        return [list(week) for week in _month_calendar(year, month, first_weekday)]
+    
+    def _load_calendar_data(self, year: int, month: int) -> None:
+        """表示するカレンダーデータと、その日付セル一覧を更新"""
+        self.calendar_data = self._generate_calendar_data(year, month)
+        self._date_cells_source = self.calendar_data
+        first_weekday = FIRST_WEEKDAY_INDEX.get(self.first_weekday, FIRST_WEEKDAY_INDEX['SUNDAY'])
+        self._date_cells = _month_cells(year, month, first_weekday)
     
     def _is_today(self, year: int, month: int, day: int) -> bool:
         """
@@ -272,36 +403,66 @@ class CalendarRenderer:
         if day == 0:  # 空セル
             return False
         
-        # テストでモックされることを考慮してdate.today()を直接使用
-        today = date.today()
-        return (year, month, day) == (today.year, today.month, today.day)
+        return (year, month, day) == self._get_today_key()
     
     def _get_today_date(self) -> int:
         """今日の日付を取得"""
         return date.today().day
     
-    def _calculate_cell_positions(self) -> List[List[Tuple[int, int]]]:
+    def _get_today_day_in_month(self) -> int:
         """
-        各セルの描画位置を計算
+        表示中の月における今日の日番号を取得
         
         Returns:
-            各セルの(x, y)座標の配列
+            今日の日（表示月が今月でない場合は0）
+        """
+        year, month, day = self._get_today_key()
+        if year == self.current_year and month == self.current_month:
+            return day
+        return 0
+    
+    def _get_today_key(self) -> Tuple[int, int, int]:
+        """
+        今日の(年, 月, 日)を取得
+        
+        update()で取得したスナップショットを返し、未取得の場合のみdate.today()を呼ぶ
+        """
+        if self._today_key is None:
+            self._snapshot_today()
+        return self._today_key
+    
+    def _snapshot_today(self) -> None:
+        """今日の日付を(年, 月, 日)の整数タプルとして保持"""
+        # テストでモックされることを考慮してdate.today()を直接使用
+        today = date.today()
+        self._today_key = (today.year, today.month, today.day)
+    
+    def _calculate_cell_positions(self) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
         """
-        positions = []
+        各セルの描画位置を計算
         
+        Returns:
+            各セルの(x, y)座標の配列（行ごとの不変タプル）
+        """
         # セルサイズ計算（7列×7行分のグリッド）
         cell_width = (self.width - self.cell_margin * 6) // 7
         cell_height = (self.height - self.cell_margin * 6) // 7
         
-        for row in range(7):  # ヘッダ + 6週
-            row_positions = []
-            for col in range(7):  # 7曜日
-                x = self.position_x + col * (cell_width + self.cell_margin)
-                y = self.position_y + row * (cell_height + self.cell_margin)
-                row_positions.append((x, y))
-            positions.append(row_positions)
-        
-        return positions
+        return tuple(
+            tuple(
+                (self.position_x + col * (cell_width + self.cell_margin),
+                 self.position_y + row * (cell_height + self.cell_margin))
+                for col in range(7)  # 7曜日
+            )
+            for row in range(7)  # ヘッダ + 6週
+        )
+    
+    def _update_cell_positions(self) -> None:
+        """セル位置を再計算し、描画ループ用の列x座標・行y座標も更新"""
+        self.cell_positions = self._calculate_cell_positions()
+        # グリッドはx座標が列のみ、y座標が行のみで決まるため7個ずつ保持すれば足りる
+        self._col_xs = tuple(x for x, _ in self.cell_positions[0])
+        self._row_ys = tuple(row[0][1] for row in self.cell_positions)
     
     def _get_weekday_headers(self) -> List[str]:
         """
@@ -310,10 +471,7 @@ class CalendarRenderer:
         Returns:
             曜日名のリスト
         """
-        if self.first_weekday in WEEKDAY_HEADERS:
-            return WEEKDAY_HEADERS[self.first_weekday]
-        else:
-            return WEEKDAY_HEADERS['SUNDAY']
+        return self._weekday_headers
     
     def _get_cell_color(self, weekday: int, is_today: bool) -> List[int]:
         """
@@ -329,23 +487,19 @@ class CalendarRenderer:
         if is_today and self.today_highlight:
             return self.color_today_bg
         
-        # 週開始曜日に応じてインデックスを調整
+        # 週開始曜日に応じて並べ替え済みの列色テーブルを引く
+        return self._weekday_colors[weekday]
+    
+    def _build_weekday_colors(self) -> None:
+        """列インデックス -> 文字色のテーブルを構築"""
         if self.first_weekday == 'MONDAY':
-            # 月曜始まりの場合：0=月曜, 6=日曜
-            if weekday == 5:  # 土曜日
-                return self.color_saturday
-            elif weekday == 6:  # 日曜日
-                return self.color_sunday
-            else:  # 平日
-                return self.color_weekday
+            # 月曜始まりの場合：0=月曜, 5=土曜, 6=日曜
+            self._weekday_colors = (self.color_weekday,) * 5 + (self.color_saturday, self.color_sunday)
+            self._weekday_rgbs = (self._weekday_rgb,) * 5 + (self._saturday_rgb, self._sunday_rgb)
         else:
             # 日曜始まりの場合：0=日曜, 6=土曜
-            if weekday == 0:  # 日曜日
-                return self.color_sunday
-            elif weekday == 6:  # 土曜日
-                return self.color_saturday
-            else:  # 平日
-                return self.color_weekday
+            self._weekday_colors = (self.color_sunday,) + (self.color_weekday,) * 5 + (self.color_saturday,)
+            self._weekday_rgbs = (self._sunday_rgb,) + (self._weekday_rgb,) * 5 + (self._saturday_rgb,)
     
     def _get_today_bg_color(self) -> List[int]:
         """今日背景色を取得"""
@@ -355,12 +509,31 @@ class CalendarRenderer:
         """今日文字色を取得"""
         return self.color_today_text
     
-    def _render_header(self, surface: pygame.Surface) -> None:
+    def _build_header_cache(self) -> None:
+        """曜日ヘッダのサーフェスキャッシュを構築"""
+        self._header_cache.clear()
+        if not self.header_font:
+            return
+        
+        for weekday_name in self._get_weekday_headers():
+            self._header_cache[weekday_name] = _convert_for_display(
+                self.header_font.render(weekday_name, True, self._header_rgb))
+    
+    def _get_header_surface(self, weekday_name: str) -> pygame.Surface:
+        """曜日ヘッダのサーフェスを取得（未キャッシュ時はレンダリングして保持）"""
+        text_surface = self._header_cache.get(weekday_name)
+        if text_surface is None:
+            text_surface = _convert_for_display(self.header_font.render(weekday_name, True, self._header_rgb))
+            self._header_cache[weekday_name] = text_surface
+        return text_surface
+    
+    def _render_header(self, surface: pygame.Surface, origin: Tuple[int, int] = (0, 0)) -> None:
         """
         曜日ヘッダを描画
         
         Args:
             surface: 描画対象サーフェス
+            origin: 描画対象サーフェスの画面上の原点（パネル描画時に使用）
         """
         if not self.header_font:
             return
@@ -368,34 +541,38 @@ class CalendarRenderer:
         weekday_headers = self._get_weekday_headers()
         
         if not self.cell_positions:
-            self.cell_positions = self._calculate_cell_positions()
+            self._update_cell_positions()
         
-        # ヘッダ行（最初の行）に曜日名を描画
+        # ヘッダ行（最初の行）に曜日名を描画（blitはまとめて実行）
+        origin_x, origin_y = origin
+        col_xs = self._col_xs
+        y = self._row_ys[0] - origin_y
+        blit_sequence = []
         for col, weekday_name in enumerate(weekday_headers):
-            if col < len(self.cell_positions[0]):
-                x, y = self.cell_positions[0][col]
+            if col < 7:
+                x = col_xs[col] - origin_x
                 
-                # テキストをレンダリング
-                text_surface = self.header_font.render(
-                    weekday_name, 
-                    True, 
-                    tuple(self.color_header)
-                )
+                # キャッシュ済みのテキストサーフェスを取得
+                text_surface = self._get_header_surface(weekday_name)
                 
                 # 中央揃えで配置
                 text_rect = text_surface.get_rect()
                 text_rect.centerx = x + (self.width // 7) // 2
                 text_rect.centery = y + (self.height // 7) // 2
                 
-                surface.blit(text_surface, text_rect)
+                blit_sequence.append((text_surface, text_rect))
+        
+        _blit_batch(surface, blit_sequence)
     
-    def _render_date_cells(self, surface: pygame.Surface, calendar_data: List[List[int]]) -> None:
+    def _render_date_cells(self, surface: pygame.Surface, calendar_data: List[List[int]],
+                           origin: Tuple[int, int] = (0, 0)) -> None:
         """
         日付セルを描画
         
         Args:
             surface: 描画対象サーフェス
             calendar_data: カレンダーデータ
+            origin: 描画対象サーフェスの画面上の原点（パネル描画時に使用）
         """
         if not self.font or not self.cell_positions:
             return
@@ -404,30 +581,37 @@ class CalendarRenderer:
         cell_width = self.width // 7
         cell_height = self.height // 7
         
-        # データ行（ヘッダの次の行から）に日付を描画
-        for week_idx, week in enumerate(calendar_data):
-            if week_idx + 1 >= len(self.cell_positions):
-                break
-                
-            for day_idx, day in enumerate(week):
-                if day == 0 or day_idx >= len(self.cell_positions[week_idx + 1]):
-                    continue  # 空セルはスキップ
-                
-                # セル情報の取得
-                cell_info = self._get_cell_render_info(week_idx + 1, day_idx, day, cell_width, cell_height)
-                if not cell_info:
-                    continue
-                
-                # セル描画実行
-                self._render_single_cell(surface, cell_info)
+        # 今日の判定はセルごとに日付オブジェクトを作らず、表示月内の日番号との整数比較で行う
+        today_day = self._get_today_day_in_month()
+        
+        # 表示中の月なら生成時に列挙済みの日付セルを使い、空セルの判定を省く
+        if calendar_data is self._date_cells_source:
+            date_cells = self._date_cells
+        else:
+            date_cells = _nonzero_cells(calendar_data)
+        
+        # データ行（ヘッダの次の行から）に日付を描画（文字のblitはまとめて実行）
+        blit_sequence = []
+        for row, col, day in date_cells:
+            # セル情報の取得
+            cell_info = self._get_cell_render_info(row, col, day, cell_width, cell_height,
+                                                   day == today_day, origin)
+            if not cell_info:
+                continue
+            
+            # セル描画実行
+            blit_sequence.append(self._render_single_cell(surface, cell_info))
+        
+        _blit_batch(surface, blit_sequence)
     
-    def _get_cell_render_info(self, row: int, col: int, day: int, cell_width: int, cell_height: int) -> Optional[Dict]:
+    def _get_cell_render_info(self, row: int, col: int, day: int, cell_width: int, cell_height: int,
+                              is_today: bool, origin: Tuple[int, int] = (0, 0)) -> Optional[Dict]:
         """セル描画情報を取得"""
-        x, y = self.cell_positions[row][col]
-        is_today = self._is_today(self.current_year, self.current_month, day)
+        x = self._col_xs[col] - origin[0]
+        y = self._row_ys[row] - origin[1]
         
-        # 色決定
-        text_color = self.color_today_text if (is_today and self.today_highlight) else self._get_cell_color(col, is_today)
+        # 色決定（描画用には共有済みのタプルを使う）
+        text_color = self._today_text_rgb if (is_today and self.today_highlight) else self._weekday_rgbs[col]
         
         return {
             'day': day,
@@ -439,43 +623,69 @@ class CalendarRenderer:
             'is_today': is_today
         }
     
-    def _render_single_cell(self, surface: pygame.Surface, cell_info: Dict) -> None:
-        """単一セルの描画"""
+    def _get_day_surface(self, day: int, color) -> pygame.Surface:
+        """日付数字のサーフェスを取得（未キャッシュ時はレンダリングして保持）"""
+        if not isinstance(color, tuple):
+            color = tuple(color)
+        key = (day, color)
+        text_surface = self._day_surface_cache.get(key)
+        if text_surface is None:
+            text_surface = _convert_for_display(self.font.render(str(day), True, color))
+            self._day_surface_cache[key] = text_surface
+        return text_surface
+    
+    def _render_single_cell(self, surface: pygame.Surface, cell_info: Dict) -> Tuple[pygame.Surface, pygame.Rect]:
+        """
+        単一セルの描画
+        
+        背景は即時に描画し、文字はまとめてblitできるよう(サーフェス, 配置)で返す
+        """
         # 今日の場合は背景描画
         if cell_info['is_today'] and self.today_highlight:
             bg_rect = pygame.Rect(cell_info['x'], cell_info['y'], cell_info['width'], cell_info['height'])
-            pygame.draw.rect(surface, tuple(self.color_today_bg), bg_rect)
+            pygame.draw.rect(surface, self._today_bg_rgb, bg_rect)
         
-        # テキスト描画
-        text_surface = self.font.render(str(cell_info['day']), True, tuple(cell_info['text_color']))
+        # テキスト描画（月をまたいでも同じ日付・色ならサーフェスを再利用）
+        text_surface = self._get_day_surface(cell_info['day'], cell_info['text_color'])
         
         # 中央揃え配置
         text_rect = text_surface.get_rect()
         text_rect.centerx = cell_info['x'] + cell_info['width'] // 2
         text_rect.centery = cell_info['y'] + cell_info['height'] // 2
         
-        surface.blit(text_surface, text_rect)
+        return (text_surface, text_rect)
     
     def update(self) -> None:
         """カレンダー更新"""
+        # 今日はフレームごとに1回だけ取得し、同フレーム内の判定・描画で使い回す
+        self._snapshot_today()
         current_year, current_month = self.get_current_month()
         
         # 月が変わった場合のみカレンダーデータを再生成
         if (current_year, current_month) != (self.current_year, self.current_month):
             self.current_year = current_year
             self.current_month = current_month
-            self.calendar_data = self._generate_calendar_data(current_year, current_month)
-            self.cell_positions = []  # 位置も再計算
+            self._load_calendar_data(current_year, current_month)
+            self._dirty = True
             logger.info(f"Calendar updated to {current_year}-{current_month:02d}")
         
         # 既にデータがない場合は生成
         if not self.calendar_data:
-            self.calendar_data = self._generate_calendar_data(self.current_year, self.current_month)
+            self._load_calendar_data(self.current_year, self.current_month)
+            self._dirty = True
+        
+        # 日付が変わった場合は今日ハイライトを描き直す
+        today_day = self._get_today_day_in_month()
+        if today_day != self._highlighted_day:
+            self._highlighted_day = today_day
+            self._dirty = True
     
     def render(self, surface: pygame.Surface) -> None:
         """
         カレンダーを描画
         
+        月・今日・週開始曜日に変化がなければ描画済みパネルを転送するだけ
+        
         Args:
             surface: 描画対象のサーフェス
         """
@@ -483,8 +693,21 @@ class CalendarRenderer:
         if not self._prepare_for_rendering():
             return
         
-        # 描画パイプライン実行
-        self._execute_render_pipeline(surface)
+        # 変化があった場合のみパネルに描画パイプラインを実行
+        if self._dirty or self._panel is None:
+            self._redraw_panel()
+        
+        surface.blit(self._panel, (self.position_x, self.position_y))
+    
+    def _redraw_panel(self) -> None:
+        """描画済みパネルを作り直す"""
+        size = (self.width, self.height)
+        if self._panel is None or self._panel.get_size() != size:
+            self._panel = _convert_for_display(pygame.Surface(size, pygame.SRCALPHA))
+        self._panel.fill((0, 0, 0, 0))
+        
+        self._execute_render_pipeline(self._panel, (self.position_x, self.position_y))
+        self._dirty = False
     
     def _prepare_for_rendering(self) -> bool:
         """描画前の準備処理"""
@@ -497,7 +720,7 @@ class CalendarRenderer:
         
         # セル位置の確認・計算
         if not self.cell_positions:
-            self.cell_positions = self._calculate_cell_positions()
+            self._update_cell_positions()
             if not self.cell_positions:
                 logger.error("Failed to calculate cell positions")
                 return False
@@ -509,13 +732,13 @@ class CalendarRenderer:
         
         return True
     
-    def _execute_render_pipeline(self, surface: pygame.Surface) -> None:
+    def _execute_render_pipeline(self, surface: pygame.Surface, origin: Tuple[int, int] = (0, 0)) -> None:
         """描画パイプラインの実行"""
         # 1. ヘッダ描画
-        self._render_header(surface)
+        self._render_header(surface, origin)
         
         # 2. 日付セル描画
-        self._render_date_cells(surface, self.calendar_data)
+        self._render_date_cells(surface, self.calendar_data, origin)
     
     def set_first_weekday(self, weekday: str) -> None:
         """
@@ -528,9 +751,10 @@ class CalendarRenderer:
         if weekday in ['SUNDAY', 'MONDAY'] and weekday != self.first_weekday:
             self.first_weekday = weekday
             self._set_calendar_first_weekday()
+            self._build_weekday_colors()
             # カレンダーデータを再生成
-            self.calendar_data = self._generate_calendar_data(self.current_year, self.current_month)
-            self.cell_positions = []
+            self._load_calendar_data(self.current_year, self.current_month)
+            self._dirty = True
             logger.info(f"First weekday changed to: {weekday}")
     
     def set_position(self, x: int, y: int) -> None:
@@ -543,7 +767,7 @@ class CalendarRenderer:
         """
         self.position_x = x
         self.position_y = y
-        self.cell_positions = []  # 位置再計算が必要
+        self._update_cell_positions()  # 位置再計算が必要
         logger.info(f"Calendar position changed to: ({x}, {y})")
     
     def cleanup(self) -> None:
@@ -551,5 +775,14 @@ class CalendarRenderer:
         self.font = None
         self.header_font = None
         self.calendar_data = []
-        self.cell_positions = []
+        self._date_cells = ()
+        self._date_cells_source = None
+        self.cell_positions = ()
+        self._col_xs = ()
+        self._row_ys = ()
+        self._header_cache.clear()
+        self._day_surface_cache.clear()
+        self._panel = None
+        self._today_key = None
+        self._dirty = True
         logger.info("CalendarRenderer cleanup completed")
\ No newline at end of file
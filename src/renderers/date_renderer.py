@@ -10,6 +10,7 @@ TASK-202: 日付表示
 
 import logging
 from datetime import datetime
+from enum import IntEnum
 from typing import Dict, Any, Optional, Tuple
 import pygame
 from ..assets.asset_manager import AssetManager
@@ -29,9 +30,38 @@ WEEKDAY_FORMATS = {
 }
 
 
+class WeekdayFormat(IntEnum):
+    """曜日フォーマット識別子（WEEKDAY_TABLESのインデックス）"""
+    JAPANESE = 0
+    ENGLISH = 1
+
+
+WEEKDAY_FORMAT_IDS = {
+    'japanese': WeekdayFormat.JAPANESE,
+    'english': WeekdayFormat.ENGLISH
+}
+
+# 識別子で直接引ける曜日テーブル
+WEEKDAY_TABLES = (
+    tuple(WEEKDAY_FORMATS['japanese']),
+    tuple(WEEKDAY_FORMATS['english'])
+)
+
+
 class DateRenderer:
     """日付レンダラークラス"""
     
+    # 毎フレーム参照される属性をスロット化してインスタンス辞書の探索を避ける
+    __slots__ = (
+        'asset_manager', 'settings', 'current_date',
+        'font_size', 'font_color', 'weekday_format', 'font_path', 'date_margin',
+        'font', 'text_surface', 'text_rect',
+        'cached_position', 'cached_clock_rect', 'weekday_formats',
+        '_weekday_format_id', '_weekdays',
+        '_date_ordinal', '_date_prefix', '_weekday_index',
+        '_dirty',
+    )
+    
     def __init__(self, asset_manager: AssetManager, settings: Dict[str, Any]):
         """
         初期化
@@ -48,6 +78,13 @@ class DateRenderer:
         self.font_size = self._get_setting('ui.date_font_px', DEFAULT_FONT_SIZE)
         self.font_color = self._get_setting('ui.date_color', DEFAULT_FONT_COLOR)
         self.weekday_format = self._get_setting('ui.weekday_format', DEFAULT_WEEKDAY_FORMAT)
+        self._weekday_format_id = self._resolve_weekday_format_id(self.weekday_format)
+        self._weekdays = WEEKDAY_TABLES[self._weekday_format_id]
+        
+        # 日付部分（"YYYY-MM-DD "）と曜日インデックスは日付が変わった時だけ更新
+        self._date_ordinal = None
+        self._date_prefix = ""
+        self._weekday_index = 0
         self.font_path = self._get_setting('fonts.main', None)
         self.date_margin = self._get_setting('ui.date_margin', DEFAULT_DATE_MARGIN)
         
@@ -63,9 +100,15 @@ class DateRenderer:
         self.cached_position = None
         self.cached_clock_rect = None
         
+        # 再描画が必要か（テキスト・位置が変わった時のみTrue）
+        self._dirty = True
+        
         # 曜日フォーマットはグローバル定義を使用
         self.weekday_formats = WEEKDAY_FORMATS
         
+        # 初回フレームでのラスタライズ遅延を避けるため、今日の日付を事前にレンダリング
+        self.update()
+        
         logger.info(f"DateRenderer initialized: font_size={self.font_size}, weekday_format={self.weekday_format}")
     
     def _get_setting(self, path: str, default=None):
@@ -79,6 +122,15 @@ class DateRenderer:
                 return default
         return current
     
+    @staticmethod
+    def _resolve_weekday_format_id(format_type: Any) -> WeekdayFormat:
+        """曜日フォーマット名を識別子に変換（不明な値はデフォルト）"""
+        if isinstance(format_type, str):
+            format_id = WEEKDAY_FORMAT_IDS.get(format_type.lower())
+            if format_id is not None:
+                return format_id
+        return WEEKDAY_FORMAT_IDS[DEFAULT_WEEKDAY_FORMAT]
+    
     def _load_font(self) -> None:
         """フォントを読み込み"""
         font_strategies = [
@@ -105,11 +157,18 @@ class DateRenderer:
     
     def update(self) -> None:
         """日付更新"""
-        # 現在日付を取得してフォーマット
+        # 日付が変わった場合のみ日付部分を組み立て直す
         current_dt = datetime.now()
-        new_date = self._format_date(current_dt)
-        
-        # 日付が変わった場合のみテキストサーフェスを更新
+        ordinal = current_dt.toordinal()
+        if ordinal != self._date_ordinal:
+            self._date_ordinal = ordinal
+            self._date_prefix = f"{current_dt.year:04d}-{current_dt.month:02d}-{current_dt.day:02d} "
+            self._weekday_index = current_dt.weekday()
+            self._refresh_date_text()
+    
+    def _refresh_date_text(self) -> None:
+        """日付部分と曜日ラベルを連結し、変化があればテキストサーフェスを更新"""
+        new_date = self._date_prefix + self._weekdays[self._weekday_index]
         if new_date != self.current_date:
             self.current_date = new_date
             self._render_text()
@@ -134,9 +193,9 @@ class DateRenderer:
         Returns:
             YYYY-MM-DD (曜日)形式の文字列
         """
-        date_part = dt.strftime("%Y-%m-%d")
-        weekday_part = self._format_weekday(dt)
-        return f"{date_part} {weekday_part}"
+        # strftime はフォーマット文字列の解析が毎回走るため f-string で直接組み立てる
+        # （曜日は_format_weekdayを呼ばずテーブルを直接引く）
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {self._weekdays[dt.weekday()]}"
     
     def _format_weekday(self, dt: datetime) -> str:
         """
@@ -148,16 +207,8 @@ class DateRenderer:
         Returns:
             フォーマットされた曜日文字列
         """
-        # 週の曜日を取得（月曜=0, 日曜=6）
-        weekday_index = dt.weekday()
-        
-        # 現在の曜日フォーマット設定を使用
-        format_type = self.weekday_format.lower()
-        if format_type not in self.weekday_formats:
-            format_type = DEFAULT_WEEKDAY_FORMAT
-            
-        weekday_list = self.weekday_formats[format_type]
-        return weekday_list[weekday_index]
+        # 解決済みの曜日テーブルを週の曜日（月曜=0, 日曜=6）で引く
+        return self._weekdays[dt.weekday()]
     
     def _render_text(self) -> None:
         """テキストをレンダリング"""
@@ -166,14 +217,21 @@ class DateRenderer:
             
         try:
             # テキストサーフェスを作成
-            self.text_surface = self.font.render(
+            text_surface = self.font.render(
                 self.current_date, 
                 True,  # アンチエイリアシング
                 tuple(self.font_color)
             )
             
-            # 描画位置を計算
+            # 表示サーフェスのピクセルフォーマットに変換し、blit時の変換コストを省く
+            if pygame.display.get_surface() is not None:
+                text_surface = text_surface.convert_alpha()
+            self.text_surface = text_surface
+            
+            # 描画位置を計算（テキスト幅が変わるため位置キャッシュも無効化）
             self.text_rect = self.text_surface.get_rect()
+            self._clear_position_cache()
+            self._dirty = True
             
         except Exception as e:
             logger.error(f"Text rendering failed: {e}")
@@ -181,7 +239,7 @@ class DateRenderer:
     
     def _should_recalculate_position(self, clock_rect: pygame.Rect) -> bool:
         """位置再計算が必要かどうかを判断"""
-        return (self.cached_clock_rect != clock_rect or 
+        return (self.cached_clock_rect != (clock_rect.x, clock_rect.y, clock_rect.w, clock_rect.h) or 
                 self.cached_position is None or 
                 self.text_rect is None)
     
@@ -204,7 +262,9 @@ class DateRenderer:
             date_y = self._calculate_y_position(clock_rect)
             
             self.cached_position = (date_x, date_y)
-            self.cached_clock_rect = clock_rect
+            # 呼び出し側がRectをインプレース変更しても検知できるよう値で保持
+            self.cached_clock_rect = (clock_rect.x, clock_rect.y, clock_rect.w, clock_rect.h)
+            self._dirty = True
         
         return self.cached_position or (0, 0)
     
@@ -212,6 +272,9 @@ class DateRenderer:
         """
         日付を描画
         
+        呼び出し側は毎フレーム背景から描き直すため、変化がなくても常にblitする。
+        変化の有無はis_dirty()で確認でき、画面更新範囲の絞り込みに使える。
+        
         Args:
             surface: 描画対象のサーフェス
             clock_rect: 時計の描画領域
@@ -224,11 +287,32 @@ class DateRenderer:
         if self.text_surface is None:
             self._render_text()
         
-        # 描画実行
-        if self.text_surface and self.text_rect:
-            x, y = self._calculate_position(clock_rect)
-            draw_rect = pygame.Rect(x, y, self.text_rect.width, self.text_rect.height)
-            surface.blit(self.text_surface, draw_rect)
+        if not (self.text_surface and self.text_rect):
+            return
+        
+        # 位置はキャッシュ済みタプルをそのまま使い、毎フレームのRect生成を避ける
+        position = self._calculate_position(clock_rect)
+        
+        surface.blit(self.text_surface, position)
+        self._dirty = False
+    
+    def is_dirty(self) -> bool:
+        """
+        前回のrender()からテキスト・位置が変わったかどうか
+        
+        Returns:
+            変化があり、画面の該当領域を更新する必要がある場合True
+        """
+        return self._dirty
+    
+    def set_dirty(self, dirty: bool = True) -> None:
+        """
+        変化フラグを設定（呼び出し側で該当領域の画面更新を強制したい場合など）
+        
+        Args:
+            dirty: 再描画が必要な場合True
+        """
+        self._dirty = dirty
     
     def set_weekday_format(self, format_type: str) -> None:
         """
@@ -237,6 +321,10 @@ class DateRenderer:
         Args:
             format_type: "japanese" または "english"
         """
+        # 毎フレーム同じ値で呼ばれても正規化・検証を繰り返さない
+        if format_type == self.weekday_format:
+            return
+        
         format_type = format_type.lower()
         
         # バリデーション
@@ -244,10 +332,13 @@ class DateRenderer:
             logger.warning(f"Invalid weekday format: {format_type}, using default")
             format_type = DEFAULT_WEEKDAY_FORMAT
         
-        if format_type != self.weekday_format:
-            self.weekday_format = format_type
-            self._clear_text_cache()
-            self._force_text_update()
+        format_id = WEEKDAY_FORMAT_IDS[format_type]
+        self.weekday_format = format_type
+        if format_id != self._weekday_format_id:
+            self._weekday_format_id = format_id
+            self._weekdays = WEEKDAY_TABLES[format_id]
+            # 日付部分は変わらないため曜日ラベルだけ差し替える
+            self._refresh_date_text()
             logger.info(f"Weekday format changed to: {format_type}")
     
     def set_font_size(self, size: int) -> None:
@@ -298,6 +389,7 @@ class DateRenderer:
         """テキスト強制更新"""
         # 現在の日付を強制的にクリアして再レンダを促す
         self.current_date = ""
+        self._date_ordinal = None
         self.update()
     
     def _invalidate_cache(self) -> None:
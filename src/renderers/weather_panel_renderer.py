@@ -6,11 +6,58 @@
 """
 
 import pygame
-from typing import Dict, Any, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, Any, Tuple, Optional, List
 from datetime import datetime
 import logging
 
 
+# (サーフェス, 描画位置)の組
+BlitList = List[Tuple[pygame.Surface, Any]]
+
+
+def _convert_for_display(surface: pygame.Surface) -> pygame.Surface:
+    """
+    表示サーフェスと同じピクセルフォーマットに変換（アルファは保持）
+    
+    ディスプレイ未初期化時は変換先が無いため、そのまま返す
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+
+def _blit_batch(surface: pygame.Surface, blit_list: BlitList) -> None:
+    """
+    溜めたblitをまとめて描画（pygame-ceではfblits、それ以外はblits）
+    
+    1回の呼び出しにすることで、blitごとのPython→C呼び出しと戻り値のRect生成を省く
+    """
+    if not blit_list:
+        return
+    fblits = getattr(surface, 'fblits', None)
+    if fblits is not None:
+        fblits(blit_list)
+    else:
+        surface.blits(blit_list, doreturn=0)
+
+
+@lru_cache(maxsize=8)
+def _format_forecast_date(date_str: str) -> str:
+    """
+    予報日付を表示用に整形（例: '2025-01-11' → '01/11(土)'）
+    
+    表示対象は高々3日分なので、解析結果は小さなLRUで使い回す
+    """
+    try:
+        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+        formatted_date = date_obj.strftime('%m/%d')
+        weekday = ['月', '火', '水', '木', '金', '土', '日'][date_obj.weekday()]
+        return f"{formatted_date}({weekday})"
+    except (TypeError, ValueError):
+        return date_str[:5]  # MM-DD部分のみ
+
+
 class WeatherPanelRenderer:
     """天気パネルレンダラークラス
     
@@ -31,6 +78,25 @@ class WeatherPanelRenderer:
     MARGIN_Y = 16
     PANEL_PADDING = 20
     DAY_SPACING = 130  # 各日の間隔
+    MAX_FORECAST_DAYS = 3
+    
+    # 天気アイコン設定（実際のアイコン画像がない場合の代替）
+    ICON_SIZE = 60
+    ICON_COLORS = {
+        'sunny': (255, 200, 0),      # 黄色
+        'cloudy': (150, 150, 150),   # グレー
+        'rain': (100, 150, 255),     # 青
+        'thunder': (200, 100, 255),  # 紫
+        'fog': (200, 200, 200)       # 薄いグレー
+    }
+    ICON_SYMBOLS = {
+        'sunny': '☀',
+        'cloudy': '☁',
+        'rain': '🌧',
+        'thunder': '⚡',
+        'fog': '🌫'
+    }
+    DEFAULT_ICON_COLOR = (150, 150, 150)
     
     def __init__(self, asset_manager: Any, settings: Dict[str, Any]):
         """初期化
@@ -60,8 +126,22 @@ class WeatherPanelRenderer:
         self.font = asset_manager.get_font('main', self.font_size)
         self.small_font = asset_manager.get_font('main', int(self.font_size * 0.8))
         
-        # アイコンキャッシュ
-        self._icon_cache = {}
+        # アイコンキャッシュ（既知のアイコンは初期化時に描画しておく）
+        self._icon_cache: Dict[str, pygame.Surface] = {}
+        for icon_name in self.ICON_COLORS:
+            self._get_icon(icon_name)
+        
+        # 描画済みサーフェスのキャッシュ
+        # 予報タイルは(日付, アイコン, 最低, 最高, 降水確率)をキーにupdate()で作り直す
+        self._forecast_cache: Dict[tuple, pygame.Surface] = {}
+        self._panel_background: Optional[pygame.Surface] = None
+        # 更新時刻は分単位の表示なので、表示文字列と描画結果を組で保持
+        self._update_time_cache: Optional[Tuple[str, pygame.Surface]] = None
+        
+        # 背景・予報・更新時刻を合成したパネル全体（update()で作成）
+        self._composed_panel: Optional[pygame.Surface] = None
+        self._panel_pos: Tuple[int, int] = (0, 0)
+        self._last_screen_size: Optional[Tuple[int, int]] = None
         
         # 天気データキャッシュ
         self._weather_data = None
@@ -76,8 +156,43 @@ class WeatherPanelRenderer:
         """
         if weather_data:
             self._weather_data = weather_data
+            self._rebuild_forecast_cache()
+            self._composed_panel = _convert_for_display(self._compose_panel())
             self.logger.debug(f"Weather data updated: {len(weather_data.get('forecasts', []))} days")
     
+    @staticmethod
+    def _forecast_key(forecast: Dict[str, Any]) -> tuple:
+        """予報タイルのキャッシュキー（タイルの見た目を決める値の組）"""
+        temp_data = forecast.get('temperature') or {}
+        return (
+            forecast.get('date'),
+            forecast.get('icon'),
+            temp_data.get('min'),
+            temp_data.get('max'),
+            forecast.get('precipitation_probability')
+        )
+    
+    def _rebuild_forecast_cache(self) -> None:
+        """表示対象の予報タイルを用意し、表示されなくなったタイルを破棄"""
+        forecasts = self._weather_data.get('forecasts') or []
+        cache = {}
+        for forecast in forecasts[:self.MAX_FORECAST_DAYS]:
+            key = self._forecast_key(forecast)
+            tile = self._forecast_cache.get(key)
+            if tile is None:
+                tile = _convert_for_display(self._render_forecast_tile(forecast))
+            cache[key] = tile
+        self._forecast_cache = cache
+    
+    def _get_forecast_tile(self, forecast: Dict[str, Any]) -> pygame.Surface:
+        """予報タイルを取得（未作成なら作成してキャッシュ）"""
+        key = self._forecast_key(forecast)
+        tile = self._forecast_cache.get(key)
+        if tile is None:
+            tile = _convert_for_display(self._render_forecast_tile(forecast))
+            self._forecast_cache[key] = tile
+        return tile
+    
     def render(self, screen: pygame.Surface) -> None:
         """画面に描画
         
@@ -88,62 +203,102 @@ class WeatherPanelRenderer:
             # データがない場合は何も描画しない
             return
         
-        # パネル位置計算（左下）
-        screen_width, screen_height = screen.get_size()
-        panel_x = self.margins_x
-        panel_y = screen_height - self.margins_y - self.panel_height
+        if self._composed_panel is None:
+            self._composed_panel = _convert_for_display(self._compose_panel())
+        
+        # パネル位置計算（左下）。画面サイズが変わった時のみ再計算
+        screen_size = screen.get_size()
+        if screen_size != self._last_screen_size:
+            screen_width, screen_height = screen_size
+            self._panel_pos = (self.margins_x, screen_height - self.margins_y - self.panel_height)
+            self._last_screen_size = screen_size
+        
+        screen.blit(self._composed_panel, self._panel_pos)
+    
+    def _compose_panel(self) -> pygame.Surface:
+        """パネル全体（背景・予報・更新時刻）を1枚のサーフェスに合成
+        
+        Returns:
+            パネルサイズの合成済みサーフェス
+        """
+        panel = pygame.Surface((self.panel_width, self.panel_height), pygame.SRCALPHA)
+        
+        # blitは溜めておき、最後に1回でまとめて描画する
+        blits: BlitList = []
         
         # パネル背景描画
-        self._draw_panel_background(screen, panel_x, panel_y)
+        self._draw_panel_background(panel, 0, 0, blits)
         
         # 天気予報描画（最大3日分）
-        forecasts = self._weather_data['forecasts'][:3]
+        forecasts = (self._weather_data.get('forecasts') or [])[:self.MAX_FORECAST_DAYS]
         for i, forecast in enumerate(forecasts):
-            self._draw_forecast(screen, forecast, panel_x, panel_y, i)
+            self._draw_forecast(panel, forecast, 0, 0, i, blits)
         
         # 更新時刻表示（オプション）
         if 'updated' in self._weather_data:
-            self._draw_update_time(screen, panel_x, panel_y)
+            self._draw_update_time(panel, 0, 0, blits)
+        
+        _blit_batch(panel, blits)
+        return panel
     
-    def _draw_panel_background(self, screen: pygame.Surface, x: int, y: int) -> None:
+    def _draw_panel_background(self, screen: pygame.Surface, x: int, y: int,
+                               blits: Optional[BlitList] = None) -> None:
         """パネル背景の描画（角丸矩形）
         
         Args:
             screen: 描画対象
             x: パネルX座標
             y: パネルY座標
+            blits: blitを追加するリスト（Noneの場合はこの場で描画）
         """
-        # 角丸矩形を描画（簡易版：通常の矩形で代替）
-        panel_surface = pygame.Surface((self.panel_width, self.panel_height), pygame.SRCALPHA)
+        # 背景は設定から決まり変化しないため、初回に作成したものを使い回す
+        if self._panel_background is None:
+            self._panel_background = _convert_for_display(self._render_panel_background())
         
-        # 背景色で塗りつぶし
-        if len(self.panel_color) == 4:
-            # アルファ値付き
-            panel_surface.fill(self.panel_color)
+        if blits is None:
+            screen.blit(self._panel_background, (x, y))
         else:
-            # アルファ値なし
-            panel_surface.fill((*self.panel_color, 200))
+            blits.append((self._panel_background, (x, y)))
+    
+    def _render_panel_background(self) -> pygame.Surface:
+        """パネル背景サーフェスの作成"""
+        # 角丸矩形を描画（簡易版：通常の矩形で代替）
+        panel_surface = pygame.Surface((self.panel_width, self.panel_height), pygame.SRCALPHA)
         
-        # 角丸効果（簡易版：四隅に円を描画）
-        if self.panel_radius > 0:
-            radius = self.panel_radius
-            color = self.panel_color[:3] if len(self.panel_color) >= 3 else (30, 30, 40)
+        # 塗りつぶしと図形描画の間はロックしたままにし、描画ごとのロック/解除を省く
+        # （blitはロック中に行えないため、この区間は図形描画のみ）
+        panel_surface.lock()
+        try:
+            # 背景色で塗りつぶし
+            if len(self.panel_color) == 4:
+                # アルファ値付き
+                panel_surface.fill(self.panel_color)
+            else:
+                # アルファ値なし
+                panel_surface.fill((*self.panel_color, 200))
             
-            # 四隅の円
-            pygame.draw.circle(panel_surface, color, (radius, radius), radius)
-            pygame.draw.circle(panel_surface, color, (self.panel_width - radius, radius), radius)
-            pygame.draw.circle(panel_surface, color, (radius, self.panel_height - radius), radius)
-            pygame.draw.circle(panel_surface, color, (self.panel_width - radius, self.panel_height - radius), radius)
+            # 角丸効果（簡易版：四隅に円を描画）
+            if self.panel_radius > 0:
+                radius = self.panel_radius
+                color = self.panel_color[:3] if len(self.panel_color) >= 3 else (30, 30, 40)
             
-            # 矩形で隙間を埋める
-            pygame.draw.rect(panel_surface, color, (radius, 0, self.panel_width - 2*radius, self.panel_height))
-            pygame.draw.rect(panel_surface, color, (0, radius, self.panel_width, self.panel_height - 2*radius))
+                # 四隅の円
+                pygame.draw.circle(panel_surface, color, (radius, radius), radius)
+                pygame.draw.circle(panel_surface, color, (self.panel_width - radius, radius), radius)
+                pygame.draw.circle(panel_surface, color, (radius, self.panel_height - radius), radius)
+                pygame.draw.circle(panel_surface, color, (self.panel_width - radius, self.panel_height - radius), radius)
+            
+                # 矩形で隙間を埋める
+                pygame.draw.rect(panel_surface, color, (radius, 0, self.panel_width - 2*radius, self.panel_height))
+                pygame.draw.rect(panel_surface, color, (0, radius, self.panel_width, self.panel_height - 2*radius))
+        finally:
+            panel_surface.unlock()
         
-        # 画面に描画
-        screen.blit(panel_surface, (x, y))
+        return panel_surface
     
     def _draw_forecast(self, screen: pygame.Surface, forecast: Dict[str, Any], 
-                      panel_x: int, panel_y: int, index: int) -> None:
+                      panel_x: int, panel_y: int, index: int,
+                      blits: Optional[BlitList] = None) -> None:
         """1日分の予報を描画
         
         Args:
@@ -152,30 +307,45 @@ class WeatherPanelRenderer:
             panel_x: パネルX座標
             panel_y: パネルY座標
             index: 日付インデックス（0-2）
+            blits: blitを追加するリスト（Noneの場合はこの場で描画）
         """
         # 各日の描画位置
         day_x = panel_x + self.PANEL_PADDING + (index * self.DAY_SPACING)
         day_y = panel_y + self.PANEL_PADDING
         
+        tile = self._get_forecast_tile(forecast)
+        if blits is None:
+            screen.blit(tile, (day_x, day_y))
+        else:
+            blits.append((tile, (day_x, day_y)))
+    
+    def _render_forecast_tile(self, forecast: Dict[str, Any]) -> pygame.Surface:
+        """1日分の予報（日付・アイコン・気温・降水確率）を1枚のサーフェスに描画
+        
+        Args:
+            forecast: 予報データ
+            
+        Returns:
+            予報タイル（幅DAY_SPACING、高さはパネルの内側）
+        """
+        tile = pygame.Surface(
+            (self.DAY_SPACING, self.panel_height - 2 * self.PANEL_PADDING), pygame.SRCALPHA
+        )
+        pending: BlitList = []
+        day_x = 0
+        day_y = 0
+        
         # 日付表示
         date_str = forecast.get('date', '')
         if date_str:
-            # 日付を解析してフォーマット
-            try:
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                formatted_date = date_obj.strftime('%m/%d')
-                weekday = ['月', '火', '水', '木', '金', '土', '日'][date_obj.weekday()]
-                date_text = f"{formatted_date}({weekday})"
-            except:
-                date_text = date_str[:5]  # MM-DD部分のみ
-            
+            date_text = _format_forecast_date(date_str)
             text_surface = self.font.render(date_text, True, self.DEFAULT_TEXT_COLOR)
-            screen.blit(text_surface, (day_x, day_y))
+            pending.append((text_surface, (day_x, day_y)))
         
         # 天気アイコン描画
         icon_name = forecast.get('icon', 'cloudy')
         icon_y = day_y + 40
-        self._draw_weather_icon(screen, icon_name, day_x + 20, icon_y)
+        self._draw_weather_icon(tile, icon_name, day_x + 20, icon_y, pending)
         
         # 気温表示
         temp_data = forecast.get('temperature', {})
@@ -186,7 +356,7 @@ class WeatherPanelRenderer:
             
             temp_surface = self.font.render(temp_text, True, self.DEFAULT_TEXT_COLOR)
             temp_y = icon_y + 80
-            screen.blit(temp_surface, (day_x, temp_y))
+            pending.append((temp_surface, (day_x, temp_y)))
         
         # 降水確率表示
         precipitation = forecast.get('precipitation_probability')
@@ -194,9 +364,13 @@ class WeatherPanelRenderer:
             rain_text = f"☔ {precipitation}%"
             rain_surface = self.small_font.render(rain_text, True, (150, 200, 255))
             rain_y = icon_y + 110
-            screen.blit(rain_surface, (day_x, rain_y))
+            pending.append((rain_surface, (day_x, rain_y)))
+        
+        _blit_batch(tile, pending)
+        return tile
     
-    def _draw_weather_icon(self, screen: pygame.Surface, icon_name: str, x: int, y: int) -> None:
+    def _draw_weather_icon(self, screen: pygame.Surface, icon_name: str, x: int, y: int,
+                           blits: Optional[BlitList] = None) -> None:
         """天気アイコンの描画
         
         Args:
@@ -204,50 +378,59 @@ class WeatherPanelRenderer:
             icon_name: アイコン名（sunny, cloudy, rain, thunder, fog）
             x: X座標
             y: Y座標
+            blits: blitを追加するリスト（Noneの場合はこの場で描画）
+        """
+        icon = self._get_icon(icon_name)
+        if blits is None:
+            screen.blit(icon, (x, y))
+        else:
+            blits.append((icon, (x, y)))
+    
+    def _get_icon(self, icon_name: str) -> pygame.Surface:
+        """アイコンサーフェスを取得（未作成なら作成してキャッシュ）"""
+        icon = self._icon_cache.get(icon_name)
+        if icon is None:
+            icon = _convert_for_display(self._render_icon(icon_name))
+            self._icon_cache[icon_name] = icon
+        return icon
+    
+    def _render_icon(self, icon_name: str) -> pygame.Surface:
+        """天気アイコンのサーフェスを作成
+        
+        Args:
+            icon_name: アイコン名（未知の名前はグレーの円と「?」）
+            
+        Returns:
+            ICON_SIZE四方のアイコンサーフェス
         """
-        # アイコンサイズ
-        icon_size = 60
-        
-        # 簡易アイコン描画（実際のアイコン画像がない場合の代替）
-        icon_colors = {
-            'sunny': (255, 200, 0),      # 黄色
-            'cloudy': (150, 150, 150),   # グレー
-            'rain': (100, 150, 255),     # 青
-            'thunder': (200, 100, 255),  # 紫
-            'fog': (200, 200, 200)       # 薄いグレー
-        }
-        
-        icon_symbols = {
-            'sunny': '☀',
-            'cloudy': '☁',
-            'rain': '🌧',
-            'thunder': '⚡',
-            'fog': '🌫'
-        }
-        
-        # 色を取得
-        color = icon_colors.get(icon_name, (150, 150, 150))
+        icon_size = self.ICON_SIZE
+        icon = pygame.Surface((icon_size, icon_size), pygame.SRCALPHA)
+        center = (icon_size // 2, icon_size // 2)
         
         # 簡易的に円で表現
-        pygame.draw.circle(screen, color, (x + icon_size//2, y + icon_size//2), icon_size//2)
+        color = self.ICON_COLORS.get(icon_name, self.DEFAULT_ICON_COLOR)
+        pygame.draw.circle(icon, color, center, icon_size // 2)
         
         # テキストシンボル（フォントがサポートしている場合）
         try:
-            symbol = icon_symbols.get(icon_name, '?')
+            symbol = self.ICON_SYMBOLS.get(icon_name, '?')
             symbol_surface = self.font.render(symbol, True, (255, 255, 255))
-            symbol_rect = symbol_surface.get_rect(center=(x + icon_size//2, y + icon_size//2))
-            screen.blit(symbol_surface, symbol_rect)
+            icon.blit(symbol_surface, symbol_surface.get_rect(center=center))
         except:
             # シンボル描画失敗時は無視
             pass
+        
+        return icon
     
-    def _draw_update_time(self, screen: pygame.Surface, panel_x: int, panel_y: int) -> None:
+    def _draw_update_time(self, screen: pygame.Surface, panel_x: int, panel_y: int,
+                          blits: Optional[BlitList] = None) -> None:
         """更新時刻の表示
         
         Args:
             screen: 描画対象
             panel_x: パネルX座標
             panel_y: パネルY座標
+            blits: blitを追加するリスト（Noneの場合はこの場で描画）
         """
         if 'updated' in self._weather_data:
             timestamp = self._weather_data['updated']
@@ -255,15 +438,26 @@ class WeatherPanelRenderer:
                 update_time = datetime.fromtimestamp(timestamp)
                 time_str = f"更新: {update_time.strftime('%H:%M')}"
                 
-                time_surface = self.small_font.render(time_str, True, (150, 150, 150))
+                if self._update_time_cache and self._update_time_cache[0] == time_str:
+                    time_surface = self._update_time_cache[1]
+                else:
+                    time_surface = self.small_font.render(time_str, True, (150, 150, 150))
+                    self._update_time_cache = (time_str, time_surface)
                 time_x = panel_x + self.panel_width - self.PANEL_PADDING - time_surface.get_width()
                 time_y = panel_y + self.panel_height - self.PANEL_PADDING - time_surface.get_height()
-                screen.blit(time_surface, (time_x, time_y))
+                if blits is None:
+                    screen.blit(time_surface, (time_x, time_y))
+                else:
+                    blits.append((time_surface, (time_x, time_y)))
             except:
                 pass
     
     def cleanup(self) -> None:
         """リソースのクリーンアップ"""
         self._icon_cache.clear()
+        self._forecast_cache.clear()
+        self._panel_background = None
+        self._update_time_cache = None
+        self._composed_panel = None
         self._weather_data = None
         self.logger.info("WeatherPanelRenderer cleaned up")
\ No newline at end of file
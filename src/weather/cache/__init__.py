@@ -0,0 +1,23 @@
+"""
+天気キャッシュパッケージ
+
+天気プロバイダから取得したデータのキャッシュを提供する。
+"""
+
+from .weather_cache import WeatherCache
+from .cache_key import generate_cache_key
+from .exceptions import (
+    CacheError,
+    CacheReadError,
+    CacheWriteError,
+    CacheInvalidError
+)
+
+__all__ = [
+    'WeatherCache',
+    'generate_cache_key',
+    'CacheError',
+    'CacheReadError',
+    'CacheWriteError',
+    'CacheInvalidError'
+]
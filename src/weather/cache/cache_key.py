@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+天気キャッシュキー生成
+
+プロバイダ名と位置情報からキャッシュキーを生成する。
+"""
+
+from typing import Dict, Any
+
+
+# キーに含める座標の小数桁数（約100m単位で同じ地点とみなす）
+COORDINATE_PRECISION = 3
+
+
+def generate_cache_key(provider: str, location: Dict[str, Any]) -> str:
+    """
+    キャッシュキー生成
+
+    Args:
+        provider: プロバイダ名（openmeteo, yahoo等）
+        location: 位置情報（latitude, longitude）
+
+    Returns:
+        ユニークなキャッシュキー（例: "openmeteo_35.681_139.767"）
+    """
+    lat = float(location['latitude'])
+    lon = float(location['longitude'])
+    return f"{provider}_{lat:.{COORDINATE_PRECISION}f}_{lon:.{COORDINATE_PRECISION}f}"
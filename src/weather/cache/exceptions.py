@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+天気キャッシュ例外クラス定義
+
+キャッシュの読み書きに関する各種例外を定義する。
+"""
+
+
+class CacheError(Exception):
+    """キャッシュ関連エラーの基底クラス"""
+    pass
+
+
+class CacheReadError(CacheError):
+    """キャッシュ読み取りエラー"""
+    pass
+
+
+class CacheWriteError(CacheError):
+    """キャッシュ書き込みエラー"""
+    pass
+
+
+class CacheInvalidError(CacheError):
+    """キャッシュ無効エラー
+
+    不正なキャッシュキーなど、キャッシュとして扱えない入力で使用される。
+    """
+    pass
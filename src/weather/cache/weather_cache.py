@@ -0,0 +1,641 @@
+#!/usr/bin/env python3
+"""
+天気データキャッシュ
+
+天気プロバイダから取得したデータをキャッシュディレクトリに保存し、
+ネットワーク断やAPI制限時でも天気情報を表示できるようにする。
+
+各エントリは人が確認できるよう{key}.jsonとして保存し、有効期限・最終アクセス時刻・
+サイズはSQLiteの索引（index.db）で管理する。期限切れ削除やLRU削除は索引への
+クエリで対象を求めるため、ディレクトリ走査やファイルごとのstatを行わない。
+デコード済みのデータはメモリ上のLRU（ホット層）にも保持し、繰り返しの取得では
+ファイルを読まない。
+"""
+
+import contextlib
+import json
+import logging
+import mmap
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable, List, Tuple
+
+from .exceptions import CacheInvalidError
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+class DefaultSettings:
+    """デフォルト設定値"""
+    ENABLED = True
+    DIRECTORY = '~/.cache/picalendar/weather'
+    TTL = 1800  # 30分
+    MAX_SIZE = 10 * 1024 * 1024  # 10MB
+    MAX_ENTRIES = 100
+    FALLBACK_ON_ERROR = True
+    CLEANUP_INTERVAL = 3600  # 1時間
+
+
+class CacheFiles:
+    """キャッシュファイル関連の定数"""
+    ENTRY_SUFFIX = '.json'
+    TEMP_SUFFIX = '.tmp'  # 書き込み途中のファイル（キーは先頭にドットを含まないため衝突しない）
+    INDEX_NAME = 'index.db'
+    FORMAT_VERSION = '1.0'
+    FILE_MODE = 0o600  # 所有者のみ読み書き（tempfile.mkstempの作成モードと同じ）
+    DIRECTORY_MODE = 0o700  # 所有者のみアクセス
+    MMAP_THRESHOLD = 64 * 1024  # これ以上のファイルはmmapで読む（orjson使用時のみ）
+
+
+# キー単位ロックのストライプ数（2のべき乗）
+_LOCK_STRIPES = 64
+
+# キャッシュキーに使える文字（ディレクトリトラバーサル防止）
+_VALID_KEY = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_.\-]*$')
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """標準jsonでのシリアライズ（orjsonと同じく区切りの空白を省いたコンパクト形式）"""
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+if HAS_ORJSON:
+    # C実装のシリアライザ（UTF-8のbytesを直接入出力する）
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+else:
+    _dumps = _json_dumps
+    _loads = json.loads
+
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries(expires_at);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries(last_access);
+
+-- エントリ数と合計サイズはトリガーで維持し、上限判定時の全件集計を避ける
+CREATE TABLE IF NOT EXISTS stats (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    entry_count INTEGER NOT NULL,
+    total_size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats (id, entry_count, total_size)
+    SELECT 1, COUNT(*), COALESCE(SUM(size), 0) FROM entries;
+CREATE TRIGGER IF NOT EXISTS entries_after_insert AFTER INSERT ON entries BEGIN
+    UPDATE stats SET entry_count = entry_count + 1, total_size = total_size + new.size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_after_delete AFTER DELETE ON entries BEGIN
+    UPDATE stats SET entry_count = entry_count - 1, total_size = total_size - old.size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_after_update_size AFTER UPDATE OF size ON entries BEGIN
+    UPDATE stats SET total_size = total_size - old.size + new.size;
+END;
+"""
+
+# REPLACEによる削除では削除トリガーが発火しないため、UPSERTで更新する
+_UPSERT_ENTRY = (
+    'INSERT INTO entries (key, expires_at, last_access, size) VALUES (?, ?, ?, ?) '
+    'ON CONFLICT(key) DO UPDATE SET expires_at = excluded.expires_at, '
+    'last_access = excluded.last_access, size = excluded.size'
+)
+
+
+class WeatherCache:
+    """天気データキャッシュ管理クラス
+
+    期限切れエントリの削除は専用スレッドを持たず、書き込み時に
+    一定回数・一定間隔ごと、または上限超過時にまとめて行う。
+    """
+
+    # この回数の書き込みごとに期限切れエントリを掃除する
+    SWEEP_EVERY_WRITES = 32
+
+    def __init__(self, settings: Dict[str, Any]):
+        """
+        初期化
+
+        Args:
+            settings: 設定辞書（weather.cache以下にdirectory, ttl, max_size等）
+        """
+        self.logger = logging.getLogger(__name__)
+        self.settings = settings
+
+        self._load_settings()
+
+        # エントリファイルの読み書きはキーごとのストライプロックで直列化し、
+        # 索引とホット層は短い区間だけ_index_lockで保護する。
+        # ロック順序はストライプ -> _index_lock（逆順での取得は禁止）
+        self._stripes = [threading.RLock() for _ in range(_LOCK_STRIPES)]
+        self._index_lock = threading.RLock()
+        self._index: Optional[sqlite3.Connection] = None
+
+        # ホット層（キー -> (有効期限, データ)）と、索引に未反映の最終アクセス時刻
+        self._hot: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._pending_access: Dict[str, float] = {}
+
+        # キー -> エントリファイルのパス（削除時に破棄）
+        self._entry_paths: Dict[str, str] = {}
+
+        # 書き込み時の期限切れ掃除の管理
+        self._writes_since_sweep = 0
+        self._last_sweep = time.monotonic()
+
+        if self.enabled:
+            self._init_storage()
+
+        self.logger.info(f"WeatherCache initialized: {self.directory}")
+
+    def _load_settings(self):
+        """設定読み込み"""
+        cache_config = self.settings.get('weather', {}).get('cache', {})
+
+        self.enabled = cache_config.get('enabled', DefaultSettings.ENABLED)
+        self.directory = os.path.expanduser(
+            cache_config.get('directory', DefaultSettings.DIRECTORY)
+        )
+        self.ttl = cache_config.get('ttl', DefaultSettings.TTL)
+        self.max_size = cache_config.get('max_size', DefaultSettings.MAX_SIZE)
+        self.max_entries = cache_config.get('max_entries', DefaultSettings.MAX_ENTRIES)
+        self.fallback_on_error = cache_config.get(
+            'fallback_on_error', DefaultSettings.FALLBACK_ON_ERROR
+        )
+        self.cleanup_interval = cache_config.get(
+            'cleanup_interval', DefaultSettings.CLEANUP_INTERVAL
+        )
+
+    def _init_storage(self):
+        """キャッシュディレクトリと索引の初期化（失敗時はキャッシュ無効で継続）"""
+        index_path = os.path.join(self.directory, CacheFiles.INDEX_NAME)
+        try:
+            os.makedirs(self.directory, mode=CacheFiles.DIRECTORY_MODE, exist_ok=True)
+            index_exists = os.path.exists(index_path)
+
+            self._index = sqlite3.connect(index_path, check_same_thread=False)
+            # 索引は{key}.jsonから再構築できるため、コミットごとのfsyncは行わない
+            self._index.execute('PRAGMA journal_mode=WAL')
+            self._index.execute('PRAGMA synchronous=NORMAL')
+            self._index.executescript(_INDEX_SCHEMA)
+
+            self._scan_directory(rebuild_index=not index_exists)
+        except (OSError, sqlite3.Error) as e:
+            self.logger.error(f"Cache storage unavailable, caching disabled: {e}")
+            if self._index is not None:
+                self._index.close()
+                self._index = None
+            self.enabled = False
+
+    def _sync_directory(self):
+        """ディレクトリをfsyncし、それまでのrename・unlinkを永続化する"""
+        try:
+            fd = os.open(self.directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            self.logger.warning(f"Failed to sync cache directory: {e}")
+
+    def _scan_directory(self, rebuild_index: bool):
+        """
+        起動時のディレクトリ走査（1回のscandirで済ませる）
+
+        書き込み途中で中断された一時ファイルを削除し、索引が新規作成された場合は
+        既存のエントリファイルから索引を作り直す。statはDirEntryにキャッシュされた
+        ものを使う。
+
+        Args:
+            rebuild_index: エントリファイルから索引を再構築するか
+        """
+        rows = []
+        with os.scandir(self.directory) as entries:
+            for dir_entry in entries:
+                name = dir_entry.name
+                if name.endswith(CacheFiles.TEMP_SUFFIX):
+                    with contextlib.suppress(OSError):
+                        os.unlink(dir_entry.path)
+                    continue
+                if not rebuild_index or not name.endswith(CacheFiles.ENTRY_SUFFIX):
+                    continue
+                key = name[:-len(CacheFiles.ENTRY_SUFFIX)]
+                if not _VALID_KEY.match(key):
+                    continue
+                entry = self._read_entry(key)
+                if entry is not None:
+                    stat = dir_entry.stat()
+                    rows.append((key, entry['metadata']['expires_at'], stat.st_mtime, stat.st_size))
+
+        if rows:
+            with self._index:
+                self._index.executemany(_UPSERT_ENTRY, rows)
+            self.logger.info(f"Cache index rebuilt: {len(rows)} entries")
+
+    def _validate_key(self, key: str) -> None:
+        """キャッシュキーの妥当性検証"""
+        if not isinstance(key, str) or not _VALID_KEY.match(key):
+            raise CacheInvalidError(f"Invalid cache key: {key!r}")
+
+    def _lock_for(self, key: str) -> threading.RLock:
+        """キーに対応するストライプロック"""
+        return self._stripes[zlib.crc32(key.encode('utf-8')) & (_LOCK_STRIPES - 1)]
+
+    def _entry_path(self, key: str) -> str:
+        """エントリファイルのパス（キーごとに一度だけ組み立てる）"""
+        path = self._entry_paths.get(key)
+        if path is None:
+            path = os.path.join(self.directory, key + CacheFiles.ENTRY_SUFFIX)
+            self._entry_paths[key] = path
+        return path
+
+    def _load_file(self, f) -> Any:
+        """
+        開いたエントリファイルをデコード
+
+        orjsonはmemoryviewを直接デコードできるため、大きなファイルはmmapで
+        ページキャッシュを参照してユーザ空間へのコピーを省く。小さなファイルは
+        mmapの設定コストの方が大きいので通常の読み込みを使う。
+        """
+        if HAS_ORJSON and os.fstat(f.fileno()).st_size >= CacheFiles.MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return _loads(view)
+        return _loads(f.read())
+
+    def _read_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        エントリファイルの読み込み（破損ファイルは削除）
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            エントリ辞書（存在しない・破損の場合None）
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = self._load_file(f)
+            expires_at = entry['metadata']['expires_at']
+            if 'data' not in entry or not isinstance(expires_at, (int, float)):
+                raise ValueError("missing data or expires_at")
+            return entry
+        except FileNotFoundError:
+            # 存在しないキーのパスは保持しない
+            self._entry_paths.pop(key, None)
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            # json/orjsonのJSONDecodeErrorはいずれもValueErrorのサブクラス
+            self.logger.warning(f"Corrupted cache entry removed: {key} ({e})")
+            self._remove_entry(key)
+            return None
+        except OSError as e:
+            self.logger.error(f"Failed to read cache entry {key}: {e}")
+            return None
+
+    def _remove_entry(self, key: str) -> bool:
+        """
+        エントリファイルと索引行を削除
+
+        呼び出し側でキーのストライプロックを保持していること。
+
+        Returns:
+            ファイルまたは索引行が存在した場合True
+        """
+        removed = False
+        try:
+            os.unlink(self._entry_path(key))
+            removed = True
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.error(f"Failed to remove cache entry {key}: {e}")
+
+        self._entry_paths.pop(key, None)
+        with self._index_lock:
+            self._hot.pop(key, None)
+            self._pending_access.pop(key, None)
+            if self._index is not None:
+                with self._index:
+                    cursor = self._index.execute('DELETE FROM entries WHERE key = ?', (key,))
+                removed = removed or cursor.rowcount > 0
+        return removed
+
+    def _remove_entries(self, keys: List[str]) -> int:
+        """複数エントリをキーごとのロックを取りながら削除し、削除数を返す"""
+        removed = 0
+        for key in keys:
+            with self._lock_for(key):
+                if self._remove_entry(key):
+                    removed += 1
+        return removed
+
+    def _hot_put(self, key: str, expires_at: float, data: Any) -> None:
+        """ホット層へ登録（容量超過時は最も古いものを追い出す）"""
+        self._hot[key] = (expires_at, data)
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.max_entries:
+            self._hot.popitem(last=False)
+
+    def _flush_access_times(self) -> None:
+        """ホット層でのアクセス時刻を索引へまとめて反映"""
+        if not self._pending_access:
+            return
+        with self._index:
+            self._index.executemany(
+                'UPDATE entries SET last_access = ? WHERE key = ?',
+                [(accessed, key) for key, accessed in self._pending_access.items()]
+            )
+        self._pending_access.clear()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        キャッシュ取得
+
+        返却値はホット層と共有されるため、呼び出し側で変更しないこと。
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            有効期限内のキャッシュデータ（なし・期限切れの場合None）
+        """
+        self._validate_key(key)
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._index_lock:
+            hot = self._hot.get(key)
+
+        if hot is not None:
+            expires_at, data = hot
+        else:
+            with self._lock_for(key):
+                entry = self._read_entry(key)
+                if entry is None:
+                    return None
+                expires_at, data = entry['metadata']['expires_at'], entry['data']
+                with self._index_lock:
+                    self._hot_put(key, expires_at, data)
+
+        if expires_at <= now:
+            self.logger.debug(f"Cache expired: {key}")
+            return None
+
+        # LRU用の最終アクセス時刻は記録だけして、索引への書き込みは削除判定時に行う
+        with self._index_lock:
+            if key in self._hot:
+                self._hot.move_to_end(key)
+                self._pending_access[key] = now
+
+        self.logger.debug(f"Cache hit: {key}")
+        return data
+
+    def set(self, key: str, data: Dict[str, Any]) -> bool:
+        """
+        キャッシュ保存
+
+        Args:
+            key: キャッシュキー
+            data: 保存するデータ
+
+        Returns:
+            保存成功の場合True
+        """
+        self._validate_key(key)
+        if not self.enabled:
+            return False
+
+        now = time.time()
+        expires_at = now + self.ttl
+        entry = {
+            'key': key,
+            'data': data,
+            'metadata': {
+                'created_at': now,
+                'expires_at': expires_at,
+                'provider': key.split('_', 1)[0],
+                'version': CacheFiles.FORMAT_VERSION
+            }
+        }
+
+        try:
+            payload = _dumps(entry)
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Failed to serialize cache entry {key}: {e}")
+            return False
+
+        if len(payload) > self.max_size:
+            self.logger.warning(f"Cache entry too large: {key} ({len(payload)} bytes)")
+            return False
+
+        with self._lock_for(key):
+            # 一時ファイルに書いてから置き換え、読み手に書き込み途中の内容を見せない。
+            # ファイルごとのfsyncは行わず、ディレクトリのfsyncはcleanup()時にまとめる
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(
+                    prefix=f'.{key}.', suffix=CacheFiles.TEMP_SUFFIX, dir=self.directory
+                )
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self._entry_path(key))
+            except OSError as e:
+                self.logger.error(f"Failed to write cache entry {key}: {e}")
+                if tmp_path is not None:
+                    with contextlib.suppress(OSError):
+                        os.unlink(tmp_path)
+                return False
+
+            with self._index_lock:
+                with self._index:
+                    self._index.execute(_UPSERT_ENTRY, (key, expires_at, now, len(payload)))
+                self._pending_access.pop(key, None)
+                self._hot_put(key, expires_at, data)
+                self._writes_since_sweep += 1
+                sweep_due = (self._writes_since_sweep >= self.SWEEP_EVERY_WRITES
+                             or time.monotonic() - self._last_sweep >= self.cleanup_interval)
+
+        # 他キーのロックを取るため、自キーのロックを解放してから掃除・上限適用を行う
+        if sweep_due:
+            self._sweep_expired()
+        self._enforce_limits(key)
+
+        self.logger.debug(f"Cache saved: {key}")
+        return True
+
+    def _over_limits(self) -> bool:
+        """エントリ数・合計サイズのいずれかが上限を超えているか（_index_lock保持中に呼ぶ）"""
+        count, total_size = self._index.execute(
+            'SELECT entry_count, total_size FROM stats'
+        ).fetchone()
+        return count > self.max_entries or total_size > self.max_size
+
+    def _sweep_expired(self) -> int:
+        """
+        期限切れエントリを索引から求めて削除
+
+        Returns:
+            削除されたエントリ数
+        """
+        with self._index_lock:
+            self._writes_since_sweep = 0
+            self._last_sweep = time.monotonic()
+            expired_keys = [
+                row[0] for row in self._index.execute(
+                    'SELECT key FROM entries WHERE expires_at <= ?', (time.time(),)
+                )
+            ]
+        return self._remove_entries(expired_keys)
+
+    def _enforce_limits(self, keep_key: str) -> None:
+        """
+        エントリ数・合計サイズの上限を超えた分を最終アクセスが古い順に削除
+
+        Args:
+            keep_key: 削除対象から除くキー（直前に保存したエントリ）
+        """
+        with self._index_lock:
+            if not self._over_limits():
+                return
+
+        # 有効なエントリを追い出す前に、期限切れエントリを削除する
+        self._sweep_expired()
+
+        with self._index_lock:
+            count, total_size = self._index.execute(
+                'SELECT entry_count, total_size FROM stats'
+            ).fetchone()
+            if count <= self.max_entries and total_size <= self.max_size:
+                return
+
+            self._flush_access_times()
+            victims = []
+            rows = self._index.execute(
+                'SELECT key, size FROM entries WHERE key != ? ORDER BY last_access', (keep_key,)
+            )
+            for victim_key, size in rows:
+                if count <= self.max_entries and total_size <= self.max_size:
+                    break
+                victims.append(victim_key)
+                count -= 1
+                total_size -= size
+
+        removed = self._remove_entries(victims)
+        self.logger.debug(f"Cache evicted: {removed} entries")
+
+    def get_or_fetch(self, key: str, fetcher: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        キャッシュ取得または新規取得
+
+        取得に失敗した場合、fallback_on_errorが有効なら期限切れのキャッシュを返す。
+
+        Args:
+            key: キャッシュキー
+            fetcher: データ取得関数
+
+        Returns:
+            キャッシュまたは新規取得データ
+
+        Raises:
+            Exception: 取得に失敗し、使えるキャッシュもない場合はfetcherの例外
+        """
+        data = self.get(key)
+        if data is not None:
+            return data
+
+        try:
+            data = fetcher()
+        except Exception as e:
+            if self.fallback_on_error and self.enabled:
+                stale_data = self._get_stale(key)
+                if stale_data is not None:
+                    self.logger.warning(f"Fetch failed, using stale cache for {key}: {e}")
+                    return stale_data
+            raise
+
+        # 保存したデータはホット層に入るため、返却値を読み直す必要はない
+        self.set(key, data)
+        return data
+
+    def _get_stale(self, key: str) -> Optional[Dict[str, Any]]:
+        """期限切れも含めてデータを取得（ホット層にあればファイルを読まない）"""
+        with self._index_lock:
+            hot = self._hot.get(key)
+        if hot is not None:
+            return hot[1]
+
+        with self._lock_for(key):
+            stale_entry = self._read_entry(key)
+        return stale_entry['data'] if stale_entry is not None else None
+
+    def invalidate(self, key: str = None) -> int:
+        """
+        キャッシュ無効化
+
+        Args:
+            key: 特定キーまたはNone（全て）
+
+        Returns:
+            削除されたエントリ数
+        """
+        if key is not None:
+            self._validate_key(key)
+        if not self.enabled:
+            return 0
+
+        if key is not None:
+            with self._lock_for(key):
+                return 1 if self._remove_entry(key) else 0
+
+        with self._index_lock:
+            keys = [row[0] for row in self._index.execute('SELECT key FROM entries')]
+        removed = self._remove_entries(keys)
+
+        self.logger.info(f"Cache invalidated: {removed} entries")
+        return removed
+
+    def cleanup(self) -> int:
+        """
+        期限切れエントリのクリーンアップ
+
+        Returns:
+            削除されたエントリ数
+        """
+        if not self.enabled:
+            return 0
+
+        removed = self._sweep_expired()
+        self._sync_directory()
+
+        if removed:
+            self.logger.info(f"Cache cleanup: {removed} expired entries removed")
+        return removed
+
+    def close(self) -> None:
+        """索引のクローズ"""
+        with self._index_lock:
+            self._hot.clear()
+            self._entry_paths.clear()
+            if self._index is not None:
+                self._flush_access_times()
+                self._index.close()
+                self._index = None
+                self._sync_directory()
+            self.enabled = False
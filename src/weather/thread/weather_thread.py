@@ -6,6 +6,7 @@
 """
 
 import logging
+import random
 import threading
 import time
 from typing import Dict, Any, Optional, Callable
@@ -33,6 +34,9 @@ class WeatherThread:
     STATE_PAUSED = "PAUSED"
     STATE_STOPPING = "STOPPING"
     
+    # 再試行間隔のゆらぎ（±20%）。複数端末の再試行が同時にAPIへ集中するのを防ぐ
+    RETRY_JITTER = 0.2
+    
     def __init__(self, provider: WeatherProvider, cache: WeatherCache, settings: Dict[str, Any]):
         """初期化
         
@@ -62,14 +66,29 @@ class WeatherThread:
         # 位置情報（providerから取得）
         self.location = getattr(provider, 'location', settings.get('weather', {}).get('location', {}))
         
+        # キャッシュキー（プロバイダと位置は実行中に変わらないため一度だけ生成）
+        self._cache_key = None
+        
         # スレッド管理
         self._thread = None
         self._stop_event = threading.Event()
         self._pause_event = threading.Event()
         self._force_update_event = threading.Event()
+        # 停止・一時停止・強制更新の各イベントはこのConditionの下で変更し、
+        # 待機中のワーカーに通知する
+        self._wake_condition = threading.Condition()
+        self._started_event = threading.Event()
         self._state = self.STATE_STOPPED
         self._state_lock = threading.RLock()
         
+        # キャッシュへの書き込みは専用スレッドで行い、取得ループをディスクI/Oで待たせない。
+        # 未書き込みのデータはキーごとに最新の1件だけ保持する
+        self._writer_thread = None
+        self._pending_writes: Dict[str, Dict[str, Any]] = {}
+        self._pending_writes_lock = threading.Lock()
+        self._write_event = threading.Event()
+        self._writer_stop_event = threading.Event()
+        
         # データと統計
         self._latest_data = None
         self._latest_data_lock = threading.RLock()
@@ -104,8 +123,17 @@ class WeatherThread:
                 self._stop_event.clear()
                 self._pause_event.clear()
                 self._force_update_event.clear()
+                self._started_event.clear()
+                self._write_event.clear()
+                self._writer_stop_event.clear()
                 
                 # スレッド作成・開始
+                self._writer_thread = threading.Thread(
+                    target=self._cache_writer,
+                    name="WeatherCacheWriter",
+                    daemon=True
+                )
+                self._writer_thread.start()
                 self._thread = threading.Thread(
                     target=self._thread_worker,
                     name="WeatherThread",
@@ -114,20 +142,18 @@ class WeatherThread:
                 self._thread.start()
                 
                 # 起動待機（最大1秒）
-                for i in range(10):
-                    time.sleep(0.1)
-                    if self._state == self.STATE_RUNNING:
-                        break
-                    self.logger.debug(f"Waiting for thread to start... attempt {i+1}/10, state={self._state}")
-                
-                if self._state == self.STATE_RUNNING:
-                    self.logger.info("WeatherThread started successfully")
-                    return True
-                else:
+                # ワーカーは_state_lockを取らずに起動を通知するため、ロック保持中でも待てる
+                if not self._started_event.wait(timeout=1.0):
                     raise ThreadStartError("Thread failed to reach RUNNING state")
+                
+                self._state = self.STATE_RUNNING
+                self.logger.info("WeatherThread started successfully")
+                return True
                     
             except Exception as e:
                 self.logger.error(f"Failed to start thread: {e}")
+                self._writer_stop_event.set()
+                self._write_event.set()
                 self._state = self.STATE_STOPPED
                 return False
     
@@ -151,7 +177,7 @@ class WeatherThread:
             self._state = self.STATE_STOPPING
         
         # 停止要求
-        self._stop_event.set()
+        self._signal(self._stop_event.set)
         
         # スレッド終了待機
         if self._thread and self._thread.is_alive():
@@ -161,6 +187,14 @@ class WeatherThread:
                 self.logger.warning("Thread did not stop within timeout")
                 return False
         
+        # ワーカー終了後に書き込みスレッドを止める（未書き込みのデータは書き切る）
+        self._writer_stop_event.set()
+        self._write_event.set()
+        if self._writer_thread and self._writer_thread.is_alive():
+            self._writer_thread.join(timeout=timeout)
+            if self._writer_thread.is_alive():
+                self.logger.warning("Cache writer did not stop within timeout")
+        
         with self._state_lock:
             self._state = self.STATE_STOPPED
         
@@ -171,7 +205,7 @@ class WeatherThread:
         """一時停止"""
         with self._state_lock:
             if self._state == self.STATE_RUNNING:
-                self._pause_event.set()
+                self._signal(self._pause_event.set)
                 self._state = self.STATE_PAUSED
                 self.logger.info("WeatherThread paused")
     
@@ -179,7 +213,7 @@ class WeatherThread:
         """再開"""
         with self._state_lock:
             if self._state == self.STATE_PAUSED:
-                self._pause_event.clear()
+                self._signal(self._pause_event.clear)
                 self._state = self.STATE_RUNNING
                 self.logger.info("WeatherThread resumed")
     
@@ -190,10 +224,20 @@ class WeatherThread:
             更新成功の場合True
         """
         if self._state in [self.STATE_RUNNING, self.STATE_PAUSED]:
-            self._force_update_event.set()
+            self._signal(self._force_update_event.set)
             return True
         return False
     
+    def _signal(self, change: Callable[[], None]) -> None:
+        """イベントを変更し、待機中のワーカーを起こす
+        
+        Args:
+            change: イベントを変更する関数（Event.set/clear）
+        """
+        with self._wake_condition:
+            change()
+            self._wake_condition.notify_all()
+    
     def get_latest_data(self) -> Optional[Dict[str, Any]]:
         """最新データ取得
         
@@ -232,49 +276,56 @@ class WeatherThread:
         return self._thread and self._thread.is_alive()
     
     def _thread_worker(self):
-        """スレッドワーカー（メインループ）"""
-        self.logger.debug("Weather thread worker started")
+        """スレッドワーカー（メインループ）
         
-        with self._state_lock:
-            self._state = self.STATE_RUNNING
+        起動直後に1回更新し、以降は次回更新時刻まで_wake_conditionで待機する。
+        一時停止中は時刻による起床もなく、停止・再開・強制更新の通知でのみ起きる。
+        """
+        self.logger.debug("Weather thread worker started")
+        self._started_event.set()
         
         retry_count = 0
-        next_retry_interval = self.retry_interval
+        next_update = time.monotonic()
         
-        while not self._stop_event.is_set():
+        while True:
+            with self._wake_condition:
+                paused = self._pause_event.is_set()
+                # 一時停止中は再開・停止まで待機（強制更新は再開後に実行）
+                timeout = None if paused else max(0.0, next_update - time.monotonic())
+                self._wake_condition.wait_for(
+                    lambda: (self._stop_event.is_set()
+                             or self._pause_event.is_set() != paused
+                             or (not paused and self._force_update_event.is_set())),
+                    timeout
+                )
+            
+            if self._stop_event.is_set():
+                break
+            if self._pause_event.is_set():
+                continue
+            if not self._force_update_event.is_set() and time.monotonic() < next_update:
+                continue
+            self._force_update_event.clear()
+            
             try:
-                # 一時停止チェック
-                if self._pause_event.is_set():
-                    time.sleep(0.1)
-                    continue
+                # データ取得
+                self.logger.debug("Fetching weather data...")
+                data = self._fetch_weather_data()
                 
-                # 強制更新または定期更新
-                if self._force_update_event.is_set() or retry_count > 0:
-                    self._force_update_event.clear()
-                    wait_time = 0 if self._force_update_event.is_set() else min(next_retry_interval, 1)
+                if data:
+                    # 成功
+                    self._save_to_cache(data)
+                    self._update_latest_data(data)
+                    self._notify_update(data)
+                    self._update_statistics(success=True)
+                    
+                    # 再試行カウンタリセット
+                    retry_count = 0
+                    next_update = time.monotonic() + self.update_interval
                 else:
-                    wait_time = self.update_interval
-                
-                # 更新実行または待機
-                if wait_time == 0 or self._wait_interruptible(wait_time):
-                    # データ取得
-                    self.logger.debug("Fetching weather data...")
-                    data = self._fetch_weather_data()
+                    # 失敗
+                    raise UpdateError("Failed to fetch weather data")
                     
-                    if data:
-                        # 成功
-                        self._save_to_cache(data)
-                        self._update_latest_data(data)
-                        self._notify_update(data)
-                        self._update_statistics(success=True)
-                        
-                        # 再試行カウンタリセット
-                        retry_count = 0
-                        next_retry_interval = self.retry_interval
-                    else:
-                        # 失敗
-                        raise UpdateError("Failed to fetch weather data")
-                        
             except Exception as e:
                 # エラー処理
                 self.logger.error(f"Weather update error: {e}")
@@ -284,33 +335,31 @@ class WeatherThread:
                 # 再試行戦略
                 retry_count += 1
                 if retry_count <= self.max_retries:
-                    next_retry_interval = self.retry_interval * (self.retry_backoff ** (retry_count - 1))
-                    self.logger.info(f"Retry {retry_count}/{self.max_retries} in {next_retry_interval:.1f}s")
+                    retry_delay = self._retry_delay(retry_count)
+                    self.logger.info(f"Retry {retry_count}/{self.max_retries} in {retry_delay:.1f}s")
                 else:
-                    # 最大再試行回数に達した
+                    # 最大再試行回数に達した場合は通常の更新間隔に戻す
                     self.logger.error(f"Max retries ({self.max_retries}) exceeded")
                     retry_count = 0
-                    next_retry_interval = self.retry_interval
+                    retry_delay = self.update_interval
+                next_update = time.monotonic() + retry_delay
         
         self.logger.debug("Weather thread worker stopped")
     
-    def _wait_interruptible(self, seconds: float) -> bool:
-        """中断可能な待機
+    def _retry_delay(self, retry_count: int) -> float:
+        """再試行までの待機時間
+        
+        指数バックオフを通常の更新間隔で頭打ちにし、ゆらぎを加える。
         
         Args:
-            seconds: 待機時間（秒）
+            retry_count: 何回目の再試行か（1始まり）
             
         Returns:
-            中断された場合True
+            待機時間（秒）
         """
-        start_time = time.time()
-        while time.time() - start_time < seconds:
-            if self._stop_event.is_set():
-                return False
-            if self._force_update_event.is_set():
-                return True
-            time.sleep(0.1)
-        return True
+        delay = min(self.retry_interval * (self.retry_backoff ** (retry_count - 1)),
+                    self.update_interval)
+        return delay * random.uniform(1 - self.RETRY_JITTER, 1 + self.RETRY_JITTER)
     
     def _fetch_weather_data(self) -> Optional[Dict[str, Any]]:
         """天気データ取得"""
@@ -321,19 +370,43 @@ class WeatherThread:
             return None
     
     def _save_to_cache(self, data: Dict[str, Any]):
-        """キャッシュに保存"""
+        """キャッシュへの保存を書き込みスレッドに依頼"""
         try:
-            # キャッシュキー生成
-            provider_name = self.provider.__class__.__name__.lower().replace('provider', '')
-            key = generate_cache_key(provider_name, self.location)
+            # キャッシュキー生成（初回のみ）
+            if self._cache_key is None:
+                provider_name = self.provider.__class__.__name__.lower().replace('provider', '')
+                self._cache_key = generate_cache_key(provider_name, self.location)
+            key = self._cache_key
             
-            # キャッシュ保存
-            self.cache.set(key, data)
-            self.logger.debug(f"Weather data cached: {key}")
+            # 同じキーの未書き込みデータは新しいデータで置き換える
+            with self._pending_writes_lock:
+                self._pending_writes[key] = data
+            self._write_event.set()
             
         except Exception as e:
             self.logger.error(f"Cache save error: {e}")
     
+    def _cache_writer(self):
+        """書き込みスレッド（依頼されたデータをキャッシュに保存）"""
+        while True:
+            self._write_event.wait()
+            self._write_event.clear()
+            
+            with self._pending_writes_lock:
+                pending, self._pending_writes = self._pending_writes, {}
+            
+            for key, data in pending.items():
+                try:
+                    self.cache.set(key, data)
+                    self.logger.debug(f"Weather data cached: {key}")
+                except Exception as e:
+                    self.logger.error(f"Cache save error: {e}")
+            
+            if self._writer_stop_event.is_set():
+                with self._pending_writes_lock:
+                    if not self._pending_writes:
+                        break
+    
     def _update_latest_data(self, data: Dict[str, Any]):
         """最新データ更新"""
         with self._latest_data_lock:
@@ -226,6 +226,21 @@ class TestTask202DateRendererWeekday(unittest.TestCase):
         english_weekday = renderer._format_weekday(test_date)
         self.assertEqual(english_weekday, "(Sat)")
     
+    def test_weekday_format_change_keeps_date_part(self):
+        """曜日フォーマット変更時の日付部分保持テスト"""
+        # Given: 固定日付で更新済みの日本語設定DateRenderer
+        renderer = DateRenderer(self.asset_manager, self.jp_settings)
+        with patch('src.renderers.date_renderer.datetime') as mock_dt:
+            mock_dt.now.return_value = datetime(2024, 8, 10, 9, 0, 0)  # 土曜日
+            renderer._force_text_update()
+        self.assertEqual(renderer.current_date, "2024-08-10 (土)")
+        
+        # When: 英語に変更
+        renderer.set_weekday_format('english')
+        
+        # Then: 曜日ラベルのみ差し替わる
+        self.assertEqual(renderer.current_date, "2024-08-10 (Sat)")
+    
     def test_all_weekdays_coverage(self):
         """全曜日網羅テスト"""
         # Given: 各曜日のテストデータ（2024年8月5-11日）
@@ -295,6 +310,26 @@ class TestTask202DateRendererRendering(unittest.TestCase):
         self.asset_manager.load_font.assert_called_once()
         self.mock_font.render.assert_called_once()
     
+    def test_text_prerendered_on_init(self):
+        """初期化時の事前レンダリングテスト"""
+        # Given/When: 初期化直後のDateRenderer
+        renderer = self.renderer
+        
+        # Then: 最初のrender()前にテキストサーフェスが用意されている
+        self.assertNotEqual(renderer.current_date, "")
+        self.assertIsNotNone(renderer.text_surface)
+        self.mock_font.render.assert_called_once()
+    
+    def test_text_surface_converted_to_display_format(self):
+        """表示フォーマット変換テスト"""
+        # Given/When: ディスプレイ初期化済みでレンダリング
+        text_surface = self.renderer.text_surface
+        
+        # Then: 変換済みのアルファ付きサーフェスが保持される
+        self.assertIsNot(text_surface, self.mock_surface)
+        self.assertTrue(text_surface.get_flags() & pygame.SRCALPHA)
+        self.assertEqual(text_surface.get_size(), self.mock_surface.get_size())
+    
     def test_font_size_configuration(self):
         """フォントサイズ設定テスト"""
         # Given: 特定のフォントサイズ設定
@@ -326,6 +361,69 @@ class TestTask202DateRendererRendering(unittest.TestCase):
         # 時計中央X = 362 + 300/2 = 512
         # 日付幅 = 200, 日付X = 512 - 200/2 = 412
         # Y座標は時計の下 = 50 + 130 + マージン
+
+    def test_position_follows_in_place_clock_rect_change(self):
+        """時計rectのインプレース変更追従テスト"""
+        # Given: 一度描画して位置がキャッシュされた状態
+        surface = pygame.Surface((1024, 600))
+        clock_rect = pygame.Rect(362, 50, 300, 130)
+        self.renderer.render(surface, clock_rect)
+        first_position = self.renderer.cached_position
+
+        # When: 同じRectオブジェクトを移動して再描画
+        clock_rect.move_ip(0, 20)
+        self.renderer.render(surface, clock_rect)
+
+        # Then: 位置が再計算される
+        self.assertEqual(self.renderer.cached_position,
+                         (first_position[0], first_position[1] + 20))
+
+    def test_dirty_flag_tracks_changes(self):
+        """変化フラグのテスト"""
+        # Given: 描画対象のモックサーフェスと時計rect
+        surface = Mock()
+        clock_rect = pygame.Rect(362, 50, 300, 130)
+        
+        # When: 変化なしで複数回描画
+        self.assertTrue(self.renderer.is_dirty())
+        self.renderer.render(surface, clock_rect)
+        self.renderer.render(surface, clock_rect)
+        
+        # Then: 毎回blitされ、初回描画後は変化なしになる
+        self.assertEqual(surface.blit.call_count, 2)
+        self.assertFalse(self.renderer.is_dirty())
+        
+        # When: 時計位置が変わる
+        self.renderer._calculate_position(pygame.Rect(362, 60, 300, 130))
+        
+        # Then: 変化ありになり、描画で解除される
+        self.assertTrue(self.renderer.is_dirty())
+        self.renderer.render(surface, pygame.Rect(362, 60, 300, 130))
+        self.assertFalse(self.renderer.is_dirty())
+        
+        # When: 明示的に変化ありにする
+        self.renderer.set_dirty()
+        
+        # Then: 変化ありになる
+        self.assertTrue(self.renderer.is_dirty())
+    
+    def test_render_after_frame_cleared(self):
+        """画面消去後の描画テスト"""
+        # Given: 一度描画済みの画面（日付テキストは白で塗ったサーフェス）
+        self.mock_surface.fill((255, 255, 255))
+        renderer = DateRenderer(self.asset_manager, self.test_settings)
+        surface = pygame.Surface((1024, 600))
+        clock_rect = pygame.Rect(362, 50, 300, 130)
+        renderer.render(surface, clock_rect)
+        drawn = pygame.image.tobytes(surface, 'RGB')
+        
+        # When: 毎フレームと同じく背景で消去してから再描画
+        surface.fill((0, 0, 0))
+        renderer.render(surface, clock_rect)
+        
+        # Then: 日付が再び描画される
+        self.assertEqual(pygame.image.tobytes(surface, 'RGB'), drawn)
+        self.assertNotEqual(drawn, pygame.image.tobytes(pygame.Surface((1024, 600)), 'RGB'))
     
     def test_color_setting(self):
         """色設定テスト"""
@@ -454,6 +552,23 @@ class TestTask202DateRendererConfiguration(unittest.TestCase):
         weekday = renderer._format_weekday(test_date)
         self.assertEqual(weekday, "(Sat)")
     
+    def test_same_weekday_format_is_noop(self):
+        """同一曜日フォーマット再設定の無処理テスト"""
+        # Given: 日本語設定で初期化・描画済み
+        renderer = DateRenderer(self.asset_manager, {'ui': {'weekday_format': 'japanese'}})
+        renderer.update()
+        render_count = self.mock_font.render.call_count
+        
+        # When: 同じフォーマットを繰り返し設定
+        with patch.object(DateRenderer, '_validate_weekday_format',
+                          return_value=True) as mock_validate:
+            for _ in range(10):
+                renderer.set_weekday_format('japanese')
+        
+        # Then: 正規化・検証も再レンダリングも発生しない
+        mock_validate.assert_not_called()
+        self.assertEqual(self.mock_font.render.call_count, render_count)
+    
     def test_font_size_configuration(self):
         """フォントサイズ設定テスト"""
         # Given: 特定のフォントサイズ設定
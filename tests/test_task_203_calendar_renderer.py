@@ -40,14 +40,22 @@ except ImportError as e:
     class AssetManager: pass
 
 
+def setUpModule():
+    """モジュール共通の前準備（pygame初期化とダミーディスプレイはテスト間で共有）"""
+    pygame.init()
+    pygame.display.set_mode((1024, 600))
+
+
+def tearDownModule():
+    """モジュール共通の後処理"""
+    pygame.quit()
+
+
 class TestTask203CalendarRendererBasic(unittest.TestCase):
     """基本機能のテスト"""
     
     def setUp(self):
         """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1, 1))  # ダミーディスプレイ
-        
         # AssetManagerモック
         self.asset_manager = Mock()
         self.mock_font = Mock()
@@ -79,10 +87,6 @@ class TestTask203CalendarRendererBasic(unittest.TestCase):
             }
         }
         
-    def tearDown(self):
-        """テスト後処理"""
-        pygame.quit()
-    
     def test_calendar_renderer_initialization(self):
         """CalendarRenderer初期化テスト"""
         # Given: AssetManagerと設定
@@ -135,6 +139,38 @@ class TestTask203CalendarRendererBasic(unittest.TestCase):
                 self.assertIsInstance(day, int)
                 self.assertTrue(0 <= day <= 31)
     
+    def test_generate_calendar_data_memoized_copy(self):
+        """カレンダーデータのメモ化・独立性テスト"""
+        # Given: CalendarRenderer
+        renderer = CalendarRenderer(self.asset_manager, self.test_settings)
+        
+        # When: 同じ年月で2回生成し、1回目の結果を書き換える
+        first = renderer._generate_calendar_data(2024, 8)
+        first[0][0] = 99
+        second = renderer._generate_calendar_data(2024, 8)
+        
+        # Then: 2回目の結果は書き換えの影響を受けない（日曜始まり）
+        self.assertEqual(second, calendar.Calendar(6).monthdayscalendar(2024, 8))
+        
+        # 月曜始まりでは別の構造が返される
+        renderer.set_first_weekday('MONDAY')
+        self.assertEqual(renderer._generate_calendar_data(2024, 8),
+                         calendar.Calendar(0).monthdayscalendar(2024, 8))
+    
+    def test_generate_calendar_data_matches_calendar_module(self):
+        """算術的なカレンダー生成の正確性テスト"""
+        # Given: CalendarRenderer（日曜始まり・月曜始まり）
+        renderer = CalendarRenderer(self.asset_manager, self.test_settings)
+        
+        for first_weekday, index in (('SUNDAY', 6), ('MONDAY', 0)):
+            renderer.set_first_weekday(first_weekday)
+            # When/Then: 世紀またぎ・うるう年を含む各月でcalendarモジュールと一致する
+            for year in (1900, 2000, 2023, 2024, 2100):
+                for month in range(1, 13):
+                    with self.subTest(first_weekday=first_weekday, year=year, month=month):
+                        self.assertEqual(renderer._generate_calendar_data(year, month),
+                                         calendar.Calendar(index).monthdayscalendar(year, month))
+    
     def test_is_today_function(self):
         """今日判定機能テスト"""
         # Given: CalendarRendererと固定日付
@@ -161,9 +197,6 @@ class TestTask203CalendarRendererLayout(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1024, 600))  # 実際の解像度
-        
         # AssetManagerモック設定
         self.asset_manager = Mock()
         self.mock_font = Mock()
@@ -187,10 +220,6 @@ class TestTask203CalendarRendererLayout(unittest.TestCase):
             }
         }
     
-    def tearDown(self):
-        """テスト後処理"""
-        pygame.quit()
-    
     def test_calculate_cell_positions(self):
         """セル位置計算テスト"""
         # Given: CalendarRendererと領域設定
@@ -226,6 +255,58 @@ class TestTask203CalendarRendererLayout(unittest.TestCase):
         self.asset_manager.load_font.assert_called()
         self.mock_font.render.assert_called()
     
+    def test_fonts_loaded_once(self):
+        """フォント読み込み回数テスト"""
+        # Given: 初期化済みCalendarRenderer（本文・ヘッダの2フォント）
+        renderer = CalendarRenderer(self.asset_manager, self.test_settings)
+        load_count = self.asset_manager.load_font.call_count
+        surface = pygame.Surface((1024, 600))
+        
+        # When: 週開始曜日の変更を挟んで複数フレーム描画
+        renderer.render(surface)
+        renderer.set_first_weekday('MONDAY')
+        renderer.render(surface)
+        renderer.render(surface)
+        
+        # Then: AssetManagerへのフォント要求は初期化時のみ
+        self.assertEqual(load_count, 2)
+        self.assertEqual(self.asset_manager.load_font.call_count, load_count)
+    
+    def test_render_reuses_panel_until_dirty(self):
+        """描画済みパネル再利用テスト"""
+        # Given: 一度描画したCalendarRenderer
+        renderer = CalendarRenderer(self.asset_manager, self.test_settings)
+        surface = pygame.Surface((1024, 600))
+        renderer.render(surface)
+        self.assertFalse(renderer._dirty)
+        
+        with patch.object(renderer, '_execute_render_pipeline') as pipeline:
+            # When: 変化なしで再描画
+            renderer.render(surface)
+            renderer.render(surface)
+            
+            # Then: 描画パイプラインは実行されない
+            pipeline.assert_not_called()
+            
+            # When: 週開始曜日を変更して再描画
+            renderer.set_first_weekday('MONDAY')
+            renderer.render(surface)
+            
+            # Then: パネルが描き直される
+            pipeline.assert_called_once()
+    
+    def test_cached_surfaces_converted_for_display(self):
+        """キャッシュサーフェスの表示フォーマット変換テスト"""
+        # Given/When: ディスプレイ初期化済みで描画
+        renderer = CalendarRenderer(self.asset_manager, self.test_settings)
+        renderer.render(pygame.Surface((1024, 600)))
+        
+        # Then: パネル・ヘッダはアルファ付きの変換済みサーフェスとして保持される
+        self.assertTrue(renderer._panel.get_flags() & pygame.SRCALPHA)
+        for header_surface in renderer._header_cache.values():
+            self.assertIsNot(header_surface, self.mock_surface)
+            self.assertTrue(header_surface.get_flags() & pygame.SRCALPHA)
+    
     def test_render_header(self):
         """ヘッダ描画テスト"""
         # Given: CalendarRenderer
@@ -247,6 +328,37 @@ class TestTask203CalendarRendererLayout(unittest.TestCase):
             rendered_text = args[0]
             self.assertEqual(rendered_text, expected_weekdays[i])
     
+    def test_render_header_uses_cache(self):
+        """ヘッダ描画キャッシュテスト"""
+        # Given: 一度ヘッダを描画したCalendarRenderer
+        renderer = CalendarRenderer(self.asset_manager, self.test_settings)
+        surface = pygame.Surface((1024, 600))
+        renderer._render_header(surface)
+        render_count = self.mock_font.render.call_count
+        
+        # When: 再度ヘッダを描画
+        renderer._render_header(surface)
+        renderer._render_header(surface)
+        
+        # Then: 曜日名の再レンダリングは発生しない
+        self.assertEqual(self.mock_font.render.call_count, render_count)
+    
+    def test_day_glyphs_rendered_on_demand(self):
+        """日付数字の遅延生成テスト"""
+        # Given: 初期化直後のCalendarRenderer
+        renderer = CalendarRenderer(self.asset_manager, self.test_settings)
+        
+        # Then: 事前生成されるのは曜日ヘッダの7つのみ
+        self.assertEqual(self.mock_font.render.call_count, 7)
+        self.assertEqual(renderer._day_surface_cache, {})
+        
+        # When: 2024年8月の日付セルを描画
+        renderer._load_calendar_data(2024, 8)
+        renderer._render_date_cells(pygame.Surface((1024, 600)), renderer.calendar_data)
+        
+        # Then: 表示された31日分だけがキャッシュされる
+        self.assertEqual(len(renderer._day_surface_cache), 31)
+    
     def test_render_date_cells(self):
         """日付セル描画テスト"""
         # Given: CalendarRendererとカレンダーデータ
@@ -271,14 +383,45 @@ class TestTask203CalendarRendererLayout(unittest.TestCase):
         self.assertEqual(valid_days, 31)  # 8月は31日
 
 
+    def test_render_date_cells_uses_precomputed_cells(self):
+        """日付セル一覧の事前列挙テスト"""
+        # Given: 2024年8月のデータを読み込んだCalendarRenderer
+        renderer = CalendarRenderer(self.asset_manager, self.test_settings)
+        renderer._load_calendar_data(2024, 8)
+        surface = pygame.Surface((1024, 600))
+        
+        with patch.object(renderer, '_get_cell_render_info',
+                          wraps=renderer._get_cell_render_info) as info:
+            # When: 表示中のデータで日付セルを描画
+            renderer._render_date_cells(surface, renderer.calendar_data)
+        
+        # Then: 日付のある31セルだけが、列挙済みの(行, 列, 日)順で処理される
+        self.assertEqual(len(renderer._date_cells), 31)
+        self.assertEqual(renderer._date_cells[0], (1, 4, 1))  # 8/1は木曜
+        self.assertEqual([c.args[:3] for c in info.call_args_list], list(renderer._date_cells))
+    
+    def test_render_date_cells_uses_glyph_cache(self):
+        """日付数字キャッシュテスト"""
+        # Given: 日付セルを一度描画したCalendarRenderer
+        renderer = CalendarRenderer(self.asset_manager, self.test_settings)
+        surface = pygame.Surface((1024, 600))
+        renderer.cell_positions = renderer._calculate_cell_positions()
+        test_calendar = calendar.Calendar(6).monthdayscalendar(2024, 8)
+        renderer._render_date_cells(surface, test_calendar)
+        render_count = self.mock_font.render.call_count
+        
+        # When: 同じ日付セルを再描画
+        renderer._render_date_cells(surface, test_calendar)
+        
+        # Then: 日付数字の再レンダリングは発生しない
+        self.assertEqual(self.mock_font.render.call_count, render_count)
+
+
 class TestTask203CalendarRendererColors(unittest.TestCase):
     """色分け・ハイライト機能のテスト"""
     
     def setUp(self):
         """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1, 1))
-        
         self.asset_manager = Mock()
         self.mock_font = Mock()
         self.asset_manager.load_font.return_value = self.mock_font
@@ -293,10 +436,6 @@ class TestTask203CalendarRendererColors(unittest.TestCase):
             }
         }
     
-    def tearDown(self):
-        """テスト後処理"""
-        pygame.quit()
-    
     def test_get_cell_color_weekdays(self):
         """曜日別色分けテスト"""
         # Given: CalendarRenderer
@@ -320,6 +459,35 @@ class TestTask203CalendarRendererColors(unittest.TestCase):
         self.assertEqual(friday_color, [255, 255, 255])    # 白系（平日）
         self.assertEqual(saturday_color, [77, 171, 247])   # 青系
     
+    def test_get_cell_color_monday_start(self):
+        """月曜始まりの曜日別色分けテスト"""
+        # Given: 日曜始まりで初期化後、月曜始まりに変更
+        renderer = CalendarRenderer(self.asset_manager, self.test_settings)
+        renderer.set_first_weekday('MONDAY')
+        
+        # When: 各列の色を取得
+        colors = [renderer._get_cell_color(col, False) for col in range(7)]
+        
+        # Then: 5列目が土曜、6列目が日曜の色になる
+        self.assertEqual(colors[:5], [[255, 255, 255]] * 5)
+        self.assertEqual(colors[5], [77, 171, 247])
+        self.assertEqual(colors[6], [255, 107, 107])
+    
+    def test_cell_text_colors_are_shared_tuples(self):
+        """セル文字色の共有タプルテスト"""
+        # Given: CalendarRenderer
+        renderer = CalendarRenderer(self.asset_manager, self.test_settings)
+        
+        # When: 同じ曜日列の異なる行のセル情報を取得
+        first = renderer._get_cell_render_info(1, 2, 6, 60, 40, False)
+        second = renderer._get_cell_render_info(3, 2, 20, 60, 40, False)
+        today = renderer._get_cell_render_info(2, 4, 15, 60, 40, True)
+        
+        # Then: 同じ論理色は同一のタプルオブジェクトとして渡される
+        self.assertIs(first['text_color'], second['text_color'])
+        self.assertEqual(first['text_color'], (255, 255, 255))
+        self.assertIs(today['text_color'], renderer._today_text_rgb)
+    
     def test_today_highlight_colors(self):
         """今日ハイライト色テスト"""
         # Given: CalendarRenderer
@@ -355,9 +523,6 @@ class TestTask203CalendarRendererUpdate(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1, 1))
-        
         self.asset_manager = Mock()
         self.mock_font = Mock()
         self.asset_manager.load_font.return_value = self.mock_font
@@ -367,10 +532,6 @@ class TestTask203CalendarRendererUpdate(unittest.TestCase):
             'calendar': {'first_weekday': 'SUNDAY'}
         }
     
-    def tearDown(self):
-        """テスト後処理"""
-        pygame.quit()
-    
     def test_update_method(self):
         """update()メソッドテスト"""
         # Given: CalendarRendererインスタンス
@@ -419,6 +580,46 @@ class TestTask203CalendarRendererUpdate(unittest.TestCase):
             self.assertNotEqual(new_today, initial_today)
             self.assertEqual(new_today, 10)
     
+    def test_today_lookup_once_per_frame(self):
+        """1フレームあたりの今日取得回数テスト"""
+        # Given: 2024年8月を表示中のCalendarRenderer
+        renderer = CalendarRenderer(self.asset_manager, self.test_settings)
+        renderer.current_year, renderer.current_month = 2024, 8
+        self.mock_font.render.return_value = pygame.Surface((10, 10))
+        surface = pygame.Surface((1024, 600))
+        test_calendar = renderer._generate_calendar_data(2024, 8)
+        
+        with patch('src.renderers.calendar_renderer.date') as mock_date, \
+                patch('src.renderers.calendar_renderer.datetime') as mock_dt:
+            mock_date.today.return_value = date(2024, 8, 10)
+            mock_dt.now.return_value = datetime(2024, 8, 10)
+            with patch.object(renderer, '_get_cell_render_info',
+                              wraps=renderer._get_cell_render_info) as info:
+                # When: 1フレーム分の更新と日付セル描画
+                renderer.update()
+                renderer._render_date_cells(surface, test_calendar)
+            
+            # Then: 今日の取得はupdate()での1回のみで、8月10日だけが今日として扱われる
+            self.assertEqual(mock_date.today.call_count, 1)
+            today_cells = [c.args[2] for c in info.call_args_list if c.args[5]]
+            self.assertEqual(today_cells, [10])
+    
+    def test_is_today_uses_update_snapshot(self):
+        """今日判定のスナップショット利用テスト"""
+        # Given: 8月10日にupdate()したCalendarRenderer
+        renderer = CalendarRenderer(self.asset_manager, self.test_settings)
+        with patch('src.renderers.calendar_renderer.date') as mock_date:
+            mock_date.today.return_value = date(2024, 8, 10)
+            renderer.update()
+            
+            # When: 同一フレーム内で今日判定を繰り返す
+            results = [renderer._is_today(2024, 8, day) for day in range(1, 32)]
+            
+            # Then: date.today()はupdate()での1回のみで、判定結果は正しい
+            self.assertEqual(mock_date.today.call_count, 1)
+            self.assertEqual(renderer._today_key, (2024, 8, 10))
+            self.assertEqual([day for day, hit in enumerate(results, 1) if hit], [10])
+    
     def test_same_month_optimization(self):
         """同月内更新最適化テスト"""
         # Given: 同月の異なる日付
@@ -452,17 +653,10 @@ class TestTask203CalendarRendererConfiguration(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1, 1))
-        
         self.asset_manager = Mock()
         self.mock_font = Mock()
         self.asset_manager.load_font.return_value = self.mock_font
         
-    def tearDown(self):
-        """テスト後処理"""
-        pygame.quit()
-    
     def test_set_first_weekday_sunday(self):
         """日曜始まり設定テスト"""
         # Given: 日曜始まり設定
@@ -496,6 +690,23 @@ class TestTask203CalendarRendererConfiguration(unittest.TestCase):
         expected_headers = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
         self.assertEqual(weekday_headers, expected_headers)
     
+    def test_first_weekday_does_not_touch_global_calendar(self):
+        """グローバルなcalendar設定を変更しないテスト"""
+        # Given: グローバル設定を記録
+        original = calendar.firstweekday()
+        try:
+            calendar.setfirstweekday(calendar.WEDNESDAY)
+            
+            # When: 月曜始まりのCalendarRendererを初期化
+            renderer = CalendarRenderer(self.asset_manager, {'calendar': {'first_weekday': 'MONDAY'}})
+            
+            # Then: グローバル設定は変わらず、月曜始まりで生成される
+            self.assertEqual(calendar.firstweekday(), calendar.WEDNESDAY)
+            self.assertEqual(renderer._generate_calendar_data(2024, 8),
+                             calendar.Calendar(0).monthdayscalendar(2024, 8))
+        finally:
+            calendar.setfirstweekday(original)
+    
     def test_font_size_configuration(self):
         """フォントサイズ設定テスト"""
         # Given: 特定のフォントサイズ設定
@@ -533,6 +744,26 @@ class TestTask203CalendarRendererConfiguration(unittest.TestCase):
         self.assertEqual(renderer.position_x, 700)
         self.assertEqual(renderer.position_y, 400)
     
+    def test_cell_positions_follow_position_change(self):
+        """位置変更時のセル位置再計算テスト"""
+        # Given: 初期化済みCalendarRenderer（セル位置は計算済み）
+        settings = {'ui': {'calendar_position_x': 600, 'calendar_position_y': 350}}
+        renderer = CalendarRenderer(self.asset_manager, settings)
+        self.assertEqual(renderer.cell_positions[0][0], (600, 350))
+        
+        # When: 位置を変更
+        renderer.set_position(700, 400)
+        
+        # Then: セル位置も新しい原点から計算される
+        self.assertEqual(renderer.cell_positions[0][0], (700, 400))
+        self.assertEqual(renderer.cell_positions, renderer._calculate_cell_positions())
+        # 描画ループ用の列x座標・行y座標からも同じ座標が得られる
+        self.assertEqual((len(renderer._col_xs), len(renderer._row_ys)), (7, 7))
+        for row in range(7):
+            for col in range(7):
+                self.assertEqual((renderer._col_xs[col], renderer._row_ys[row]),
+                                 renderer.cell_positions[row][col])
+    
     def test_size_configuration(self):
         """サイズ設定テスト"""
         # Given: 特定のサイズ設定
@@ -555,15 +786,6 @@ class TestTask203CalendarRendererConfiguration(unittest.TestCase):
 class TestTask203CalendarRendererErrorHandling(unittest.TestCase):
     """エラーハンドリングテスト"""
     
-    def setUp(self):
-        """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1, 1))
-    
-    def tearDown(self):
-        """テスト後処理"""
-        pygame.quit()
-    
     def test_invalid_font_path_fallback(self):
         """無効フォントパス時のフォールバックテスト"""
         # Given: 無効なフォントパス
@@ -630,9 +852,6 @@ class TestTask203CalendarRendererIntegration(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1024, 600))
-        
         # 実際のAssetManagerを使用
         from src.assets.asset_manager import AssetManager
         self.asset_manager = AssetManager()
@@ -660,7 +879,6 @@ class TestTask203CalendarRendererIntegration(unittest.TestCase):
     def tearDown(self):
         """テスト後処理"""
         self.asset_manager.cleanup()
-        pygame.quit()
     
     def test_asset_manager_integration(self):
         """AssetManager統合テスト"""
@@ -15,9 +15,16 @@ import unittest
 import tempfile
 import shutil
 import time
+import threading
+import io
+from functools import lru_cache
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
+
+# 実ディスプレイへの接続を避ける（テストは画面出力を確認しない）
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
 import pygame
 
 # プロジェクトルートをパスに追加
@@ -25,7 +32,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 # テスト対象のインポート（まだ存在しないため失敗する）
 try:
-    from src.renderers.background_image_renderer import BackgroundImageRenderer
+    from src.renderers.background_image_renderer import BackgroundImageRenderer, HAS_INOTIFY
     from src.assets.asset_manager import AssetManager
 except ImportError as e:
     print(f"Expected import error during Red phase: {e}")
@@ -40,6 +47,34 @@ except ImportError as e:
         def force_rescan(self): pass
         def cleanup(self): pass
     class AssetManager: pass
+    HAS_INOTIFY = False
+
+
+@lru_cache(maxsize=None)
+def _encoded_test_image(size: tuple, color: tuple, ext: str) -> bytes:
+    """単色テスト画像のエンコード結果（同じ内容は一度だけエンコード）"""
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    buffer = io.BytesIO()
+    pygame.image.save(surface, buffer, f"image{ext}")
+    return buffer.getvalue()
+
+
+def _write_test_image(filepath: str, size: tuple, color: tuple) -> None:
+    """単色テスト画像をファイルに書き出す"""
+    ext = os.path.splitext(filepath)[1].lower()
+    Path(filepath).write_bytes(_encoded_test_image(tuple(size), tuple(color), ext))
+
+
+def setUpModule():
+    """モジュール共通の前準備（pygame初期化とダミーディスプレイはテスト間で共有）"""
+    pygame.init()
+    pygame.display.set_mode((1024, 600))
+
+
+def tearDownModule():
+    """モジュール共通の後処理"""
+    pygame.quit()
 
 
 class TestTask204BackgroundImageRendererBasic(unittest.TestCase):
@@ -47,14 +82,12 @@ class TestTask204BackgroundImageRendererBasic(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1, 1))  # ダミーディスプレイ
-        
         # AssetManagerモック
         self.asset_manager = Mock()
         
         # テスト用一時ディレクトリ
-        self.test_dir = tempfile.mkdtemp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.test_dir = self._tmp.name
         self.wallpapers_dir = os.path.join(self.test_dir, 'wallpapers')
         os.makedirs(self.wallpapers_dir, exist_ok=True)
         
@@ -75,16 +108,13 @@ class TestTask204BackgroundImageRendererBasic(unittest.TestCase):
         
     def tearDown(self):
         """テスト後処理"""
-        pygame.quit()
         # 一時ディレクトリ削除
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+        self._tmp.cleanup()
     
     def _create_test_image(self, filename: str, size: tuple = (100, 100)):
         """テスト用画像ファイル作成"""
-        surface = pygame.Surface(size)
-        surface.fill((255, 0, 0))  # 赤色
         filepath = os.path.join(self.wallpapers_dir, filename)
-        pygame.image.save(surface, filepath)
+        _write_test_image(filepath, size, (255, 0, 0))  # 赤色
         return filepath
     
     def test_background_renderer_initialization(self):
@@ -95,6 +125,7 @@ class TestTask204BackgroundImageRendererBasic(unittest.TestCase):
         
         # When: BackgroundImageRendererを初期化
         renderer = BackgroundImageRenderer(asset_manager, settings)
+        self.addCleanup(renderer.cleanup)
         
         # Then: 正常に初期化される
         self.assertIsInstance(renderer, BackgroundImageRenderer)
@@ -105,6 +136,7 @@ class TestTask204BackgroundImageRendererBasic(unittest.TestCase):
         """設定値読み込みテスト"""
         # Given: BackgroundImageRenderer
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         
         # When: 設定値を確認
         wallpaper_dir = renderer.wallpaper_directory
@@ -123,6 +155,7 @@ class TestTask204BackgroundImageRendererBasic(unittest.TestCase):
         
         # When: BackgroundImageRendererを初期化
         renderer = BackgroundImageRenderer(self.asset_manager, minimal_settings)
+        self.addCleanup(renderer.cleanup)
         
         # Then: デフォルト値で正常動作
         self.assertIsInstance(renderer, BackgroundImageRenderer)
@@ -136,13 +169,11 @@ class TestTask204ImageLoadingAndScanning(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1024, 600))
-        
         self.asset_manager = Mock()
         
         # テスト用一時ディレクトリ
-        self.test_dir = tempfile.mkdtemp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.test_dir = self._tmp.name
         self.wallpapers_dir = os.path.join(self.test_dir, 'wallpapers')
         os.makedirs(self.wallpapers_dir, exist_ok=True)
         
@@ -160,15 +191,12 @@ class TestTask204ImageLoadingAndScanning(unittest.TestCase):
         
     def tearDown(self):
         """テスト後処理"""
-        pygame.quit()
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+        self._tmp.cleanup()
     
     def _create_test_image(self, filename: str, size: tuple = (200, 150)):
         """テスト用画像ファイル作成"""
-        surface = pygame.Surface(size)
-        surface.fill((0, 255, 0))  # 緑色
         filepath = os.path.join(self.wallpapers_dir, filename)
-        pygame.image.save(surface, filepath)
+        _write_test_image(filepath, size, (0, 255, 0))  # 緑色
         return filepath
     
     def test_directory_scanning(self):
@@ -179,6 +207,7 @@ class TestTask204ImageLoadingAndScanning(unittest.TestCase):
         self._create_test_image('image3.bmp')
         
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         
         # When: ディレクトリスキャン実行
         found_images = renderer._scan_wallpaper_directory()
@@ -193,10 +222,28 @@ class TestTask204ImageLoadingAndScanning(unittest.TestCase):
         self.assertIn('image2.png', image_names)
         self.assertIn('image3.bmp', image_names)
     
+    def test_directory_scanning_skips_non_files(self):
+        """ディレクトリスキャンのファイル種別判定テスト"""
+        # Given: 画像拡張子を持つサブディレクトリと画像ファイル
+        os.makedirs(os.path.join(self.wallpapers_dir, 'nested.jpg'))
+        self._create_test_image('b.png')
+        self._create_test_image('a.jpg')
+        
+        renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        
+        # When: ディレクトリスキャン実行
+        found_images = renderer._scan_wallpaper_directory()
+        
+        # Then: 通常ファイルのみがフルパス・アルファベット順で返される
+        self.assertEqual(found_images, [os.path.join(self.wallpapers_dir, 'a.jpg'),
+                                        os.path.join(self.wallpapers_dir, 'b.png')])
+    
     def test_supported_format_detection(self):
         """対応形式判定テスト"""
         # Given: BackgroundImageRenderer
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         
         # When: 各種ファイル形式で判定
         jpg_result = renderer._is_supported_format('test.jpg')
@@ -210,6 +257,19 @@ class TestTask204ImageLoadingAndScanning(unittest.TestCase):
         self.assertTrue(bmp_result)
         self.assertFalse(unsupported_result)
     
+    def test_supported_format_detection_normalizes_settings(self):
+        """対応形式設定の正規化テスト"""
+        # Given: 大文字で対応形式を設定したBackgroundImageRenderer
+        self.test_settings['background']['supported_formats'] = ['JPG', 'Png']
+        renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        
+        # When/Then: 拡張子の大文字小文字に関係なく判定され、拡張子なしは対象外
+        self.assertTrue(renderer._is_supported_format('photo.jpg'))
+        self.assertTrue(renderer._is_supported_format('photo.PNG'))
+        self.assertFalse(renderer._is_supported_format('photo.bmp'))
+        self.assertFalse(renderer._is_supported_format('jpg'))
+    
     def test_image_selection_alphabetical(self):
         """アルファベット順画像選択テスト"""
         # Given: 複数画像をアルファベット順でない順序で作成
@@ -218,6 +278,7 @@ class TestTask204ImageLoadingAndScanning(unittest.TestCase):
         self._create_test_image('banana.bmp')
         
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         
         # When: 最適画像を選択
         selected_image = renderer._select_best_image()
@@ -226,11 +287,58 @@ class TestTask204ImageLoadingAndScanning(unittest.TestCase):
         self.assertIsNotNone(selected_image)
         self.assertTrue(selected_image.endswith('apple.png'))
     
+    def test_image_selection_skips_unreadable_first_image(self):
+        """読み込めない先頭画像のスキップテスト"""
+        # Given: アルファベット順先頭が破損ファイル
+        with open(os.path.join(self.wallpapers_dir, 'aaa_broken.jpg'), 'w') as f:
+            f.write('not an image')
+        self._create_test_image('ccc.png')
+        self._create_test_image('bbb.png')
+        
+        renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        
+        # When: 最適画像を選択
+        selected_image = renderer._select_best_image()
+        
+        # Then: 次に小さい読み込み可能な画像が選択される
+        self.assertTrue(selected_image.endswith('bbb.png'))
+    
+    def test_unreadable_image_not_retried_until_replaced(self):
+        """読み込めない画像の再試行省略テスト"""
+        # Given: 先頭の破損ファイルで一度選択に失敗したBackgroundImageRenderer
+        broken_path = os.path.join(self.wallpapers_dir, 'aaa_broken.jpg')
+        with open(broken_path, 'w') as f:
+            f.write('not an image')
+        self._create_test_image('bbb.png')
+        renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        renderer._select_best_image()
+        
+        with patch('pygame.image.load', wraps=pygame.image.load) as load:
+            # When: 再度選択
+            selected_image = renderer._select_best_image()
+            
+            # Then: 破損ファイルは読み込まれない
+            self.assertTrue(selected_image.endswith('bbb.png'))
+            self.assertEqual([call.args[0] for call in load.call_args_list],
+                             [selected_image])
+        
+        # When: 破損ファイルを正常な画像に置き換えて選択
+        _write_test_image(broken_path, (100, 100), (0, 255, 0))
+        stat = os.stat(broken_path)
+        os.utime(broken_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        selected_image = renderer._select_best_image()
+        
+        # Then: 置き換えた画像が選択される
+        self.assertEqual(selected_image, broken_path)
+    
     def test_image_loading(self):
         """画像読み込みテスト"""
         # Given: テスト画像
         image_path = self._create_test_image('test_load.jpg', (300, 200))
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         
         # When: 画像読み込み実行
         loaded_surface = renderer._load_and_scale_image(image_path)
@@ -239,6 +347,71 @@ class TestTask204ImageLoadingAndScanning(unittest.TestCase):
         self.assertIsInstance(loaded_surface, pygame.Surface)
         self.assertGreater(loaded_surface.get_width(), 0)
         self.assertGreater(loaded_surface.get_height(), 0)
+    
+    def test_selected_image_decoded_once(self):
+        """選択画像の再デコード省略テスト"""
+        # Given: 画像1枚のBackgroundImageRenderer
+        self._create_test_image('only.png', (300, 200))
+        renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        
+        with patch('pygame.image.load', wraps=pygame.image.load) as load:
+            # When: 画像を選択して読み込み
+            image_path = renderer._select_best_image()
+            surface = renderer._load_and_scale_image(image_path)
+            
+            # Then: 選択時の読み込み結果が使われ、デコードは1回のみ
+            self.assertIsInstance(surface, pygame.Surface)
+            self.assertEqual(load.call_count, 1)
+            self.assertIsNone(renderer._probed_image)
+    
+    def test_scanned_entry_stat_reused(self):
+        """スキャン結果のstat再利用テスト"""
+        # Given: 画像1枚のBackgroundImageRenderer
+        image_path = self._create_test_image('only.png', (300, 200))
+        renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        
+        with patch('os.stat', wraps=os.stat) as stat:
+            # When: スキャン・選択して読み込み
+            selected_image = renderer._select_best_image()
+            surface = renderer._load_and_scale_image(selected_image)
+            
+            # Then: 画像ファイルへのos.statは発行されない
+            self.assertEqual(selected_image, image_path)
+            self.assertIsInstance(surface, pygame.Surface)
+            self.assertNotIn(image_path, [call.args[0] for call in stat.call_args_list])
+    
+    def test_scaled_image_cache(self):
+        """スケール済み画像キャッシュテスト"""
+        # Given: 一度読み込み済みのテスト画像
+        image_path = self._create_test_image('cached.png', (300, 200))
+        renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        first = renderer._load_and_scale_image(image_path)
+        
+        with patch('pygame.image.load', wraps=pygame.image.load) as load:
+            # When: 同じ条件で再読み込み、モードを往復して再読み込み
+            second = renderer._load_and_scale_image(image_path)
+            renderer.scale_mode = 'scale'
+            scaled = renderer._load_and_scale_image(image_path)
+            renderer.scale_mode = 'fit'
+            third = renderer._load_and_scale_image(image_path)
+            
+            # Then: 同じサーフェスが再利用され、ディスク読み込みは新モードの1回のみ
+            self.assertIs(second, first)
+            self.assertIs(third, first)
+            self.assertIsNot(scaled, first)
+            self.assertEqual(load.call_count, 1)
+            
+            # When: 画像ファイルが更新される
+            stat = os.stat(image_path)
+            os.utime(image_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            reloaded = renderer._load_and_scale_image(image_path)
+            
+            # Then: 再読み込みされる
+            self.assertIsNot(reloaded, first)
+            self.assertEqual(load.call_count, 2)
 
 
 class TestTask204ScalingAndRendering(unittest.TestCase):
@@ -246,13 +419,11 @@ class TestTask204ScalingAndRendering(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1024, 600))
-        
         self.asset_manager = Mock()
         
         # テスト用一時ディレクトリ
-        self.test_dir = tempfile.mkdtemp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.test_dir = self._tmp.name
         self.wallpapers_dir = os.path.join(self.test_dir, 'wallpapers')
         os.makedirs(self.wallpapers_dir, exist_ok=True)
         
@@ -273,15 +444,12 @@ class TestTask204ScalingAndRendering(unittest.TestCase):
         
     def tearDown(self):
         """テスト後処理"""
-        pygame.quit()
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+        self._tmp.cleanup()
     
     def _create_test_image(self, filename: str, size: tuple):
         """テスト用画像ファイル作成"""
-        surface = pygame.Surface(size)
-        surface.fill((0, 0, 255))  # 青色
         filepath = os.path.join(self.wallpapers_dir, filename)
-        pygame.image.save(surface, filepath)
+        _write_test_image(filepath, size, (0, 0, 255))  # 青色
         return filepath
     
     def test_fit_mode_scaling(self):
@@ -294,6 +462,7 @@ class TestTask204ScalingAndRendering(unittest.TestCase):
         ]
         
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         
         for case in test_cases:
             with self.subTest(original_size=case['original']):
@@ -322,6 +491,7 @@ class TestTask204ScalingAndRendering(unittest.TestCase):
         
         self.test_settings['background']['mode'] = 'scale'
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         
         for original_size in test_sizes:
             with self.subTest(original_size=original_size):
@@ -336,10 +506,67 @@ class TestTask204ScalingAndRendering(unittest.TestCase):
                 self.assertEqual(dimensions['width'], 1024)
                 self.assertEqual(dimensions['height'], 600)
     
+    def test_scaling_uses_nearest_neighbor(self):
+        """補間なしスケーリング使用テスト"""
+        for mode in ('fit', 'scale'):
+            with self.subTest(mode=mode):
+                # Given: 各スケールモードのBackgroundImageRenderer
+                self.test_settings['background']['mode'] = mode
+                renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+                self.addCleanup(renderer.cleanup)
+                renderer._scaled_cache.clear()
+                
+                # When: 画像を読み込み・スケーリング
+                with patch('pygame.transform.smoothscale') as smoothscale:
+                    surface = renderer._load_and_scale_image(self.test_image)
+                
+                # Then: smoothscaleを使わず画面サイズのサーフェスが得られる
+                smoothscale.assert_not_called()
+                self.assertEqual(surface.get_size(), (1024, 600))
+    
+    def test_letterbox_and_transparency_use_fallback_color(self):
+        """黒帯・透過部分のフォールバック色テスト"""
+        # Given: 4:3の不透明画像と、半分が透明な画像・グレーのフォールバック色
+        self.test_settings['background']['fallback_color'] = [128, 128, 128]
+        transparent = pygame.Surface((100, 100), pygame.SRCALPHA)
+        transparent.fill((255, 0, 0, 255), pygame.Rect(0, 0, 50, 100))
+        transparent_path = os.path.join(self.wallpapers_dir, 'transparent.png')
+        pygame.image.save(transparent, transparent_path)
+        renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        
+        # When: fitモードで不透明画像、scaleモードで透過画像を合成
+        fitted = renderer._load_and_scale_image(self.test_image)
+        renderer.scale_mode = 'scale'
+        scaled = renderer._load_and_scale_image(transparent_path)
+        
+        # Then: 黒帯と透明部分にフォールバック色、画像部分に画像の色が残る
+        self.assertEqual(fitted.get_at((0, 300))[:3], (128, 128, 128))
+        self.assertGreater(fitted.get_at((512, 300)).b, 240)  # JPEGのため誤差を許容
+        self.assertEqual(scaled.get_at((1000, 300))[:3], (128, 128, 128))
+        self.assertEqual(scaled.get_at((10, 300))[:3], (255, 0, 0))
+    
+    def test_letterbox_rects(self):
+        """黒帯矩形計算テスト"""
+        # Given: BackgroundImageRenderer
+        renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        
+        # When: 縦長配置・横長配置・全面配置の黒帯を計算
+        pillarbox = renderer._letterbox_rects({'x': 112, 'y': 0, 'width': 800, 'height': 600}, (1024, 600))
+        letterbox = renderer._letterbox_rects({'x': 0, 'y': 12, 'width': 1024, 'height': 576}, (1024, 600))
+        full = renderer._letterbox_rects({'x': 0, 'y': 0, 'width': 1024, 'height': 600}, (1024, 600))
+        
+        # Then: 画像の外側だけが重なりなく返される
+        self.assertEqual(pillarbox, [pygame.Rect(0, 0, 112, 600), pygame.Rect(912, 0, 112, 600)])
+        self.assertEqual(letterbox, [pygame.Rect(0, 0, 1024, 12), pygame.Rect(0, 588, 1024, 12)])
+        self.assertEqual(full, [])
+    
     def test_basic_rendering(self):
         """基本描画テスト"""
         # Given: 画像が存在する状態
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         surface = pygame.Surface((1024, 600))
         
         # When: レンダリング実行
@@ -365,6 +592,7 @@ class TestTask204ScalingAndRendering(unittest.TestCase):
         }
         
         renderer = BackgroundImageRenderer(self.asset_manager, empty_settings)
+        self.addCleanup(renderer.cleanup)
         surface = pygame.Surface((1024, 600))
         
         # When: レンダリング実行
@@ -372,6 +600,31 @@ class TestTask204ScalingAndRendering(unittest.TestCase):
         
         # Then: 単色背景が描画される（例外が発生しない）
         self.assertIsInstance(surface, pygame.Surface)
+    
+    def test_render_specialized_while_image_loaded(self):
+        """画像読み込み中のrender差し替えテスト"""
+        # Given: 画像を読み込んだBackgroundImageRenderer
+        self.test_settings['background']['fallback_color'] = [128, 128, 128]
+        renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        renderer.update()
+        renderer._finish_pending_load(wait=True)
+        surface = pygame.Surface((1024, 600))
+        
+        # When: レンダリング実行
+        renderer.render(surface)
+        
+        # Then: 専用のrenderで画像が描画される
+        self.assertIn('render', vars(renderer))
+        self.assertGreater(surface.get_at((512, 300)).b, 240)
+        
+        # When: クリーンアップ後にレンダリング実行
+        renderer.cleanup()
+        renderer.render(surface)
+        
+        # Then: 通常のrenderに戻り単色背景が描画される
+        self.assertNotIn('render', vars(renderer))
+        self.assertEqual(surface.get_at((512, 300))[:3], (128, 128, 128))
 
 
 class TestTask204UpdateAndMonitoring(unittest.TestCase):
@@ -379,13 +632,11 @@ class TestTask204UpdateAndMonitoring(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1, 1))
-        
         self.asset_manager = Mock()
         
         # テスト用一時ディレクトリ
-        self.test_dir = tempfile.mkdtemp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.test_dir = self._tmp.name
         self.wallpapers_dir = os.path.join(self.test_dir, 'wallpapers')
         os.makedirs(self.wallpapers_dir, exist_ok=True)
         
@@ -399,13 +650,13 @@ class TestTask204UpdateAndMonitoring(unittest.TestCase):
         
     def tearDown(self):
         """テスト後処理"""
-        pygame.quit()
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+        self._tmp.cleanup()
     
     def test_rescan_timing_check(self):
         """再スキャン判定テスト"""
         # Given: BackgroundImageRenderer
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         
         # 初回は再スキャンが必要
         initial_check = renderer._should_rescan()
@@ -423,26 +674,55 @@ class TestTask204UpdateAndMonitoring(unittest.TestCase):
     @patch('time.time')
     def test_periodic_update_execution(self, mock_time):
         """定期更新実行テスト"""
-        # Given: 時間制御のモック
-        mock_time.side_effect = [1000, 1000, 1070]  # 70秒後
-        
+        # Given: 時刻1000で初回更新済み（ポーリング動作）のBackgroundImageRenderer
+        mock_time.return_value = 1000
+        _write_test_image(os.path.join(self.wallpapers_dir, 'b.png'), (100, 100), (0, 0, 0))
+        with patch('src.renderers.background_image_renderer.HAS_INOTIFY', False):
+            renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        self._update_and_wait(renderer)
+        self.assertTrue(renderer.get_current_image_path().endswith('b.png'))
+        
+        with patch.object(renderer, '_select_best_image',
+                          wraps=renderer._select_best_image) as select:
+            # When: 画像を追加し、再スキャン間隔（60秒）内に更新
+            _write_test_image(os.path.join(self.wallpapers_dir, 'a.png'), (100, 100), (0, 0, 0))
+            mock_time.return_value = 1030
+            self._update_and_wait(renderer)
+            
+            # Then: 再スキャンは行われない
+            select.assert_not_called()
+            
+            # When: 間隔経過後（70秒後）に更新
+            mock_time.return_value = 1070
+            self._update_and_wait(renderer)
+            
+            # Then: 再スキャンされ追加した画像が選択される
+            select.assert_called_once()
+            self.assertTrue(renderer.get_current_image_path().endswith('a.png'))
+    
+    def test_update_after_cleanup(self):
+        """クリーンアップ後の更新テスト"""
+        # Given: 画像1枚でクリーンアップ済みのBackgroundImageRenderer
+        _write_test_image(os.path.join(self.wallpapers_dir, 'b.png'), (100, 100), (0, 0, 0))
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        self._update_and_wait(renderer)
+        renderer.cleanup()
         
-        # When: 初回update()
-        renderer.update()
-        
-        # When: 時間経過後のupdate()
-        mock_time.return_value = 1070
-        renderer.update()
+        # When: 再度update()・force_rescan()を実行
+        self._update_and_wait(renderer)
+        renderer.force_rescan()
+        renderer._finish_pending_load(wait=True)
         
-        # Then: 再スキャンが実行される
-        # 実装依存の詳細確認は実装後に調整
-        self.assertIsInstance(renderer, BackgroundImageRenderer)
+        # Then: エラーにならず画像が読み込み直される
+        self.assertTrue(renderer.get_current_image_path().endswith('b.png'))
     
     def test_force_rescan(self):
         """強制再スキャンテスト"""
         # Given: BackgroundImageRenderer
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         
         # When: 強制再スキャン実行
         renderer.force_rescan()
@@ -450,6 +730,180 @@ class TestTask204UpdateAndMonitoring(unittest.TestCase):
         # Then: 即座に再スキャンが実行される
         # （実装後に具体的な動作確認を追加）
         self.assertIsInstance(renderer, BackgroundImageRenderer)
+    
+    @patch('time.time')
+    def test_directory_replaced_by_rename(self, mock_time):
+        """改名によるディレクトリ入れ替え追従テスト"""
+        # Given: 時刻1000で初回更新済み（ポーリング動作）のBackgroundImageRenderer
+        mock_time.return_value = 1000
+        _write_test_image(os.path.join(self.wallpapers_dir, 'b.png'), (100, 100), (0, 0, 0))
+        with patch('src.renderers.background_image_renderer.HAS_INOTIFY', False):
+            renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        self._update_and_wait(renderer)
+        self.assertTrue(renderer.get_current_image_path().endswith('b.png'))
+        
+        # When: 新しいディレクトリを用意し、改名で入れ替える（wp -> wp.old, wp.new -> wp）
+        new_dir = self.wallpapers_dir + '.new'
+        os.makedirs(new_dir)
+        _write_test_image(os.path.join(new_dir, 'a.png'), (100, 100), (0, 0, 0))
+        old_mtime = os.stat(self.wallpapers_dir).st_mtime_ns
+        os.utime(new_dir, ns=(old_mtime + 10**9, old_mtime + 10**9))
+        os.rename(self.wallpapers_dir, self.wallpapers_dir + '.old')
+        os.rename(new_dir, self.wallpapers_dir)
+        
+        # Then: 更新時刻は入れ替え後のディレクトリのものになる
+        self.assertEqual(renderer._get_directory_mtime(), os.stat(self.wallpapers_dir).st_mtime_ns)
+        
+        # When: 再スキャン間隔経過後に更新
+        mock_time.return_value = 1000 + renderer.rescan_interval
+        self._update_and_wait(renderer)
+        
+        # Then: 入れ替え後のディレクトリの画像が選択される
+        self.assertEqual(renderer.get_current_image_path(),
+                         os.path.join(self.wallpapers_dir, 'a.png'))
+    
+    def _update_and_wait(self, renderer):
+        """update()を実行し、バックグラウンドの読み込み結果を反映"""
+        renderer.update()
+        renderer._finish_pending_load(wait=True)
+    
+    def test_update_loads_image_in_background(self):
+        """バックグラウンド読み込みテスト"""
+        # Given: 画像選択が完了待ちで止まるBackgroundImageRenderer
+        image_path = os.path.join(self.wallpapers_dir, 'slow.png')
+        _write_test_image(image_path, (100, 100), (0, 0, 0))
+        renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        gate = threading.Event()
+        
+        def slow_select():
+            gate.wait(5)
+            return image_path
+        
+        with patch.object(renderer, '_select_best_image', side_effect=slow_select) as select:
+            # When: 読み込み完了前にupdate()とrender()を繰り返す
+            renderer.update()
+            renderer.update()
+            surface = pygame.Surface((1024, 600))
+            renderer.render(surface)
+            
+            # Then: 待たずに戻り、フォールバック色で描画され、スキャンは1回のみ
+            self.assertIsNone(renderer.get_current_image_path())
+            self.assertEqual(surface.get_at((0, 0))[:3], (0, 0, 0))
+            self.assertEqual(select.call_count, 1)
+            
+            # When: 読み込みが完了した後のupdate()
+            gate.set()
+            renderer._load_future.result(timeout=5)
+            renderer.update()
+        
+        # Then: 読み込んだ画像が反映される
+        self.assertEqual(renderer.get_current_image_path(), image_path)
+        self.assertIsNotNone(renderer.cached_surface)
+        renderer.cleanup()
+    
+    def test_cleanup_waits_for_running_scan(self):
+        """実行中スキャンのクリーンアップ待機テスト"""
+        # Given: 画像選択の途中で止まっているBackgroundImageRenderer
+        _write_test_image(os.path.join(self.wallpapers_dir, 'b.png'), (100, 100), (0, 0, 0))
+        renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        select_best_image = renderer._select_best_image
+        entered = threading.Event()
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        
+        def blocked_select():
+            entered.set()
+            gate.wait(5)
+            return select_best_image()
+        
+        with patch.object(renderer, '_select_best_image', side_effect=blocked_select):
+            renderer.update()
+            self.assertTrue(entered.wait(5))
+            
+            # When: スキャン実行中にcleanup()し、その後スキャンを再開させる
+            cleanup_thread = threading.Thread(target=renderer.cleanup)
+            cleanup_thread.start()
+            cleanup_thread.join(0.2)
+            
+            # Then: cleanup()は実行中のスキャンの完了を待つ
+            self.assertTrue(cleanup_thread.is_alive())
+            
+            gate.set()
+            cleanup_thread.join(5)
+            self.assertFalse(cleanup_thread.is_alive())
+        
+        # Then: スキャン結果はクリア後の状態に残らない
+        self.assertEqual(renderer.available_images, [])
+        self.assertEqual(renderer._scanned_entries, {})
+        self.assertEqual(len(renderer._scaled_cache), 0)
+        self.assertIsNone(renderer._probed_image)
+        self.assertIsNone(renderer.get_current_image_path())
+        self.assertIsNone(renderer.cached_surface)
+    
+    def test_rescan_skipped_when_directory_unchanged(self):
+        """ディレクトリ未変更時の再スキャン省略テスト"""
+        # Given: 画像1枚で初回更新済みのBackgroundImageRenderer
+        _write_test_image(os.path.join(self.wallpapers_dir, 'b.png'), (100, 100), (0, 0, 0))
+        with patch('src.renderers.background_image_renderer.HAS_INOTIFY', False):  # ポーリング動作を確認
+            renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+            self.addCleanup(renderer.cleanup)
+        self._update_and_wait(renderer)
+        self.assertTrue(renderer.get_current_image_path().endswith('b.png'))
+        
+        with patch.object(renderer, '_select_best_image',
+                          wraps=renderer._select_best_image) as select:
+            # When: 再スキャン間隔経過後、ディレクトリ未変更のまま更新
+            renderer.last_scan_time -= 1000
+            renderer.update()
+            
+            # Then: 画像選択は実行されず、タイマーのみ更新される
+            select.assert_not_called()
+            self.assertFalse(renderer._should_rescan())
+            
+            # When: 画像を追加して間隔経過後に更新
+            _write_test_image(os.path.join(self.wallpapers_dir, 'a.png'), (100, 100), (0, 0, 0))
+            renderer.last_scan_time -= 1000
+            self._update_and_wait(renderer)
+            
+            # Then: 再スキャンされ新しい画像が選択される
+            select.assert_called_once()
+            self.assertTrue(renderer.get_current_image_path().endswith('a.png'))
+    
+    @unittest.skipUnless(HAS_INOTIFY, "inotify_simple未インストール")
+    def test_rescan_driven_by_directory_events(self):
+        """ディレクトリ変更通知による再スキャンテスト"""
+        # Given: 変更監視中で初回スキャン済みのBackgroundImageRenderer
+        _write_test_image(os.path.join(self.wallpapers_dir, 'b.png'), (100, 100), (0, 0, 0))
+        renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
+        self.assertTrue(renderer._watching)
+        self._update_and_wait(renderer)
+        
+        with patch.object(renderer, '_select_best_image',
+                          wraps=renderer._select_best_image) as select:
+            # When: 変更がないまま再スキャン間隔が経過
+            renderer.last_scan_time -= 1000
+            renderer.update()
+            
+            # Then: 再スキャンは行われない
+            select.assert_not_called()
+            
+            # When: 画像を追加し、変更通知を受けてから更新
+            _write_test_image(os.path.join(self.wallpapers_dir, 'a.png'), (100, 100), (0, 0, 0))
+            deadline = time.monotonic() + 5
+            while not renderer._directory_dirty and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self._update_and_wait(renderer)
+            
+            # Then: 再スキャンされ新しい画像が選択される
+            select.assert_called_once()
+            self.assertTrue(renderer.get_current_image_path().endswith('a.png'))
+        
+        renderer.cleanup()
+        self.assertFalse(renderer._watching)
 
 
 class TestTask204Configuration(unittest.TestCase):
@@ -457,13 +911,11 @@ class TestTask204Configuration(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1, 1))
-        
         self.asset_manager = Mock()
         
         # テスト用一時ディレクトリ
-        self.test_dir = tempfile.mkdtemp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.test_dir = self._tmp.name
         self.wallpapers_dir = os.path.join(self.test_dir, 'wallpapers')
         self.alt_wallpapers_dir = os.path.join(self.test_dir, 'alt_wallpapers')
         os.makedirs(self.wallpapers_dir, exist_ok=True)
@@ -478,13 +930,13 @@ class TestTask204Configuration(unittest.TestCase):
         
     def tearDown(self):
         """テスト後処理"""
-        pygame.quit()
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+        self._tmp.cleanup()
     
     def test_directory_change(self):
         """ディレクトリ変更テスト"""
         # Given: BackgroundImageRenderer
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         
         # When: ディレクトリを変更
         renderer.set_wallpaper_directory(self.alt_wallpapers_dir)
@@ -496,6 +948,7 @@ class TestTask204Configuration(unittest.TestCase):
         """スケールモード変更テスト"""
         # Given: fitモードで初期化
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         initial_mode = renderer.scale_mode
         
         # When: scaleモードに変更
@@ -511,15 +964,8 @@ class TestTask204ErrorHandling(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1, 1))
-        
         self.asset_manager = Mock()
         
-    def tearDown(self):
-        """テスト後処理"""
-        pygame.quit()
-    
     def test_nonexistent_directory_handling(self):
         """存在しないディレクトリ処理テスト"""
         # Given: 存在しないディレクトリパス
@@ -533,6 +979,7 @@ class TestTask204ErrorHandling(unittest.TestCase):
         # When: BackgroundImageRendererを初期化
         try:
             renderer = BackgroundImageRenderer(self.asset_manager, invalid_settings)
+            self.addCleanup(renderer.cleanup)
             # Then: 例外を投げずに初期化される
             self.assertIsInstance(renderer, BackgroundImageRenderer)
         except Exception as e:
@@ -541,8 +988,7 @@ class TestTask204ErrorHandling(unittest.TestCase):
     def test_corrupted_image_skip(self):
         """破損画像スキップテスト"""
         # Given: 破損ファイルと正常ファイルが混在
-        test_dir = tempfile.mkdtemp()
-        try:
+        with tempfile.TemporaryDirectory() as test_dir:
             wallpapers_dir = os.path.join(test_dir, 'wallpapers')
             os.makedirs(wallpapers_dir, exist_ok=True)
             
@@ -552,9 +998,8 @@ class TestTask204ErrorHandling(unittest.TestCase):
                 f.write('This is not an image file')
             
             # 正常画像作成
-            surface = pygame.Surface((100, 100))
             normal_path = os.path.join(wallpapers_dir, 'normal.jpg')
-            pygame.image.save(surface, normal_path)
+            _write_test_image(normal_path, (100, 100), (0, 0, 0))
             
             settings = {
                 'background': {
@@ -565,18 +1010,15 @@ class TestTask204ErrorHandling(unittest.TestCase):
             
             # When: 初期化・スキャン実行
             renderer = BackgroundImageRenderer(self.asset_manager, settings)
+            self.addCleanup(renderer.cleanup)
             
             # Then: 破損ファイルをスキップし正常ファイルを選択
             self.assertIsInstance(renderer, BackgroundImageRenderer)
-            
-        finally:
-            shutil.rmtree(test_dir, ignore_errors=True)
     
     def test_all_images_load_failure(self):
         """全画像読み込み失敗テスト"""
         # Given: 非対応形式のファイルのみ
-        test_dir = tempfile.mkdtemp()
-        try:
+        with tempfile.TemporaryDirectory() as test_dir:
             wallpapers_dir = os.path.join(test_dir, 'wallpapers')
             os.makedirs(wallpapers_dir, exist_ok=True)
             
@@ -595,13 +1037,11 @@ class TestTask204ErrorHandling(unittest.TestCase):
             # When: 初期化実行
             try:
                 renderer = BackgroundImageRenderer(self.asset_manager, settings)
+                self.addCleanup(renderer.cleanup)
                 # Then: 単色背景で安全に動作
                 self.assertIsInstance(renderer, BackgroundImageRenderer)
             except Exception as e:
                 self.fail(f"Should handle all load failures gracefully: {e}")
-                
-        finally:
-            shutil.rmtree(test_dir, ignore_errors=True)
 
 
 class TestTask204Integration(unittest.TestCase):
@@ -609,15 +1049,13 @@ class TestTask204Integration(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        pygame.init()
-        pygame.display.set_mode((1024, 600))
-        
         # 実際のAssetManagerを使用
         from src.assets.asset_manager import AssetManager
         self.asset_manager = AssetManager()
         
         # テスト用一時ディレクトリ
-        self.test_dir = tempfile.mkdtemp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.test_dir = self._tmp.name
         self.wallpapers_dir = os.path.join(self.test_dir, 'wallpapers')
         os.makedirs(self.wallpapers_dir, exist_ok=True)
         
@@ -640,21 +1078,19 @@ class TestTask204Integration(unittest.TestCase):
     def tearDown(self):
         """テスト後処理"""
         self.asset_manager.cleanup()
-        pygame.quit()
-        shutil.rmtree(self.test_dir, ignore_errors=True)
+        self._tmp.cleanup()
     
     def _create_test_image(self, filename: str):
         """テスト用画像作成"""
-        surface = pygame.Surface((800, 600))
-        surface.fill((255, 255, 0))  # 黄色
         filepath = os.path.join(self.wallpapers_dir, filename)
-        pygame.image.save(surface, filepath)
+        _write_test_image(filepath, (800, 600), (255, 255, 0))  # 黄色
         return filepath
     
     def test_asset_manager_integration(self):
         """AssetManager統合テスト"""
         # Given: 実際のAssetManagerとBackgroundImageRenderer
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         surface = pygame.Surface((1024, 600))
         
         # When: レンダリング実行
@@ -667,6 +1103,7 @@ class TestTask204Integration(unittest.TestCase):
         """全体システムワークフローテスト"""
         # Given: BackgroundImageRenderer
         renderer = BackgroundImageRenderer(self.asset_manager, self.test_settings)
+        self.addCleanup(renderer.cleanup)
         surface = pygame.Surface((1024, 600))
         
         # When: 完全ワークフロー実行
@@ -14,11 +14,15 @@ import os
 import sys
 import unittest
 import json
+import operator
 import time
 import threading
-from unittest.mock import Mock, patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import Mock
 from abc import ABC, ABCMeta
 
+import requests
+
 # プロジェクトルートをパスに追加
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
@@ -48,6 +52,82 @@ except ImportError as e:
         def cleanup(self): pass
 
 
+# テスト用設定（プロバイダは読み取るだけなので読み取り専用で共有）
+_TEST_SETTINGS = MappingProxyType({
+    'weather': MappingProxyType({
+        'timeout': 10,
+        'location': MappingProxyType({
+            'latitude': 35.681236,
+            'longitude': 139.767125
+        })
+    })
+})
+
+
+class _ConcreteProvider(WeatherProvider):
+    """fetch()を実装したテスト用プロバイダ"""
+    
+    def fetch(self):
+        return {"test": "data"}
+
+
+class _MockWorkflowProvider(WeatherProvider):
+    """標準形式のモック天気データを返すテスト用プロバイダ"""
+    
+    def fetch(self):
+        # モック天気データ返却
+        return {
+            "updated": int(time.time()),
+            "location": {
+                "latitude": 35.681236,
+                "longitude": 139.767125,
+                "name": "Tokyo"
+            },
+            "forecasts": [
+                {
+                    "date": "2025-01-11",
+                    "icon": "sunny",
+                    "temperature": {"min": 5, "max": 12},
+                    "precipitation_probability": 30,
+                    "description": "晴れ"
+                }
+            ]
+        }
+
+
+class _StubResponse:
+    """HTTPレスポンスの軽量スタブ（status_codeとjson()のみ）"""
+    __slots__ = ('status_code', '_json')
+    
+    def __init__(self, json_data, status_code=200):
+        self.status_code = status_code
+        self._json = json_data
+    
+    def json(self):
+        return self._json
+
+
+# プロバイダ側アイコンコードと期待される内部アイコン
+ICON_CASES = (
+    ("clear", "sunny"),
+    ("sunny", "sunny"),
+    ("partly-cloudy", "cloudy"),
+    ("cloudy", "cloudy"),
+    ("rain", "rain"),
+    ("thunderstorm", "thunder"),
+    ("fog", "fog"),
+)
+
+
+# 例外クラスとテスト用メッセージ
+EXCEPTION_CASES = (
+    (NetworkError, "ネットワークエラーが発生しました"),
+    (APIError, "API エラーが発生しました"),
+    (DataFormatError, "データ形式エラーが発生しました"),
+    (AuthenticationError, "認証エラーが発生しました"),
+)
+
+
 class TestTask301AbstractBaseClass(unittest.TestCase):
     """抽象基底クラステスト (Priority 1)"""
     
@@ -76,56 +156,26 @@ class TestTask301AbstractBaseClass(unittest.TestCase):
     def test_proper_inheritance_implementation(self):
         """正常な継承クラス実装テスト"""
         # Given: fetch()メソッドを実装した継承クラス
-        class CompleteProvider(WeatherProvider):
-            def fetch(self):
-                return {"test": "data"}
-        
-        test_settings = {
-            'weather': {
-                'location': {
-                    'latitude': 35.681236,
-                    'longitude': 139.767125
-                }
-            }
-        }
-        
         # When: インスタンス化実行
-        provider = CompleteProvider(test_settings)
+        provider = _ConcreteProvider(_TEST_SETTINGS)
         
         # Then: 正常にインスタンス化され動作する
         self.assertIsInstance(provider, WeatherProvider)
-        self.assertIsInstance(provider, CompleteProvider)
+        self.assertIsInstance(provider, _ConcreteProvider)
         self.assertEqual(provider.fetch(), {"test": "data"})
     
     def test_base_class_common_methods(self):
         """基底クラス共通メソッドテスト"""
         # Given: 実装された継承クラス
-        class TestProvider(WeatherProvider):
-            def fetch(self):
-                return {}
+        provider = _ConcreteProvider(_TEST_SETTINGS)
         
-        test_settings = {
-            'weather': {
-                'location': {
-                    'latitude': 35.681236,
-                    'longitude': 139.767125
-                }
-            }
-        }
-        provider = TestProvider(test_settings)
+        # When: 共通メソッドを取得（存在しなければAttributeError）
+        methods = operator.attrgetter(
+            'validate_response', 'map_to_internal_icon', '_make_request', 'cleanup'
+        )(provider)
         
-        # When: 共通メソッドを呼び出し
         # Then: メソッドが存在し実行可能
-        self.assertTrue(hasattr(provider, 'validate_response'))
-        self.assertTrue(hasattr(provider, 'map_to_internal_icon'))
-        self.assertTrue(hasattr(provider, '_make_request'))
-        self.assertTrue(hasattr(provider, 'cleanup'))
-        
-        # 実際のメソッド呼び出し（実装により動作は変わる）
-        self.assertIsNotNone(provider.validate_response)
-        self.assertIsNotNone(provider.map_to_internal_icon)
-        self.assertIsNotNone(provider._make_request)
-        self.assertIsNotNone(provider.cleanup)
+        self.assertTrue(all(callable(method) for method in methods))
 
 
 class TestTask301HTTPSCommunication(unittest.TestCase):
@@ -133,40 +183,24 @@ class TestTask301HTTPSCommunication(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        # テスト用プロバイダクラス作成
-        class TestProvider(WeatherProvider):
-            def fetch(self):
-                return {}
-        
-        self.test_settings = {
-            'weather': {
-                'timeout': 10,
-                'location': {
-                    'latitude': 35.681236,
-                    'longitude': 139.767125
-                }
-            }
-        }
-        self.provider = TestProvider(self.test_settings)
+        self.provider = _ConcreteProvider(_TEST_SETTINGS)
+        # HTTP通信はこのプロバイダのセッションだけをモックに差し替える
+        self.mock_get = self.provider.session.get = Mock()
     
-    @patch('src.weather.providers.base.requests.Session.get')
-    def test_https_communication_success(self, mock_get):
+    def test_https_communication_success(self):
         """HTTPS通信成功テスト"""
         # Given: 正常なHTTPSレスポンス
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "test"}
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _StubResponse({"data": "test"})
         
         # When: HTTPSリクエスト実行
         result = self.provider._make_request("https://example.com/api")
         
         # Then: 正常なレスポンスが取得される
         self.assertEqual(result, {"data": "test"})
-        mock_get.assert_called_once()
+        self.mock_get.assert_called_once()
         
         # HTTPS URLが使用されていることを確認
-        args, kwargs = mock_get.call_args
+        args, kwargs = self.mock_get.call_args
         self.assertEqual(args[0], "https://example.com/api")
     
     def test_http_communication_rejection(self):
@@ -181,12 +215,10 @@ class TestTask301HTTPSCommunication(unittest.TestCase):
         
         self.assertIn("HTTPS", str(context.exception))
     
-    @patch('src.weather.providers.base.requests.Session.get')
-    def test_timeout_handling(self, mock_get):
+    def test_timeout_handling(self):
         """タイムアウト処理テスト"""
         # Given: タイムアウト発生するモック
-        import requests
-        mock_get.side_effect = requests.Timeout("Request timed out")
+        self.mock_get.side_effect = requests.Timeout("Request timed out")
         
         # When: タイムアウト発生するリクエスト
         # Then: NetworkError例外が発生
@@ -201,19 +233,7 @@ class TestTask301DataValidation(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        class TestProvider(WeatherProvider):
-            def fetch(self):
-                return {}
-        
-        test_settings = {
-            'weather': {
-                'location': {
-                    'latitude': 35.681236,
-                    'longitude': 139.767125
-                }
-            }
-        }
-        self.provider = TestProvider(test_settings)
+        self.provider = _ConcreteProvider(_TEST_SETTINGS)
         
         # 正常なレスポンステストデータ
         self.valid_response = {
@@ -273,34 +293,12 @@ class TestTask301IconMapping(unittest.TestCase):
     
     def setUp(self):
         """テスト前準備"""
-        class TestProvider(WeatherProvider):
-            def fetch(self):
-                return {}
-        
-        test_settings = {
-            'weather': {
-                'location': {
-                    'latitude': 35.681236,
-                    'longitude': 139.767125
-                }
-            }
-        }
-        self.provider = TestProvider(test_settings)
+        self.provider = _ConcreteProvider(_TEST_SETTINGS)
     
     def test_basic_icon_mapping(self):
         """基本アイコンマッピングテスト"""
         # Given: 基本アイコンコード
-        test_cases = [
-            ("clear", "sunny"),
-            ("sunny", "sunny"),
-            ("partly-cloudy", "cloudy"),
-            ("cloudy", "cloudy"),
-            ("rain", "rain"),
-            ("thunderstorm", "thunder"),
-            ("fog", "fog")
-        ]
-        
-        for provider_code, expected_icon in test_cases:
+        for provider_code, expected_icon in ICON_CASES:
             with self.subTest(provider_code=provider_code):
                 # When: アイコンマッピング実行
                 result = self.provider.map_to_internal_icon(provider_code)
@@ -328,22 +326,8 @@ class TestTask301Configuration(unittest.TestCase):
     def test_valid_configuration_loading(self):
         """正常設定読み込みテスト"""
         # Given: 完全な設定辞書
-        valid_config = {
-            'weather': {
-                'timeout': 10,
-                'location': {
-                    'latitude': 35.681236,
-                    'longitude': 139.767125
-                }
-            }
-        }
-        
         # When: WeatherProvider初期化
-        class TestProvider(WeatherProvider):
-            def fetch(self):
-                return {}
-        
-        provider = TestProvider(valid_config)
+        provider = _ConcreteProvider(_TEST_SETTINGS)
         
         # Then: 正常に初期化される
         self.assertIsInstance(provider, WeatherProvider)
@@ -361,42 +345,24 @@ class TestTask301Configuration(unittest.TestCase):
         # When: 必須設定なしで初期化試行
         # Then: WeatherProviderError例外が発生
         with self.assertRaises(WeatherProviderError):
-            class TestProvider(WeatherProvider):
-                def fetch(self):
-                    return {}
-            TestProvider(invalid_config)
+            _ConcreteProvider(invalid_config)
 
 
 class TestTask301ExceptionHandling(unittest.TestCase):
     """例外処理テスト (Priority 1)"""
     
-    def test_exception_class_hierarchy(self):
-        """例外クラス階層テスト"""
+    def test_exception_hierarchy_and_messages(self):
+        """例外クラス階層・メッセージテスト"""
         # Given: 例外クラス定義
         # When: 継承関係を確認
-        # Then: 正しい継承階層が定義されている
-        
-        # WeatherProviderError が基底例外
+        # Then: WeatherProviderError が基底例外
         self.assertTrue(issubclass(WeatherProviderError, Exception))
         
-        # 各例外が WeatherProviderError を継承
-        self.assertTrue(issubclass(NetworkError, WeatherProviderError))
-        self.assertTrue(issubclass(APIError, WeatherProviderError))
-        self.assertTrue(issubclass(DataFormatError, WeatherProviderError))
-        self.assertTrue(issubclass(AuthenticationError, WeatherProviderError))
-    
-    def test_exception_messages(self):
-        """例外メッセージテスト"""
-        # Given: 各例外クラス
-        exceptions_with_messages = [
-            (NetworkError, "ネットワークエラーが発生しました"),
-            (APIError, "API エラーが発生しました"),
-            (DataFormatError, "データ形式エラーが発生しました"),
-            (AuthenticationError, "認証エラーが発生しました")
-        ]
-        
-        for exception_class, message in exceptions_with_messages:
+        for exception_class, message in EXCEPTION_CASES:
             with self.subTest(exception_class=exception_class.__name__):
+                # Then: 各例外が WeatherProviderError を継承
+                self.assertTrue(issubclass(exception_class, WeatherProviderError))
+                
                 # When: メッセージ付き例外生成
                 exception = exception_class(message)
                 
@@ -411,39 +377,8 @@ class TestTask301Integration(unittest.TestCase):
     def test_complete_workflow(self):
         """完全ワークフローテスト"""
         # Given: 完全に実装された継承クラス
-        class MockProvider(WeatherProvider):
-            def fetch(self):
-                # モック天気データ返却
-                return {
-                    "updated": int(time.time()),
-                    "location": {
-                        "latitude": 35.681236,
-                        "longitude": 139.767125,
-                        "name": "Tokyo"
-                    },
-                    "forecasts": [
-                        {
-                            "date": "2025-01-11",
-                            "icon": "sunny",
-                            "temperature": {"min": 5, "max": 12},
-                            "precipitation_probability": 30,
-                            "description": "晴れ"
-                        }
-                    ]
-                }
-        
-        config = {
-            'weather': {
-                'timeout': 10,
-                'location': {
-                    'latitude': 35.681236,
-                    'longitude': 139.767125
-                }
-            }
-        }
-        
         # When: 初期化から取得まで一連の処理
-        provider = MockProvider(config)
+        provider = _MockWorkflowProvider(_TEST_SETTINGS)
         weather_data = provider.fetch()
         is_valid = provider.validate_response(weather_data)
         icon = provider.map_to_internal_icon("clear")
@@ -6,12 +6,16 @@ OpenMeteoProviderクラスのテストスイート。
 Priority 1の15個のテストケースを実装。
 """
 
+import copy
 import json
 import time
 import unittest
-from unittest.mock import patch, MagicMock, Mock
+from unittest.mock import patch, MagicMock
+from types import MappingProxyType
 from typing import Dict, Any
 
+import requests
+
 # まだ実装されていないがテスト対象のクラス
 try:
     from src.weather.providers.openmeteo import OpenMeteoProvider
@@ -35,71 +39,87 @@ except ImportError:
         def _map_wmo_code_to_icon(self, code):
             return "cloudy"
 
+from src.weather.providers import base as provider_base
 from src.weather.providers.base import WeatherProvider
 from src.weather.providers.exceptions import (
     WeatherProviderError, NetworkError, APIError, DataFormatError
 )
 
 
-class TestOpenMeteoProvider(unittest.TestCase):
-    """Open-Meteoプロバイダのテストケース"""
+# テスト用設定（プロバイダは読み取るだけなので読み取り専用で共有）
+_TEST_SETTINGS = MappingProxyType({
+    'weather': MappingProxyType({
+        'timeout': 10,
+        'location': MappingProxyType({
+            'latitude': 35.681236,
+            'longitude': 139.767125
+        })
+    })
+})
+
+
+# モックOpen-Meteoレスポンス（読み取り専用）
+_MOCK_OM_RESPONSE = MappingProxyType({
+    "latitude": 35.6812,
+    "longitude": 139.7671,
+    "timezone": "Asia/Tokyo",
+    "timezone_abbreviation": "JST",
+    "elevation": 35.0,
+    "daily": MappingProxyType({
+        "time": ("2025-01-11", "2025-01-12", "2025-01-13"),
+        "temperature_2m_max": (12.5, 8.3, 7.1),
+        "temperature_2m_min": (5.2, 3.1, 4.0),
+        "weathercode": (1, 3, 61),
+        "precipitation_probability_max": (30, 60, 90)
+    })
+})
+
+
+class _StubResponse:
+    """HTTPレスポンスの軽量スタブ（status_codeとjson()のみ）"""
+    __slots__ = ('status_code', '_json')
     
-    def setUp(self):
-        """各テストの前処理"""
-        self.test_settings = {
-            'weather': {
-                'location': {
-                    'latitude': 35.681236,
-                    'longitude': 139.767125
-                },
-                'timeout': 10
-            }
-        }
-        
-        # モックOpen-Meteoレスポンス
-        self.mock_openmeteo_response = {
-            "latitude": 35.6812,
-            "longitude": 139.7671,
-            "timezone": "Asia/Tokyo",
-            "timezone_abbreviation": "JST",
-            "elevation": 35.0,
-            "daily": {
-                "time": ["2025-01-11", "2025-01-12", "2025-01-13"],
-                "temperature_2m_max": [12.5, 8.3, 7.1],
-                "temperature_2m_min": [5.2, 3.1, 4.0],
-                "weathercode": [1, 3, 61],
-                "precipitation_probability_max": [30, 60, 90]
-            }
-        }
+    def __init__(self, json_data, status_code=200):
+        self.status_code = status_code
+        self._json = json_data
     
-    # =================================================================
-    # Test Category 1: 基本機能テスト
-    # =================================================================
+    def json(self):
+        return self._json
+
+
+# WMO天気コードと期待される内部アイコン
+WMO_CASES = (
+    # 晴れ
+    (0, "sunny"), (1, "sunny"),
+    # 曇り
+    (2, "cloudy"), (3, "cloudy"),
+    # 雨
+    (51, "rain"), (53, "rain"), (55, "rain"), (61, "rain"), (63, "rain"), (65, "rain"),
+    (66, "rain"), (67, "rain"), (80, "rain"), (81, "rain"), (82, "rain"),
+    # 雪（雨として扱う）
+    (71, "rain"), (73, "rain"), (75, "rain"), (77, "rain"), (85, "rain"), (86, "rain"),
+    # 雷
+    (95, "thunder"), (96, "thunder"), (99, "thunder"),
+    # 霧
+    (45, "fog"), (48, "fog"),
+)
+
+
+class TestOpenMeteoLogic(unittest.TestCase):
+    """Open-Meteoプロバイダの変換ロジックのテストケース（HTTP通信なし）"""
     
-    def test_openmeteo_provider_initialization(self):
-        """Test Case 1.1: OpenMeteoProvider初期化"""
-        # OpenMeteoProviderが正しく初期化されることを確認
-        provider = OpenMeteoProvider(self.test_settings)
-        
-        # 基底クラスを継承していることを確認
-        self.assertIsInstance(provider, WeatherProvider)
-        
-        # BASE_URLが定義されていることを確認
-        self.assertEqual(provider.BASE_URL, "https://api.open-meteo.com/v1/forecast")
+    # 読み取り専用のため全テストで共有する
+    mock_openmeteo_response = _MOCK_OM_RESPONSE
     
-    def test_fetch_method_implementation(self):
-        """Test Case 1.2: fetch()メソッド実装確認"""
-        provider = OpenMeteoProvider(self.test_settings)
-        
-        # fetch()メソッドが存在し呼び出し可能であることを確認
-        self.assertTrue(hasattr(provider, 'fetch'))
-        self.assertTrue(callable(getattr(provider, 'fetch')))
-        
-        # 戻り値が辞書型であることを確認（モック環境）
-        with patch.object(provider, '_make_request') as mock_request:
-            mock_request.return_value = self.mock_openmeteo_response
-            result = provider.fetch()
-            self.assertIsInstance(result, dict)
+    @classmethod
+    def setUpClass(cls):
+        """クラス共通の前処理（状態を持たない変換処理のみのため、プロバイダは1つを共有）"""
+        cls.provider = OpenMeteoProvider(_TEST_SETTINGS)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """クラス共通の後処理"""
+        cls.provider.cleanup()
     
     # =================================================================
     # Test Category 2: APIリクエスト構築テスト
@@ -107,7 +127,7 @@ class TestOpenMeteoProvider(unittest.TestCase):
     
     def test_request_params_building(self):
         """Test Case 2.1: リクエストパラメータ構築"""
-        provider = OpenMeteoProvider(self.test_settings)
+        provider = self.provider
         
         # _build_request_params()メソッドの確認
         params = provider._build_request_params()
@@ -138,7 +158,7 @@ class TestOpenMeteoProvider(unittest.TestCase):
     
     def test_normal_response_conversion(self):
         """Test Case 3.1: 正常レスポンス変換"""
-        provider = OpenMeteoProvider(self.test_settings)
+        provider = self.provider
         
         # Open-Meteo形式から標準形式への変換
         result = provider._parse_openmeteo_response(self.mock_openmeteo_response)
@@ -164,7 +184,7 @@ class TestOpenMeteoProvider(unittest.TestCase):
     
     def test_daily_data_conversion(self):
         """Test Case 3.2: 日次データ変換"""
-        provider = OpenMeteoProvider(self.test_settings)
+        provider = self.provider
         
         # 変換実行
         result = provider._parse_openmeteo_response(self.mock_openmeteo_response)
@@ -197,75 +217,110 @@ class TestOpenMeteoProvider(unittest.TestCase):
     # Test Category 4: WMOコードマッピングテスト
     # =================================================================
     
-    def test_sunny_code_mapping(self):
-        """Test Case 4.1: 晴れコードマッピング"""
-        provider = OpenMeteoProvider(self.test_settings)
-        
-        # WMOコード0, 1が"sunny"にマッピングされることを確認
-        self.assertEqual(provider._map_wmo_code_to_icon(0), "sunny")
-        self.assertEqual(provider._map_wmo_code_to_icon(1), "sunny")
+    def test_wmo_code_mapping(self):
+        """Test Case 4.1-4.5: WMOコードマッピング（晴れ・曇り・雨・雪・雷・霧）"""
+        provider = self.provider
+        
+        # 各WMOコードが期待されるアイコンにマッピングされることを確認
+        for code, expected_icon in WMO_CASES:
+            with self.subTest(code=code):
+                self.assertEqual(provider._map_wmo_code_to_icon(code), expected_icon)
     
-    def test_cloudy_code_mapping(self):
-        """Test Case 4.2: 曇りコードマッピング"""
-        provider = OpenMeteoProvider(self.test_settings)
+    # =================================================================
+    # Test Category 6: エラーハンドリングテスト
+    # =================================================================
+    
+    def test_invalid_response_handling(self):
+        """Test Case 6.3: 不正レスポンス処理"""
+        provider = self.provider
         
-        # WMOコード2, 3が"cloudy"にマッピングされることを確認
-        self.assertEqual(provider._map_wmo_code_to_icon(2), "cloudy")
-        self.assertEqual(provider._map_wmo_code_to_icon(3), "cloudy")
+        # 必須フィールド欠如データ
+        invalid_response = {
+            "latitude": 35.6812,
+            "longitude": 139.7671,
+            # daily フィールドなし
+        }
+        
+        # DataFormatError例外が発生することを確認
+        with self.assertRaises(DataFormatError) as context:
+            provider._parse_openmeteo_response(invalid_response)
+        
+        self.assertIn("Missing required field", str(context.exception))
+
+
+class TestOpenMeteoHTTP(unittest.TestCase):
+    """Open-Meteoプロバイダの初期化・HTTP通信のテストケース"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """クラス共通の前処理（設定・プロバイダのひな形を一度だけ作成）"""
+        # プロバイダごとにSessionを作らず、クラス内で1つのモックSessionを共有する
+        # （HTTP通信はこのSessionのgetで受ける）
+        cls._shared_session = MagicMock()
+        cls.mock_get = cls._shared_session.get
+        cls._session_patcher = patch.object(provider_base.requests, 'Session',
+                                            return_value=cls._shared_session)
+        cls._session_patcher.start()
+        
+        cls._provider_template = OpenMeteoProvider(_TEST_SETTINGS)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """クラス共通の後処理"""
+        cls._session_patcher.stop()
+    
+    def setUp(self):
+        """各テストの前処理（ひな形を複製して使う）"""
+        self.mock_get.reset_mock(return_value=True, side_effect=True)
+        # 読み取り専用のため共有する（変更が必要なテストは複製して使う）
+        self.mock_openmeteo_response = _MOCK_OM_RESPONSE
+        self.provider = copy.copy(self._provider_template)
     
-    def test_rain_code_mapping(self):
-        """Test Case 4.3: 雨コードマッピング"""
-        provider = OpenMeteoProvider(self.test_settings)
-        
-        # 雨関連コードが"rain"にマッピングされることを確認
-        rain_codes = [51, 53, 55, 61, 63, 65, 66, 67, 80, 81, 82]
-        for code in rain_codes:
-            self.assertEqual(provider._map_wmo_code_to_icon(code), "rain",
-                           f"Code {code} should map to 'rain'")
-        
-        # 雪コードも"rain"として扱う
-        snow_codes = [71, 73, 75, 77, 85, 86]
-        for code in snow_codes:
-            self.assertEqual(provider._map_wmo_code_to_icon(code), "rain",
-                           f"Snow code {code} should map to 'rain'")
+    # =================================================================
+    # Test Category 1: 基本機能テスト
+    # =================================================================
     
-    def test_thunder_code_mapping(self):
-        """Test Case 4.4: 雷コードマッピング"""
-        provider = OpenMeteoProvider(self.test_settings)
-        
-        # WMOコード95, 96, 99が"thunder"にマッピングされることを確認
-        self.assertEqual(provider._map_wmo_code_to_icon(95), "thunder")
-        self.assertEqual(provider._map_wmo_code_to_icon(96), "thunder")
-        self.assertEqual(provider._map_wmo_code_to_icon(99), "thunder")
+    def test_openmeteo_provider_initialization(self):
+        """Test Case 1.1: OpenMeteoProvider初期化"""
+        # OpenMeteoProviderが正しく初期化されることを確認
+        provider = OpenMeteoProvider(_TEST_SETTINGS)
+        
+        # 基底クラスを継承していることを確認
+        self.assertIsInstance(provider, WeatherProvider)
+        
+        # BASE_URLが定義されていることを確認
+        self.assertEqual(provider.BASE_URL, "https://api.open-meteo.com/v1/forecast")
     
-    def test_fog_code_mapping(self):
-        """Test Case 4.5: 霧コードマッピング"""
-        provider = OpenMeteoProvider(self.test_settings)
+    def test_fetch_method_implementation(self):
+        """Test Case 1.2: fetch()メソッド実装確認"""
+        provider = self.provider
         
-        # WMOコード45, 48が"fog"にマッピングされることを確認
-        self.assertEqual(provider._map_wmo_code_to_icon(45), "fog")
-        self.assertEqual(provider._map_wmo_code_to_icon(48), "fog")
+        # fetch()メソッドが存在し呼び出し可能であることを確認
+        self.assertTrue(hasattr(provider, 'fetch'))
+        self.assertTrue(callable(getattr(provider, 'fetch')))
+        
+        # 戻り値が辞書型であることを確認（モック環境）
+        with patch.object(provider, '_make_request') as mock_request:
+            mock_request.return_value = self.mock_openmeteo_response
+            result = provider.fetch()
+            self.assertIsInstance(result, dict)
     
     # =================================================================
     # Test Category 5: データ取得フローテスト
     # =================================================================
     
-    @patch('src.weather.providers.base.requests.Session.get')
-    def test_complete_fetch_flow(self, mock_get):
+    def test_complete_fetch_flow(self):
         """Test Case 5.1: 完全fetch()フロー"""
         # モックレスポンス設定
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = self.mock_openmeteo_response
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = _StubResponse(self.mock_openmeteo_response)
         
         # fetch()実行
-        provider = OpenMeteoProvider(self.test_settings)
+        provider = self.provider
         result = provider.fetch()
         
         # APIリクエストが正しく行われたか確認
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args
+        self.mock_get.assert_called_once()
+        call_args = self.mock_get.call_args
         
         # URLの確認
         self.assertEqual(call_args[0][0], provider.BASE_URL)
@@ -291,14 +346,12 @@ class TestOpenMeteoProvider(unittest.TestCase):
     # Test Category 6: エラーハンドリングテスト
     # =================================================================
     
-    @patch('src.weather.providers.base.requests.Session.get')
-    def test_network_error_handling(self, mock_get):
+    def test_network_error_handling(self):
         """Test Case 6.1: ネットワークエラー処理"""
         # requests.ConnectionErrorを使用
-        import requests
-        mock_get.side_effect = requests.ConnectionError("Connection failed")
+        self.mock_get.side_effect = requests.ConnectionError("Connection failed")
         
-        provider = OpenMeteoProvider(self.test_settings)
+        provider = self.provider
         
         # NetworkError例外が発生することを確認
         with self.assertRaises(NetworkError) as context:
@@ -306,30 +359,13 @@ class TestOpenMeteoProvider(unittest.TestCase):
         
         self.assertIn("Connection error", str(context.exception))
     
-    def test_invalid_response_handling(self):
-        """Test Case 6.3: 不正レスポンス処理"""
-        provider = OpenMeteoProvider(self.test_settings)
-        
-        # 必須フィールド欠如データ
-        invalid_response = {
-            "latitude": 35.6812,
-            "longitude": 139.7671,
-            # daily フィールドなし
-        }
-        
-        # DataFormatError例外が発生することを確認
-        with self.assertRaises(DataFormatError) as context:
-            provider._parse_openmeteo_response(invalid_response)
-        
-        self.assertIn("Missing required field", str(context.exception))
-    
     # =================================================================
     # Test Category 7: 統合テスト
     # =================================================================
     
     def test_base_class_integration(self):
         """Test Case 7.1: 基底クラス機能統合"""
-        provider = OpenMeteoProvider(self.test_settings)
+        provider = OpenMeteoProvider(_TEST_SETTINGS)
         
         # 設定管理機能の確認
         self.assertEqual(provider.location['latitude'], 35.681236)
@@ -10,7 +10,6 @@ import json
 import os
 import tempfile
 import time
-import shutil
 import unittest
 from unittest.mock import patch, MagicMock, Mock
 from typing import Dict, Any
@@ -18,6 +17,7 @@ import threading
 
 # まだ実装されていないがテスト対象のクラス
 try:
+    from src.weather.cache import weather_cache
     from src.weather.cache.weather_cache import WeatherCache
     from src.weather.cache.cache_key import generate_cache_key
     from src.weather.cache.exceptions import (
@@ -63,48 +63,46 @@ except ImportError:
 class TestWeatherCache(unittest.TestCase):
     """天気キャッシュシステムのテストケース"""
     
+    # テスト用天気データ（全テストで共有するため変更しないこと）
+    test_weather_data = {
+        "updated": 1705123200,
+        "location": {
+            "latitude": 35.681236,
+            "longitude": 139.767125
+        },
+        "forecasts": [
+            {
+                "date": "2025-01-11",
+                "icon": "sunny",
+                "temperature": {"min": 5, "max": 13},
+                "precipitation_probability": 30
+            }
+        ]
+    }
+    
+    def _make_settings(self, **overrides):
+        """テスト設定を生成（weather.cacheの値をキーワード引数で上書き）"""
+        cache_config = {
+            'enabled': True,
+            'directory': self.test_dir,
+            'ttl': 1800,  # 30分
+            'max_size': 1048576,  # 1MB
+            'max_entries': 10,
+            'fallback_on_error': True,
+            'cleanup_interval': 3600
+        }
+        cache_config.update(overrides)
+        return {'weather': {'cache': cache_config}}
+    
     def setUp(self):
         """各テストの前処理"""
-        # テスト用の一時ディレクトリ
-        self.test_dir = tempfile.mkdtemp(prefix="test_cache_")
+        # テスト用の一時ディレクトリ（テスト失敗時も確実に削除される）
+        self.test_dir = self.enterContext(
+            tempfile.TemporaryDirectory(prefix="test_cache_", ignore_cleanup_errors=True)
+        )
         
         # テスト設定
-        self.test_settings = {
-            'weather': {
-                'cache': {
-                    'enabled': True,
-                    'directory': self.test_dir,
-                    'ttl': 1800,  # 30分
-                    'max_size': 1048576,  # 1MB
-                    'max_entries': 10,
-                    'fallback_on_error': True,
-                    'cleanup_interval': 3600
-                }
-            }
-        }
-        
-        # テスト用天気データ
-        self.test_weather_data = {
-            "updated": 1705123200,
-            "location": {
-                "latitude": 35.681236,
-                "longitude": 139.767125
-            },
-            "forecasts": [
-                {
-                    "date": "2025-01-11",
-                    "icon": "sunny",
-                    "temperature": {"min": 5, "max": 13},
-                    "precipitation_probability": 30
-                }
-            ]
-        }
-    
-    def tearDown(self):
-        """各テスト後の後処理"""
-        # テスト用ディレクトリを削除
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+        self.test_settings = self._make_settings()
     
     # =================================================================
     # Test Category 1: 基本機能テスト
@@ -136,6 +134,41 @@ class TestWeatherCache(unittest.TestCase):
         cache_file = os.path.join(self.test_dir, f"{key}.json")
         self.assertTrue(os.path.exists(cache_file))
     
+    def test_cache_set_replaces_file_atomically(self):
+        """上書き保存は一時ファイル経由で置き換えられ、一時ファイルは残らない"""
+        cache = WeatherCache(self.test_settings)
+        key = "atomic_test"
+        cache.set(key, self.test_weather_data)
+        cache_file = os.path.join(self.test_dir, f"{key}.json")
+        original_inode = os.stat(cache_file).st_ino
+
+        # When: 同じキーへ上書き
+        cache.set(key, {"new": "data"})
+
+        # Then: 既存ファイルを書き換えるのではなく別ファイルに置き換わる
+        self.assertNotEqual(os.stat(cache_file).st_ino, original_inode)
+        self.assertEqual([name for name in os.listdir(self.test_dir) if name.endswith('.tmp')], [])
+        with open(cache_file, 'rb') as f:
+            self.assertEqual(json.loads(f.read())['data'], {"new": "data"})
+
+    def test_index_rebuilt_from_existing_files(self):
+        """索引が失われても既存のエントリファイルから復元され、一時ファイルは削除される"""
+        WeatherCache(self.test_settings).set("survivor", self.test_weather_data)
+        for name in os.listdir(self.test_dir):
+            if name.startswith('index.db'):
+                os.unlink(os.path.join(self.test_dir, name))
+        stale_tmp = os.path.join(self.test_dir, ".survivor.abc123.tmp")
+        with open(stale_tmp, 'wb') as f:
+            f.write(b'{"partial')
+
+        # When: 新しいインスタンスで起動
+        cache = WeatherCache(self.test_settings)
+
+        # Then: エントリは索引に戻り、中断された一時ファイルは消える
+        self.assertEqual(cache.get("survivor"), self.test_weather_data)
+        self.assertEqual(cache.invalidate(), 1)
+        self.assertFalse(os.path.exists(stale_tmp))
+
     def test_cache_get_operation(self):
         """Test Case 1.3: キャッシュ取得（get）"""
         cache = WeatherCache(self.test_settings)
@@ -174,10 +207,7 @@ class TestWeatherCache(unittest.TestCase):
     def test_cache_expired_ttl(self):
         """Test Case 2.2: 有効期限切れのキャッシュ"""
         # TTL=1秒の設定
-        short_ttl_settings = self.test_settings.copy()
-        short_ttl_settings['weather']['cache']['ttl'] = 1
-        
-        cache = WeatherCache(short_ttl_settings)
+        cache = WeatherCache(self._make_settings(ttl=1))
         
         # データ保存
         key = "expired_test"
@@ -218,10 +248,7 @@ class TestWeatherCache(unittest.TestCase):
     def test_max_entries_limit(self):
         """Test Case 4.1: エントリ数制限"""
         # max_entries=3の設定
-        limited_settings = self.test_settings.copy()
-        limited_settings['weather']['cache']['max_entries'] = 3
-        
-        cache = WeatherCache(limited_settings)
+        cache = WeatherCache(self._make_settings(max_entries=3))
         
         # 4つのエントリを保存
         for i in range(4):
@@ -238,6 +265,30 @@ class TestWeatherCache(unittest.TestCase):
             data = cache.get(f"entry_{i}")
             self.assertIsNotNone(data)
     
+    def test_max_size_limit(self):
+        """合計サイズ制限（上書き時のサイズ差分も反映）"""
+        cache = WeatherCache(self.test_settings)
+
+        # Given: 2エントリ分の合計サイズ上限
+        cache.set("size_0", self.test_weather_data)
+        entry_size = os.path.getsize(os.path.join(self.test_dir, "size_0.json"))
+        cache.max_size = entry_size * 2 + entry_size // 2
+        cache.set("size_0", self.test_weather_data)  # 上書きでは件数・サイズが増えない
+        time.sleep(0.01)
+        cache.set("size_1", self.test_weather_data)
+        time.sleep(0.01)
+
+        # When: 3つ目を保存
+        cache.set("size_2", self.test_weather_data)
+
+        # Then: 最も古いエントリが削除され、集計値は実際の索引と一致する
+        self.assertIsNone(cache.get("size_0"))
+        self.assertIsNotNone(cache.get("size_1"))
+        self.assertIsNotNone(cache.get("size_2"))
+        stats = cache._index.execute('SELECT entry_count, total_size FROM stats').fetchone()
+        actual = cache._index.execute('SELECT COUNT(*), SUM(size) FROM entries').fetchone()
+        self.assertEqual(stats, actual)
+
     # =================================================================
     # Test Category 5: get_or_fetchテスト
     # =================================================================
@@ -285,6 +336,23 @@ class TestWeatherCache(unittest.TestCase):
         self.assertIsNotNone(cached)
         self.assertEqual(cached, new_data)
     
+    def test_get_or_fetch_falls_back_to_stale_without_disk_read(self):
+        """取得失敗時は期限切れデータをメモリから返す"""
+        cache = WeatherCache(self._make_settings(ttl=0.2))
+        key = "stale_key"
+        cache.get_or_fetch(key, Mock(return_value=self.test_weather_data))
+        time.sleep(0.3)
+
+        # When: 期限切れ後に取得が失敗
+        fetcher = Mock(side_effect=ConnectionError("offline"))
+        with patch.object(cache, '_read_entry', wraps=cache._read_entry) as mock_read:
+            result = cache.get_or_fetch(key, fetcher)
+
+        # Then: 期限切れデータが返され、ファイルは読まれない
+        fetcher.assert_called_once()
+        self.assertEqual(result, self.test_weather_data)
+        mock_read.assert_not_called()
+
     # =================================================================
     # Test Category 6: クリーンアップテスト
     # =================================================================
@@ -292,10 +360,7 @@ class TestWeatherCache(unittest.TestCase):
     def test_cleanup_expired_entries(self):
         """Test Case 6.1: 期限切れエントリ削除"""
         # 短いTTLで設定
-        short_ttl_settings = self.test_settings.copy()
-        short_ttl_settings['weather']['cache']['ttl'] = 1
-        
-        cache = WeatherCache(short_ttl_settings)
+        cache = WeatherCache(self._make_settings(ttl=1))
         
         # 複数エントリ保存
         cache.set("old_1", self.test_weather_data)
@@ -318,6 +383,24 @@ class TestWeatherCache(unittest.TestCase):
         self.assertIsNone(cache.get("old_1"))
         self.assertIsNone(cache.get("old_2"))
     
+    def test_expired_entries_swept_on_write(self):
+        """書き込み回数が閾値に達すると期限切れエントリが自動削除される"""
+        cache = WeatherCache(self.test_settings)
+        cache.ttl = 0.5
+        cache.set("stale", self.test_weather_data)
+        time.sleep(0.6)
+        cache.ttl = 1800
+
+        # Given: 次の書き込みで掃除が走る回数まで書き込み済み
+        cache._writes_since_sweep = WeatherCache.SWEEP_EVERY_WRITES - 1
+
+        # When: 書き込み
+        cache.set("fresh", self.test_weather_data)
+
+        # Then: cleanup()を呼ばなくても期限切れファイルが消える
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, "stale.json")))
+        self.assertIsNotNone(cache.get("fresh"))
+
     def test_invalidate_specific_key(self):
         """Test Case 6.2: 特定キーの無効化"""
         cache = WeatherCache(self.test_settings)
@@ -340,6 +423,94 @@ class TestWeatherCache(unittest.TestCase):
         self.assertIsNotNone(cache.get("keep_1"))
         self.assertIsNotNone(cache.get("keep_2"))
     
+    def test_entry_path_cached_until_removed(self):
+        """エントリファイルのパスはキーごとに保持され、削除時に破棄される"""
+        cache = WeatherCache(self.test_settings)
+        cache.set("path_test", self.test_weather_data)
+
+        # Then: 保存後は同じパス文字列が再利用される
+        path = cache._entry_path("path_test")
+        self.assertIs(cache._entry_path("path_test"), path)
+        self.assertEqual(path, os.path.join(self.test_dir, "path_test.json"))
+
+        # When: 削除・存在しないキーの取得
+        cache.invalidate("path_test")
+        cache.get("missing_key")
+
+        # Then: どちらのパスも保持されない
+        self.assertEqual(cache._entry_paths, {})
+
+    def test_cache_file_is_utf8_json(self):
+        """キャッシュファイルは標準jsonで読めるUTF-8 JSON"""
+        cache = WeatherCache(self.test_settings)
+
+        # Given: 日本語を含むデータ
+        key = "utf8_test"
+        data = dict(self.test_weather_data, name="東京")
+
+        # When: 保存
+        cache.set(key, data)
+
+        # Then: シリアライザに関係なくUTF-8のまま保存され、標準jsonで読める
+        cache_file = os.path.join(self.test_dir, f"{key}.json")
+        with open(cache_file, 'rb') as f:
+            raw = f.read()
+        self.assertIn("東京".encode('utf-8'), raw)
+        self.assertEqual(json.loads(raw)['data'], data)
+        self.assertEqual(cache.get(key), data)
+
+    def test_stdlib_fallback_writes_compact_json(self):
+        """orjsonがない環境でも空白を含まないコンパクトなJSONで保存される"""
+        cache = WeatherCache(self.test_settings)
+        key = "compact_test"
+
+        # Given: 標準jsonによるシリアライズ
+        with patch.object(weather_cache, '_dumps', weather_cache._json_dumps):
+            # When: 保存
+            cache.set(key, self.test_weather_data)
+
+        # Then: 区切りに空白がない
+        with open(os.path.join(self.test_dir, f"{key}.json"), 'rb') as f:
+            raw = f.read()
+        self.assertNotIn(b'": ', raw)
+        self.assertNotIn(b', "', raw)
+        self.assertEqual(json.loads(raw)['data'], self.test_weather_data)
+
+    @unittest.skipUnless(getattr(weather_cache, 'HAS_ORJSON', False), "orjson not installed")
+    def test_large_entry_read_via_mmap(self):
+        """大きなエントリはmmap経由で読み込まれる"""
+        key = "mmap_test"
+        WeatherCache(self.test_settings).set(key, self.test_weather_data)
+        # ホット層を持たない新しいインスタンスでディスクから読む
+        cache = WeatherCache(self.test_settings)
+
+        # Given: 全ファイルがmmap対象になる閾値
+        with patch.object(weather_cache.CacheFiles, 'MMAP_THRESHOLD', 0), \
+                patch.object(weather_cache.mmap, 'mmap', wraps=weather_cache.mmap.mmap) as mock_mmap:
+            # When: 取得
+            data = cache.get(key)
+
+        # Then: mmapで読んだ内容が正しくデコードされる
+        mock_mmap.assert_called_once()
+        self.assertEqual(data, self.test_weather_data)
+
+    def test_repeated_get_served_from_memory(self):
+        """2回目以降の取得はファイルを読まない"""
+        key = "hot_test"
+        WeatherCache(self.test_settings).set(key, self.test_weather_data)
+        cache = WeatherCache(self.test_settings)
+
+        # Given: 初回の取得でディスクから読み込み
+        with patch.object(cache, '_read_entry', wraps=cache._read_entry) as mock_read:
+            cache.get(key)
+
+            # When: 繰り返し取得
+            results = [cache.get(key) for _ in range(5)]
+
+        # Then: ディスク読み込みは初回の1回だけ
+        mock_read.assert_called_once_with(key)
+        self.assertTrue(all(r == self.test_weather_data for r in results))
+
     # =================================================================
     # Test Category 7: エラーハンドリングテスト
     # =================================================================
@@ -410,6 +581,38 @@ class TestWeatherCache(unittest.TestCase):
         self.assertEqual(len(results), 10)
         self.assertTrue(all(results))
     
+    def test_locked_key_does_not_block_other_keys(self):
+        """別キーの書き込み中でも読み取りが待たされない"""
+        WeatherCache(self.test_settings).set("reader_key", self.test_weather_data)
+        cache = WeatherCache(self.test_settings)
+        busy_lock = cache._lock_for("writer_key")
+        self.assertIsNot(busy_lock, cache._lock_for("reader_key"))
+
+        # Given: 別スレッドがwriter_keyのロックを保持したまま
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with busy_lock:
+                held.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        held.wait(5)
+        try:
+            # When: reader_keyをディスクから読む
+            start_time = time.monotonic()
+            data = cache.get("reader_key")
+            elapsed_time = time.monotonic() - start_time
+        finally:
+            release.set()
+            holder.join()
+
+        # Then: 保持スレッドの解放（最大5秒）を待たずに取得できる
+        self.assertEqual(data, self.test_weather_data)
+        self.assertLess(elapsed_time, 1.0)
+
     # =================================================================
     # Test Category 9: パフォーマンステスト
     # =================================================================
@@ -6,6 +6,7 @@ WeatherThreadクラスのテストスイート。
 Priority 1の12個のテストケースを実装。
 """
 
+import os
 import time
 import threading
 import unittest
@@ -62,6 +63,33 @@ except ImportError:
         pass
 
 
+class FetchCounter:
+    """provider.fetchの代替
+    
+    呼び出し回数を数え、指定回数に達するまで待機できる。Mockの呼び出し記録と
+    固定時間のsleepの代わりに、更新が起きた時点でテストを進めるために使う。
+    """
+    
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.count = 0
+        self._condition = threading.Condition()
+    
+    def __call__(self, *args, **kwargs):
+        with self._condition:
+            self.count += 1
+            self._condition.notify_all()
+        if self.error is not None:
+            raise self.error
+        return self.result
+    
+    def wait_for(self, count, timeout=2.0):
+        """呼び出し回数がcountに達するまで待機（達した場合True）"""
+        with self._condition:
+            return self._condition.wait_for(lambda: self.count >= count, timeout)
+
+
 class TestWeatherThread(unittest.TestCase):
     """天気スレッド管理のテストケース"""
     
@@ -69,43 +97,44 @@ class TestWeatherThread(unittest.TestCase):
         """各テストの前処理"""
         # モックプロバイダ
         self.mock_provider = Mock()
-        self.mock_provider.fetch.return_value = {
+        self.fetch_counter = FetchCounter({
             "updated": 1705123200,
             "location": {"latitude": 35.681, "longitude": 139.767},
             "forecasts": [
                 {"date": "2025-01-11", "icon": "sunny", "temperature": {"min": 5, "max": 13}}
             ]
-        }
+        })
+        self.mock_provider.fetch = self.fetch_counter
         # プロバイダに location 属性を追加
         self.mock_provider.location = {"latitude": 35.681, "longitude": 139.767}
         
         # モックキャッシュ
         self.mock_cache = Mock()
         self.mock_cache.set.return_value = True
-        self.mock_cache.get_or_fetch.return_value = self.mock_provider.fetch.return_value
+        self.mock_cache.get_or_fetch.return_value = self.fetch_counter.result
         
         # テスト設定（短い間隔）
-        self.test_settings = {
-            "weather": {
-                "thread": {
-                    "enabled": True,
-                    "update_interval": 0.5,  # 0.5秒（テスト高速化）
-                    "retry_interval": 0.1,   # 0.1秒
-                    "max_retries": 3,
-                    "retry_backoff": 2.0,
-                    "timeout": 5
-                }
-            }
+        self.test_settings = self._make_settings()
+    
+    @staticmethod
+    def _make_settings(**overrides):
+        """テスト設定を生成（weather.threadの値をキーワード引数で上書き）"""
+        thread_config = {
+            "enabled": True,
+            "update_interval": 0.05,  # 0.05秒（テスト高速化）
+            "retry_interval": 0.01,   # 0.01秒
+            "max_retries": 3,
+            "retry_backoff": 2.0,
+            "timeout": 5
         }
+        thread_config.update(overrides)
+        return {"weather": {"thread": thread_config}}
     
-    def tearDown(self):
-        """各テスト後の後処理"""
-        # スレッドが残っていれば停止
-        if hasattr(self, 'thread') and self.thread:
-            try:
-                self.thread.stop(timeout=1)
-            except:
-                pass
+    def _make_thread(self, settings=None):
+        """テスト対象スレッドを作成し、テスト終了時の停止を登録"""
+        thread = WeatherThread(self.mock_provider, self.mock_cache, settings or self.test_settings)
+        self.addCleanup(thread.stop, timeout=1)
+        return thread
     
     # =================================================================
     # Test Category 1: 基本機能テスト
@@ -125,7 +154,7 @@ class TestWeatherThread(unittest.TestCase):
     
     def test_thread_start(self):
         """Test Case 1.2: スレッド開始"""
-        thread = WeatherThread(self.mock_provider, self.mock_cache, self.test_settings)
+        thread = self._make_thread()
         
         # スレッド開始
         result = thread.start()
@@ -145,7 +174,7 @@ class TestWeatherThread(unittest.TestCase):
     
     def test_thread_stop(self):
         """Test Case 1.3: スレッド停止"""
-        thread = WeatherThread(self.mock_provider, self.mock_cache, self.test_settings)
+        thread = self._make_thread()
         
         # スレッド開始
         thread.start()
@@ -170,40 +199,65 @@ class TestWeatherThread(unittest.TestCase):
     
     def test_automatic_update_execution(self):
         """Test Case 2.1: 自動更新実行"""
-        thread = WeatherThread(self.mock_provider, self.mock_cache, self.test_settings)
-        self.thread = thread  # tearDown用
+        thread = self._make_thread()
         
         # スレッド開始
         thread.start()
         
-        # 1.5秒待機（0.5秒間隔なので3回更新されるはず）
-        time.sleep(1.5)
-        
-        # プロバイダのfetch()が複数回呼ばれたことを確認
-        self.assertGreaterEqual(self.mock_provider.fetch.call_count, 2)
+        # プロバイダのfetch()が複数回呼ばれたことを確認（0.05秒間隔）
+        self.assertTrue(self.fetch_counter.wait_for(2))
         
         # スレッド停止
         thread.stop()
     
     def test_data_fetch_and_cache_save(self):
         """Test Case 2.2: データ取得とキャッシュ保存"""
-        thread = WeatherThread(self.mock_provider, self.mock_cache, self.test_settings)
-        self.thread = thread
+        thread = self._make_thread()
         
         # スレッド開始
         thread.start()
         
         # 更新を待つ
-        time.sleep(0.7)
+        self.assertTrue(self.fetch_counter.wait_for(1))
         
-        # プロバイダからデータ取得されたことを確認
-        self.mock_provider.fetch.assert_called()
+        # スレッド停止（未書き込みのデータは停止時に書き切られる）
+        thread.stop()
         
         # キャッシュに保存されたことを確認
         self.mock_cache.set.assert_called()
-        
-        # スレッド停止
+    
+    def test_cache_key_generated_once(self):
+        """キャッシュキーは初回の保存時だけ生成され、以降は同じキーで保存される"""
+        thread = self._make_thread()
+        
+        with patch('src.weather.thread.weather_thread.generate_cache_key',
+                   return_value="mock_35.681_139.767") as mock_generate:
+            # When: 複数回更新
+            thread.start()
+            self.assertTrue(self.fetch_counter.wait_for(3))
+            thread.stop()
+        
+        # Then: キー生成は1回で、全ての保存に同じキーが使われる
+        mock_generate.assert_called_once()
+        keys = {call.args[0] for call in self.mock_cache.set.call_args_list}
+        self.assertEqual(keys, {"mock_35.681_139.767"})
+    
+    def test_cache_write_does_not_block_fetch(self):
+        """キャッシュ書き込みが遅くても取得ループは止まらず、書き込みは最新データにまとめられる"""
+        # Given: 書き込みがブロックされるキャッシュ
+        release = threading.Event()
+        self.mock_cache.set.side_effect = lambda key, data: release.wait(5)
+        thread = self._make_thread()
+        
+        # When: 書き込み完了を待たずに複数回更新
+        thread.start()
+        fetched = self.fetch_counter.wait_for(4)
+        release.set()
         thread.stop()
+        
+        # Then: 取得は進み、溜まった書き込みはキーごとに1回へまとめられている
+        self.assertTrue(fetched)
+        self.assertLess(self.mock_cache.set.call_count, self.fetch_counter.count)
     
     # =================================================================
     # Test Category 3: 状態管理テスト
@@ -211,21 +265,22 @@ class TestWeatherThread(unittest.TestCase):
     
     def test_pause_and_resume(self):
         """Test Case 3.1: 一時停止と再開"""
-        thread = WeatherThread(self.mock_provider, self.mock_cache, self.test_settings)
-        self.thread = thread
+        thread = self._make_thread()
         
         # スレッド開始
         thread.start()
+        self.assertTrue(self.fetch_counter.wait_for(1))
         
         # 一時停止
         thread.pause()
         status = thread.get_status()
         self.assertEqual(status.get('state'), 'PAUSED')
+        time.sleep(0.05)  # 一時停止前に始まった取得の完了を待つ
         
-        # 一時停止中は更新されないことを確認
-        call_count_before = self.mock_provider.fetch.call_count
-        time.sleep(0.7)
-        call_count_after = self.mock_provider.fetch.call_count
+        # 一時停止中は更新されないことを確認（更新間隔の4倍待つ）
+        call_count_before = self.fetch_counter.count
+        time.sleep(0.2)
+        call_count_after = self.fetch_counter.count
         self.assertEqual(call_count_before, call_count_after)
         
         # 再開
@@ -234,12 +289,29 @@ class TestWeatherThread(unittest.TestCase):
         self.assertEqual(status.get('state'), 'RUNNING')
         
         # 再開後は更新されることを確認
-        time.sleep(0.7)
-        self.assertGreater(self.mock_provider.fetch.call_count, call_count_after)
+        self.assertTrue(self.fetch_counter.wait_for(call_count_after + 1))
         
         # スレッド停止
         thread.stop()
     
+    def test_force_update_while_paused_runs_after_resume(self):
+        """一時停止中の強制更新は取得せず、再開直後に実行される"""
+        thread = self._make_thread(self._make_settings(update_interval=3600))
+        thread.start()
+        self.assertTrue(self.fetch_counter.wait_for(1))
+        
+        # Given: 一時停止中に強制更新を要求
+        thread.pause()
+        self.assertTrue(thread.force_update())
+        time.sleep(0.1)
+        self.assertEqual(self.fetch_counter.count, 1)
+        
+        # When: 再開
+        thread.resume()
+        
+        # Then: 更新間隔（1時間）を待たずに取得される
+        self.assertTrue(self.fetch_counter.wait_for(2))
+    
     # =================================================================
     # Test Category 4: エラーハンドリングテスト
     # =================================================================
@@ -247,35 +319,42 @@ class TestWeatherThread(unittest.TestCase):
     def test_network_error_retry(self):
         """Test Case 4.1: ネットワークエラー時の再試行"""
         # エラーを発生させる設定（テスト用に簡略化）
-        self.mock_provider.fetch.side_effect = Exception("Connection failed")
+        self.fetch_counter.error = Exception("Connection failed")
         
-        thread = WeatherThread(self.mock_provider, self.mock_cache, self.test_settings)
-        self.thread = thread
+        thread = self._make_thread()
         
         # スレッド開始
         thread.start()
         
-        # 再試行を待つ（0.1秒間隔で最大3回）
-        time.sleep(0.5)
-        
-        # 複数回試行されたことを確認
-        self.assertGreaterEqual(self.mock_provider.fetch.call_count, 2)
+        # 複数回試行されたことを確認（0.01秒間隔で最大3回）
+        self.assertTrue(self.fetch_counter.wait_for(2))
         
         # スレッド停止
         thread.stop()
     
+    def test_retry_delay_backoff_with_jitter(self):
+        """再試行間隔は指数バックオフ＋ゆらぎで、更新間隔が上限"""
+        thread = WeatherThread(self.mock_provider, self.mock_cache, self.test_settings)
+        jitter = WeatherThread.RETRY_JITTER
+        
+        # retry_interval=0.01, backoff=2.0, update_interval=0.05
+        for retry_count, base in [(1, 0.01), (2, 0.02), (3, 0.04), (4, 0.05), (10, 0.05)]:
+            with self.subTest(retry_count=retry_count):
+                delay = thread._retry_delay(retry_count)
+                self.assertGreaterEqual(delay, base * (1 - jitter) - 1e-9)
+                self.assertLessEqual(delay, base * (1 + jitter) + 1e-9)
+    
     # =================================================================
     # Test Category 5: スレッド安全性テスト
     # =================================================================
     
     def test_concurrent_access(self):
         """Test Case 5.1: 並行アクセス"""
-        thread = WeatherThread(self.mock_provider, self.mock_cache, self.test_settings)
-        self.thread = thread
+        thread = self._make_thread()
         
         # スレッド開始
         thread.start()
-        time.sleep(0.2)  # 初回更新を待つ
+        self.assertTrue(self.fetch_counter.wait_for(1))  # 初回更新を待つ
         
         # 複数スレッドから同時アクセス
         results = []
@@ -315,14 +394,13 @@ class TestWeatherThread(unittest.TestCase):
     
     def test_graceful_shutdown(self):
         """Test Case 6.1: 正常停止"""
-        thread = WeatherThread(self.mock_provider, self.mock_cache, self.test_settings)
-        self.thread = thread
+        thread = self._make_thread()
         
         # スレッド開始
         thread.start()
         
         # 少し動作させる
-        time.sleep(0.3)
+        self.assertTrue(self.fetch_counter.wait_for(2))
         
         # 停止要求
         start_time = time.time()
@@ -338,6 +416,23 @@ class TestWeatherThread(unittest.TestCase):
         # スレッドが停止していることを確認
         self.assertFalse(thread.is_alive())
     
+    def test_stop_during_long_interval(self):
+        """更新間隔が長くても待機中のスレッドが即座に停止する"""
+        # Given: 1時間間隔で、初回更新後に待機中のスレッド
+        thread = self._make_thread(self._make_settings(update_interval=3600))
+        thread.start()
+        self.assertTrue(self.fetch_counter.wait_for(1))
+        
+        # When: 停止要求
+        start_time = time.monotonic()
+        result = thread.stop(timeout=5)
+        stop_time = time.monotonic() - start_time
+        
+        # Then: 更新間隔を待たずに停止する
+        self.assertTrue(result)
+        self.assertLess(stop_time, 0.5)
+        self.assertEqual(self.fetch_counter.count, 1)
+    
     # =================================================================
     # Test Category 7: 通知システムテスト
     # =================================================================
@@ -348,17 +443,15 @@ class TestWeatherThread(unittest.TestCase):
         update_callback = Mock()
         
         # 通知コールバックを設定できる拡張設定
-        settings_with_callback = self.test_settings.copy()
-        settings_with_callback['weather']['thread']['update_callback'] = update_callback
+        settings_with_callback = self._make_settings(update_callback=update_callback)
         
-        thread = WeatherThread(self.mock_provider, self.mock_cache, settings_with_callback)
-        self.thread = thread
+        thread = self._make_thread(settings_with_callback)
         
         # スレッド開始
         thread.start()
         
-        # 更新を待つ
-        time.sleep(0.7)
+        # 更新を待つ（2回目の取得時点で1回目の通知は完了している）
+        self.assertTrue(self.fetch_counter.wait_for(2))
         
         # コールバックが呼ばれたことを確認（実装依存）
         # 実装されていない場合はこのテストはスキップ
@@ -372,38 +465,32 @@ class TestWeatherThread(unittest.TestCase):
     # Test Category 8: パフォーマンステスト
     # =================================================================
     
+    @unittest.skipIf(os.name == 'nt', "resource module is Unix only")
     def test_cpu_usage(self):
         """Test Case 8.1: CPU使用率"""
-        import psutil
-        import os
+        import resource
         
-        # 現在のプロセスを取得
-        process = psutil.Process(os.getpid())
+        def cpu_seconds():
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            return usage.ru_utime + usage.ru_stime
         
-        # スレッド開始前のCPU使用率
-        process.cpu_percent()  # 初回は0を返すので無視
-        time.sleep(0.1)
-        cpu_before = process.cpu_percent()
-        
-        thread = WeatherThread(self.mock_provider, self.mock_cache, self.test_settings)
-        self.thread = thread
+        thread = self._make_thread()
         
         # スレッド開始
         thread.start()
         
-        # 2秒間実行
-        time.sleep(2)
-        
-        # CPU使用率測定
-        cpu_during = process.cpu_percent()
+        # 0.5秒間に消費したプロセスのCPU時間を測定
+        cpu_start = cpu_seconds()
+        wall_start = time.monotonic()
+        time.sleep(0.5)
+        cpu_fraction = (cpu_seconds() - cpu_start) / (time.monotonic() - wall_start)
         
         # スレッド停止
         thread.stop()
         
         # CPU使用率が妥当な範囲内であることを確認
         # （テスト環境では厳密な1%以下は難しいので、10%以下を許容）
-        self.assertLess(cpu_during, 10)
-
+        self.assertLess(cpu_fraction, 0.1)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -11,43 +11,103 @@ import pygame
 from datetime import datetime
 
 # テスト対象のクラス
-from src.renderers.weather_panel_renderer import WeatherPanelRenderer
+from src.renderers.weather_panel_renderer import (
+    WeatherPanelRenderer, _format_forecast_date
+)
+
+
+# テスト用天気データ（全テストで共有するため変更しないこと）
+TEST_WEATHER_DATA = {
+    'updated': 1705123200,
+    'forecasts': [
+        {
+            'date': '2025-01-11',
+            'icon': 'sunny',
+            'temperature': {'min': 5, 'max': 13},
+            'precipitation_probability': 10
+        },
+        {
+            'date': '2025-01-12',
+            'icon': 'cloudy',
+            'temperature': {'min': 7, 'max': 15},
+            'precipitation_probability': 30
+        },
+        {
+            'date': '2025-01-13',
+            'icon': 'rain',
+            'temperature': {'min': 8, 'max': 12},
+            'precipitation_probability': 80
+        }
+    ]
+}
+
+
+class _StubSurface:
+    """フォント描画結果のスタブ（サイズ情報のみ持つ）"""
+    __slots__ = ('w', 'h')
+    
+    def __init__(self, w: int, h: int):
+        self.w = w
+        self.h = h
+    
+    def get_size(self):
+        return (self.w, self.h)
+    
+    def get_width(self):
+        return self.w
+    
+    def get_height(self):
+        return self.h
+    
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect(0, 0, self.w, self.h)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+
+class _StubFont:
+    """描画した文字列を記録するフォントのスタブ"""
+    __slots__ = ('size', 'calls')
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.calls = []
+    
+    def render(self, text, antialias, color):
+        self.calls.append(text)
+        return _StubSurface(len(text) * 10, self.size)
+
+
+class _StubAssets:
+    """サイズごとに同じフォントを返すアセットマネージャーのスタブ"""
+    
+    def __init__(self):
+        self.fonts = {}
+        self.requested = []
+    
+    def get_font(self, name, size):
+        self.requested.append((name, size))
+        return self.fonts.setdefault(size, _StubFont(size))
+
+
+class _FontAssets:
+    """pygame標準フォントを返すアセットマネージャー（実描画の比較用）"""
+    
+    def get_font(self, name, size):
+        return pygame.font.Font(None, size)
 
 
 class TestWeatherPanelRenderer(unittest.TestCase):
     """天気パネルレンダラーのテストケース"""
     
-    def setUp(self):
-        """各テストの前処理"""
-        # pygame初期化（モック）
+    @classmethod
+    def setUpClass(cls):
+        """クラス共通の前処理（pygame初期化と設定は全テストで共有）"""
         pygame.init()
         
-        # モックアセットマネージャー
-        self.mock_asset_manager = Mock()
-        
-        # モックフォント
-        self.mock_font = Mock()
-        self.mock_font.render.return_value = Mock(
-            get_size=Mock(return_value=(100, 20)),
-            get_width=Mock(return_value=100),
-            get_height=Mock(return_value=20),
-            get_rect=Mock(return_value=pygame.Rect(0, 0, 100, 20))
-        )
-        
-        self.mock_small_font = Mock()
-        self.mock_small_font.render.return_value = Mock(
-            get_size=Mock(return_value=(80, 16)),
-            get_width=Mock(return_value=80),
-            get_height=Mock(return_value=16),
-            get_rect=Mock(return_value=pygame.Rect(0, 0, 80, 16))
-        )
-        
-        self.mock_asset_manager.get_font.side_effect = lambda name, size: (
-            self.mock_font if size == 22 else self.mock_small_font
-        )
-        
         # テスト設定
-        self.test_settings = {
+        cls.test_settings = {
             'ui': {
                 'margins': {'x': 24, 'y': 16},
                 'weather_font_px': 22
@@ -61,49 +121,32 @@ class TestWeatherPanelRenderer(unittest.TestCase):
                 }
             }
         }
-        
-        # テスト用天気データ
-        self.test_weather_data = {
-            'updated': 1705123200,
-            'forecasts': [
-                {
-                    'date': '2025-01-11',
-                    'icon': 'sunny',
-                    'temperature': {'min': 5, 'max': 13},
-                    'precipitation_probability': 10
-                },
-                {
-                    'date': '2025-01-12',
-                    'icon': 'cloudy',
-                    'temperature': {'min': 7, 'max': 15},
-                    'precipitation_probability': 30
-                },
-                {
-                    'date': '2025-01-13',
-                    'icon': 'rain',
-                    'temperature': {'min': 8, 'max': 12},
-                    'precipitation_probability': 80
-                }
-            ]
-        }
     
-    def tearDown(self):
-        """各テスト後の後処理"""
+    @classmethod
+    def tearDownClass(cls):
+        """クラス共通の後処理"""
         pygame.quit()
     
+    def setUp(self):
+        """各テストの前処理（描画記録が残るスタブはテストごとに作成）"""
+        # スタブアセットマネージャーとフォント
+        self.assets = _StubAssets()
+        self.font = self.assets.get_font('main', 22)
+        self.small_font = self.assets.get_font('main', int(22 * 0.8))
+    
     # =================================================================
     # Test Category 1: 初期化テスト
     # =================================================================
     
     def test_renderer_initialization(self):
         """Test Case 1.1: レンダラー初期化"""
-        renderer = WeatherPanelRenderer(self.mock_asset_manager, self.test_settings)
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
         
         # インスタンスが作成されることを確認
         self.assertIsNotNone(renderer)
         
         # フォント取得が呼ばれたことを確認
-        self.mock_asset_manager.get_font.assert_any_call('main', 22)
+        self.assertIn(('main', 22), self.assets.requested)
         
         # 設定が正しく読み込まれたことを確認
         self.assertEqual(renderer.margins_x, 24)
@@ -117,7 +160,7 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         # 最小限の設定
         minimal_settings = {}
         
-        renderer = WeatherPanelRenderer(self.mock_asset_manager, minimal_settings)
+        renderer = WeatherPanelRenderer(self.assets, minimal_settings)
         
         # デフォルト値が使用されることを確認
         self.assertEqual(renderer.margins_x, renderer.MARGIN_X)
@@ -130,12 +173,15 @@ class TestWeatherPanelRenderer(unittest.TestCase):
     # Test Category 2: データ更新テスト
     # =================================================================
     
-    def test_update_weather_data(self):
+    @patch('pygame.draw.rect')
+    @patch('pygame.draw.circle')
+    @patch('pygame.Surface')
+    def test_update_weather_data(self, mock_surface_class, mock_circle, mock_rect):
         """Test Case 2.1: 天気データ更新"""
-        renderer = WeatherPanelRenderer(self.mock_asset_manager, self.test_settings)
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
         
         # データ更新
-        renderer.update(self.test_weather_data)
+        renderer.update(TEST_WEATHER_DATA)
         
         # データが保存されたことを確認
         self.assertIsNotNone(renderer._weather_data)
@@ -143,7 +189,7 @@ class TestWeatherPanelRenderer(unittest.TestCase):
     
     def test_update_with_none_data(self):
         """Test Case 2.2: None データでの更新"""
-        renderer = WeatherPanelRenderer(self.mock_asset_manager, self.test_settings)
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
         
         # None で更新
         renderer.update(None)
@@ -169,8 +215,8 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         mock_panel_surface = Mock()
         mock_surface_class.return_value = mock_panel_surface
         
-        renderer = WeatherPanelRenderer(self.mock_asset_manager, self.test_settings)
-        renderer.update(self.test_weather_data)
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
+        renderer.update(TEST_WEATHER_DATA)
         
         # 描画実行
         renderer.render(mock_screen)
@@ -178,12 +224,12 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         # パネル背景が作成されたことを確認
         mock_surface_class.assert_called_with((420, 280), pygame.SRCALPHA)
         
-        # パネルが画面に描画されたことを確認
-        mock_screen.blit.assert_any_call(mock_panel_surface, (24, 304))
+        # 合成済みパネルが画面に1回だけ描画されたことを確認
+        mock_screen.blit.assert_called_once_with(mock_panel_surface, (24, 304))
         
         # フォントレンダリングが呼ばれたことを確認
         # 日付表示（3日分）
-        self.assertGreaterEqual(self.mock_font.render.call_count, 3)
+        self.assertGreaterEqual(len(self.font.calls), 3)
     
     def test_render_without_data(self):
         """Test Case 3.2: データなしの描画"""
@@ -192,7 +238,7 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         mock_screen.get_size.return_value = (1024, 600)
         mock_screen.blit = Mock()
         
-        renderer = WeatherPanelRenderer(self.mock_asset_manager, self.test_settings)
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
         
         # データなしで描画
         renderer.render(mock_screen)
@@ -214,8 +260,8 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         mock_panel_surface = Mock()
         mock_surface_class.return_value = mock_panel_surface
         
-        renderer = WeatherPanelRenderer(self.mock_asset_manager, self.test_settings)
-        renderer.update(self.test_weather_data)
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
+        renderer.update(TEST_WEATHER_DATA)
         
         # 描画実行
         renderer.render(mock_screen)
@@ -227,19 +273,234 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         # 正しい位置に描画されたことを確認
         mock_screen.blit.assert_any_call(mock_panel_surface, (expected_x, expected_y))
     
+    @patch('pygame.draw.rect')
+    @patch('pygame.draw.circle')
+    @patch('pygame.Surface')
+    def test_compose_panel_batches_blits(self, mock_surface_class, mock_circle, mock_rect):
+        """Test Case 3.4: パネルの合成は1回のfblitsにまとめられる"""
+        # Given: fblitsを持つパネルサーフェス
+        mock_panel_surface = Mock()
+        mock_surface_class.return_value = mock_panel_surface
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
+        
+        # When: データ更新（パネルを合成）
+        renderer.update(TEST_WEATHER_DATA)
+        
+        # Then: 最後のバッチ呼び出しでパネル全体が合成される
+        batch = mock_panel_surface.fblits.call_args[0][0]
+        # パネル背景 + 3日分の予報タイル + 更新時刻
+        self.assertEqual(len(batch), 5)
+        self.assertEqual(batch[0], (mock_panel_surface, (0, 0)))
+    
+    @patch('pygame.draw.rect')
+    @patch('pygame.draw.circle')
+    @patch('pygame.Surface')
+    def test_compose_panel_falls_back_to_blits(self, mock_surface_class, mock_circle, mock_rect):
+        """Test Case 3.5: fblitsが無い環境ではblitsを使う"""
+        # Given: fblitsを持たないサーフェス（通常のpygame）
+        mock_panel_surface = Mock(spec=['fill', 'blit', 'blits', 'lock', 'unlock'])
+        mock_surface_class.return_value = mock_panel_surface
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
+        
+        # When: データ更新（パネルを合成）
+        renderer.update(TEST_WEATHER_DATA)
+        
+        # Then: blitsが戻り値なしで呼ばれる
+        mock_panel_surface.blits.assert_called()
+        self.assertEqual(mock_panel_surface.blits.call_args[1], {'doreturn': 0})
+    
+    @patch('pygame.draw.rect')
+    @patch('pygame.draw.circle')
+    @patch('pygame.Surface')
+    def test_render_reuses_cached_surfaces(self, mock_surface_class, mock_circle, mock_rect):
+        """Test Case 3.6: 2回目以降の描画では予報とパネル背景を再描画しない"""
+        # Given: データ更新後に1回描画済み
+        mock_screen = Mock()
+        mock_screen.get_size.return_value = (1024, 600)
+        
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
+        renderer.update(TEST_WEATHER_DATA)
+        renderer.render(mock_screen)
+        font_calls = len(self.font.calls)
+        surface_calls = mock_surface_class.call_count
+        
+        # When: 同じデータで繰り返し描画
+        for _ in range(5):
+            renderer.render(mock_screen)
+        
+        # Then: 予報の文字やサーフェスは作り直されない
+        self.assertEqual(len(self.font.calls), font_calls)
+        self.assertEqual(mock_surface_class.call_count, surface_calls)
+    
+    @patch('pygame.draw.rect')
+    @patch('pygame.draw.circle')
+    @patch('pygame.Surface')
+    def test_update_rebuilds_only_changed_forecasts(self, mock_surface_class, mock_circle, mock_rect):
+        """Test Case 3.7: 更新時は内容が変わった予報タイルだけを作り直す"""
+        # Given: 3日分のタイルを作成済み
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
+        renderer.update(TEST_WEATHER_DATA)
+        self.assertEqual(len(renderer._forecast_cache), 3)
+        surface_calls = mock_surface_class.call_count
+        
+        # When: 1日分の降水確率だけが変わったデータで更新
+        changed = {
+            'updated': TEST_WEATHER_DATA['updated'],
+            'forecasts': [dict(f) for f in TEST_WEATHER_DATA['forecasts']]
+        }
+        changed['forecasts'][2]['precipitation_probability'] = 90
+        renderer.update(changed)
+        
+        # Then: 新しいタイル1枚と合成パネルだけが作られ、古いタイルは破棄される
+        self.assertEqual(mock_surface_class.call_count, surface_calls + 2)
+        self.assertEqual(len(renderer._forecast_cache), 3)
+        keys = [key[4] for key in renderer._forecast_cache]
+        self.assertIn(90, keys)
+        self.assertNotIn(80, keys)
+    
+    @patch('pygame.draw.rect')
+    @patch('pygame.draw.circle')
+    @patch('pygame.Surface')
+    def test_render_follows_screen_size_change(self, mock_surface_class, mock_circle, mock_rect):
+        """Test Case 3.8: 画面サイズが変わるとパネル位置を再計算する"""
+        # Given: 1024x600で描画済み
+        mock_panel_surface = Mock()
+        mock_surface_class.return_value = mock_panel_surface
+        mock_screen = Mock()
+        mock_screen.get_size.return_value = (1024, 600)
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
+        renderer.update(TEST_WEATHER_DATA)
+        renderer.render(mock_screen)
+        
+        # When: 画面の高さが変わる
+        mock_screen.get_size.return_value = (800, 480)
+        renderer.render(mock_screen)
+        
+        # Then: 新しい左下位置に描画される
+        mock_screen.blit.assert_called_with(mock_panel_surface, (24, 480 - 16 - 280))
+    
+    def test_panel_background_drawn_under_single_lock(self):
+        """Test Case 3.9: パネル背景は1回のロック内で描画し、解除して返す"""
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
+        
+        with patch('pygame.Surface') as mock_surface_class:
+            mock_background = Mock()
+            mock_surface_class.return_value = mock_background
+            with patch('pygame.draw.circle'), patch('pygame.draw.rect'):
+                renderer._render_panel_background()
+        
+        # ロック/解除はそれぞれ1回
+        mock_background.lock.assert_called_once()
+        mock_background.unlock.assert_called_once()
+        
+        # 実サーフェスでもロックが残らず、そのままblitできる
+        background = renderer._render_panel_background()
+        self.assertFalse(background.get_locked())
+        self.assertEqual(tuple(background.get_at((210, 140))), (30, 30, 40, 255))
+    
+    @patch('pygame.draw.rect')
+    @patch('pygame.draw.circle')
+    @patch('pygame.Surface')
+    def test_cached_surfaces_converted_for_display(self, mock_surface_class, mock_circle, mock_rect):
+        """Test Case 3.10: ディスプレイがある場合はキャッシュを表示形式に変換して保持"""
+        # Given: ディスプレイ初期化済み
+        mock_panel_surface = Mock()
+        converted = Mock()
+        mock_panel_surface.convert_alpha.return_value = converted
+        mock_surface_class.return_value = mock_panel_surface
+        mock_screen = Mock()
+        mock_screen.get_size.return_value = (1024, 600)
+        
+        with patch('pygame.display.get_surface', return_value=mock_screen):
+            renderer = WeatherPanelRenderer(self.assets, self.test_settings)
+            
+            # When: データ更新後に繰り返し描画
+            renderer.update(TEST_WEATHER_DATA)
+            convert_calls = mock_panel_surface.convert_alpha.call_count
+            renderer.render(mock_screen)
+            renderer.render(mock_screen)
+        
+        # Then: アイコン・タイル・背景・合成パネルは変換済みのものを保持
+        self.assertIs(renderer._composed_panel, converted)
+        self.assertIs(renderer._panel_background, converted)
+        self.assertTrue(all(icon is converted for icon in renderer._icon_cache.values()))
+        self.assertTrue(all(tile is converted for tile in renderer._forecast_cache.values()))
+        
+        # 描画時には変換しない
+        self.assertEqual(mock_panel_surface.convert_alpha.call_count, convert_calls)
+        mock_screen.blit.assert_called_with(converted, (24, 304))
+    
+    def _draw_panel_directly(self, renderer, screen, panel_x, panel_y):
+        """合成前と同じく、背景・文字・アイコンを画面へ直接描画する（比較用）"""
+        white = (255, 255, 255)
+        screen.blit(renderer._render_panel_background(), (panel_x, panel_y))
+        
+        for i, forecast in enumerate(TEST_WEATHER_DATA['forecasts']):
+            day_x = panel_x + 20 + i * 130
+            day_y = panel_y + 20
+            icon_y = day_y + 40
+            screen.blit(renderer.font.render(_format_forecast_date(forecast['date']), True, white),
+                        (day_x, day_y))
+            
+            center = (day_x + 20 + 30, icon_y + 30)
+            pygame.draw.circle(screen, renderer.ICON_COLORS[forecast['icon']], center, 30)
+            symbol = renderer.font.render(renderer.ICON_SYMBOLS[forecast['icon']], True, white)
+            screen.blit(symbol, symbol.get_rect(center=center))
+            
+            temp = forecast['temperature']
+            screen.blit(renderer.font.render(f"{temp['min']}°/{temp['max']}°", True, white),
+                        (day_x, icon_y + 80))
+            rain_text = f"☔ {forecast['precipitation_probability']}%"
+            screen.blit(renderer.small_font.render(rain_text, True, (150, 200, 255)),
+                        (day_x, icon_y + 110))
+        
+        update_time = datetime.fromtimestamp(TEST_WEATHER_DATA['updated'])
+        time_surface = renderer.small_font.render(
+            f"更新: {update_time.strftime('%H:%M')}", True, (150, 150, 150))
+        screen.blit(time_surface, (panel_x + 420 - 20 - time_surface.get_width(),
+                                   panel_y + 280 - 20 - time_surface.get_height()))
+    
+    def test_composed_panel_matches_direct_drawing(self):
+        """Test Case 3.11: 合成したパネルの描画結果は画面への直接描画と一致する"""
+        # Given: 実フォント・実サーフェスのレンダラーと、同じ背景色の画面2枚
+        renderer = WeatherPanelRenderer(_FontAssets(), self.test_settings)
+        renderer.update(TEST_WEATHER_DATA)
+        composed_screen = pygame.Surface((1024, 600))
+        direct_screen = pygame.Surface((1024, 600))
+        composed_screen.fill((200, 220, 240))
+        direct_screen.fill((200, 220, 240))
+        
+        # When: 合成済みパネルの描画と、直接描画
+        renderer.render(composed_screen)
+        self._draw_panel_directly(renderer, direct_screen, 24, 304)
+        
+        # Then: 背景・日付・アイコン・気温・降水確率・更新時刻の位置で一致する
+        for pos in [(24, 304), (30, 310), (300, 570), (44, 324), (50, 330),
+                    (94, 394), (224, 394), (354, 394), (60, 448), (60, 480), (380, 560)]:
+            with self.subTest(pos=pos):
+                self.assertEqual(composed_screen.get_at(pos), direct_screen.get_at(pos))
+        self.assertEqual(tuple(composed_screen.get_at((300, 570))), (30, 30, 40, 255))
+        self.assertEqual(tuple(composed_screen.get_at((94, 394)))[:3], (255, 200, 0))
+        
+        # パネル全体でも一致する（文字のアンチエイリアス部分を含む）
+        panel_rect = pygame.Rect(24, 304, 420, 280)
+        self.assertEqual(
+            pygame.image.tobytes(composed_screen.subsurface(panel_rect), 'RGB'),
+            pygame.image.tobytes(direct_screen.subsurface(panel_rect), 'RGB')
+        )
+    
     # =================================================================
     # Test Category 4: 天気アイコン描画テスト
     # =================================================================
     
-    @patch('pygame.draw.circle')
-    def test_weather_icon_rendering(self, mock_circle):
+    def test_weather_icon_rendering(self):
         """Test Case 4.1: 天気アイコン描画"""
         # モックスクリーン
         mock_screen = Mock()
         mock_screen.get_size.return_value = (1024, 600)
         mock_screen.blit = Mock()
         
-        renderer = WeatherPanelRenderer(self.mock_asset_manager, self.test_settings)
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
         
         # 各アイコンタイプのテスト
         icon_tests = [
@@ -252,26 +513,53 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         
         for icon_name, expected_color in icon_tests:
             with self.subTest(icon=icon_name):
-                # アイコン描画
-                renderer._draw_weather_icon(mock_screen, icon_name, 100, 100)
+                # 初期化時にアイコンが描画済みであることを確認
+                icon = renderer._icon_cache[icon_name]
+                self.assertEqual(icon.get_size(), (60, 60))
+                self.assertEqual(tuple(icon.get_at((30, 30)))[:3], expected_color)
                 
-                # 円が描画されたことを確認
-                mock_circle.assert_called_with(
-                    mock_screen, expected_color, (130, 130), 30
-                )
+                # アイコン描画はキャッシュしたサーフェスのblitになる
+                renderer._draw_weather_icon(mock_screen, icon_name, 100, 100)
+                mock_screen.blit.assert_called_with(icon, (100, 100))
+    
+    @patch('pygame.draw.circle')
+    def test_weather_icon_is_drawn_once(self, mock_circle):
+        """Test Case 4.2: アイコンは繰り返し描画しても作り直さない"""
+        # Given: 初期化済みのレンダラー
+        mock_screen = Mock()
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
+        circle_calls = mock_circle.call_count
+        
+        # When: 既知のアイコンを繰り返し描画
+        for _ in range(3):
+            renderer._draw_weather_icon(mock_screen, 'rain', 0, 0)
+        
+        # Then: 円の描画は発生しない
+        self.assertEqual(mock_circle.call_count, circle_calls)
+        
+        # When: 未知のアイコンを描画
+        renderer._draw_weather_icon(mock_screen, 'snow', 0, 0)
+        
+        # Then: グレーのアイコンを作成してキャッシュする
+        mock_circle.assert_called_with(
+            renderer._icon_cache['snow'], (150, 150, 150), (30, 30), 30
+        )
     
     # =================================================================
     # Test Category 5: 日付フォーマットテスト
     # =================================================================
     
+    @patch('pygame.Surface')
     @patch('pygame.draw.circle')
-    def test_forecast_date_formatting(self, mock_circle):
+    def test_forecast_date_formatting(self, mock_circle, mock_surface_class):
         """Test Case 5.1: 予報日付のフォーマット"""
         # モックスクリーン
         mock_screen = Mock()
         mock_screen.get_size.return_value = (1024, 600)
         
-        renderer = WeatherPanelRenderer(self.mock_asset_manager, self.test_settings)
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
+        # 初期化時のアイコンシンボル描画は対象外
+        self.font.calls.clear()
         
         # 単一予報の描画
         forecast = {
@@ -285,9 +573,17 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         
         # 日付が正しくフォーマットされたことを確認
         # "01/11(土)" のような形式になるはず
-        calls = self.mock_font.render.call_args_list
-        date_call = calls[0]  # 最初の呼び出しが日付
-        self.assertIn('01/11', date_call[0][0])
+        date_text = self.font.calls[0]  # 最初の呼び出しが日付
+        self.assertIn('01/11', date_text)
+    
+    def test_format_forecast_date(self):
+        """Test Case 5.2: 日付整形関数"""
+        # 曜日付きの月日に整形される
+        self.assertEqual(_format_forecast_date('2025-01-11'), '01/11(土)')
+        self.assertEqual(_format_forecast_date('2025-01-13'), '01/13(月)')
+        
+        # 解析できない場合は先頭5文字
+        self.assertEqual(_format_forecast_date('01-11 extra'), '01-11')
     
     # =================================================================
     # Test Category 6: 更新時刻表示テスト
@@ -298,7 +594,7 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         # モックスクリーン
         mock_screen = Mock()
         
-        renderer = WeatherPanelRenderer(self.mock_asset_manager, self.test_settings)
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
         
         # 更新時刻付きデータ
         data_with_time = {
@@ -310,23 +606,50 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         renderer._draw_update_time(mock_screen, 0, 0)
         
         # 更新時刻が表示されたことを確認
-        calls = self.mock_small_font.render.call_args_list
+        calls = self.small_font.calls
         self.assertGreater(len(calls), 0)
         
         # 時刻フォーマットが含まれることを確認
-        time_text = calls[0][0][0]
+        time_text = calls[0]
         self.assertIn('更新:', time_text)
     
+    def test_update_time_surface_is_cached(self):
+        """Test Case 6.2: 同じ更新時刻の文字列は再描画しない"""
+        # Given: 更新時刻を1回描画済み
+        mock_screen = Mock()
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
+        renderer._weather_data = {'updated': 1705123200, 'forecasts': []}
+        renderer._draw_update_time(mock_screen, 0, 0)
+        
+        # When: 同じ分の時刻で繰り返し描画
+        renderer._weather_data = {'updated': 1705123200 + 30, 'forecasts': []}
+        for _ in range(3):
+            renderer._draw_update_time(mock_screen, 0, 0)
+        
+        # Then: フォント描画は最初の1回のみ
+        self.assertEqual(len(self.small_font.calls), 1)
+        self.assertEqual(mock_screen.blit.call_count, 4)
+        
+        # When: 分が変わる
+        renderer._weather_data = {'updated': 1705123200 + 60, 'forecasts': []}
+        renderer._draw_update_time(mock_screen, 0, 0)
+        
+        # Then: 新しい文字列で描画し直す
+        self.assertEqual(len(self.small_font.calls), 2)
+    
     # =================================================================
     # Test Category 7: クリーンアップテスト
     # =================================================================
     
-    def test_cleanup(self):
+    @patch('pygame.draw.rect')
+    @patch('pygame.draw.circle')
+    @patch('pygame.Surface')
+    def test_cleanup(self, mock_surface_class, mock_circle, mock_rect):
         """Test Case 7.1: リソースクリーンアップ"""
-        renderer = WeatherPanelRenderer(self.mock_asset_manager, self.test_settings)
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
         
         # データを設定
-        renderer.update(self.test_weather_data)
+        renderer.update(TEST_WEATHER_DATA)
         renderer._icon_cache['test'] = Mock()
         
         # クリーンアップ実行
@@ -335,6 +658,7 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         # リソースがクリアされたことを確認
         self.assertIsNone(renderer._weather_data)
         self.assertEqual(len(renderer._icon_cache), 0)
+        self.assertEqual(len(renderer._forecast_cache), 0)
     
     # =================================================================
     # Test Category 8: 境界値テスト
@@ -354,7 +678,7 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         mock_screen.get_size.return_value = (1024, 600)
         mock_screen.blit = Mock()
         
-        renderer = WeatherPanelRenderer(self.mock_asset_manager, self.test_settings)
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
         
         # 5日分のデータ（3日分のみ表示されるはず）
         many_forecasts = {
@@ -375,10 +699,7 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         
         # 最大3日分のみ描画されることを確認
         # 日付表示は3回のみ
-        date_render_calls = [
-            call for call in self.mock_font.render.call_args_list
-            if '01/' in call[0][0]
-        ]
+        date_render_calls = [text for text in self.font.calls if '01/' in text]
         self.assertLessEqual(len(date_render_calls), 3)
     
     @patch('pygame.draw.rect')
@@ -394,7 +715,7 @@ class TestWeatherPanelRenderer(unittest.TestCase):
         mock_screen = Mock()
         mock_screen.get_size.return_value = (1024, 600)
         
-        renderer = WeatherPanelRenderer(self.mock_asset_manager, self.test_settings)
+        renderer = WeatherPanelRenderer(self.assets, self.test_settings)
         
         # 一部フィールドが欠けているデータ
         incomplete_data = {
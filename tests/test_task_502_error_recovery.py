@@ -179,6 +179,16 @@ class TestNetworkRecoveryHandler(unittest.TestCase):
         
         # 実装された期待値
         self.assertEqual(delays, [1.0, 2.0, 4.0, 8.0])
+    
+    def test_retry_delay_beyond_precomputed_range(self):
+        """Test 2.3: 事前計算範囲外の再試行遅延"""
+        handler = NetworkRecoveryHandler(max_retries=2, backoff_factor=2.0,
+                                         initial_delay=1.0, max_delay=10.0)
+        
+        # 範囲内は事前計算した値、範囲外はその場で計算し最大遅延で頭打ち
+        self.assertEqual(handler.get_retry_delay(2), 4.0)
+        self.assertEqual(handler.get_retry_delay(3), 8.0)
+        self.assertEqual(handler.get_retry_delay(10), 10.0)
 
 
 class TestFileSystemRecoveryHandler(unittest.TestCase):